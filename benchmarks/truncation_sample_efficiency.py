@@ -0,0 +1,120 @@
+"""
+Compares the sample efficiency of treating the step limit as a terminal state against reporting
+it as truncation.
+
+Trains PPO and RecurrentPPO on the default config in two modes: "terminate" (the step limit ends
+the episode and pays the remaining score as a bonus, the original behavior) and "truncate"
+(`truncate_at_max_steps` with `time_limit_reward: "none"`, so SB3 bootstraps from the last state).
+Every `--eval-every` timesteps the policy is evaluated on the unchanged default config, so both
+modes are scored on the same metric: the droid score at the end of an episode.
+
+Run from the project root:
+
+    python benchmarks/truncation_sample_efficiency.py --timesteps 100000 --seeds 3
+"""
+
+from syn_grid.config.config_manager import ConfigManager
+from syn_grid.config.models import FullConf, ObsConfig
+from syn_grid.config.overrides import update_model
+from syn_grid.gymnasium.environment import SYNGridEnv
+from syn_grid.gymnasium.env_factory import make_fast
+
+import argparse
+import numpy as np
+from gymnasium import spaces
+from stable_baselines3 import PPO
+from stable_baselines3.common.base_class import BaseAlgorithm
+from stable_baselines3.common.vec_env import DummyVecEnv
+from sb3_contrib import RecurrentPPO
+
+MODES: dict[str, dict] = {
+    "terminate": {"truncate_at_max_steps": False, "time_limit_reward": "score"},
+    "truncate": {"truncate_at_max_steps": True, "time_limit_reward": "none"},
+}
+
+
+def evaluate(model: BaseAlgorithm, env: SYNGridEnv, episodes: int, seed: int) -> float:
+    """Return the mean final droid score over `episodes` deterministic episodes."""
+
+    scores = []
+    for episode in range(episodes):
+        obs, _ = env.reset(seed=seed + episode)
+        state, episode_start, done = None, np.ones(1, bool), False
+
+        while not done:
+            action, state = model.predict(
+                obs, state=state, episode_start=episode_start, deterministic=True
+            )
+            obs, _, terminated, truncated, _ = env.step(int(action))
+            episode_start[:] = False
+            done = terminated or truncated
+
+        scores.append(env.world.DROID.score)
+
+    return float(np.mean(scores))
+
+
+def run(
+    alg: type[BaseAlgorithm],
+    policy: str,
+    conf: FullConf,
+    obs_conf: ObsConfig,
+    args: argparse.Namespace,
+    seed: int,
+) -> list[float]:
+    """Train one model and return its evaluation score after every `--eval-every` timesteps."""
+
+    train_env = DummyVecEnv(
+        [lambda: make_fast(conf.world, obs_conf) for _ in range(args.num_envs)]
+    )
+    eval_env = make_fast(conf.world, conf.obs)
+
+    model = alg(policy, train_env, seed=seed, verbose=0)
+    curve = []
+    for _ in range(args.timesteps // args.eval_every):
+        model.learn(args.eval_every, reset_num_timesteps=False)
+        curve.append(evaluate(model, eval_env, args.eval_episodes, 10_000 + seed))
+
+    train_env.close()
+    return curve
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--timesteps", type=int, default=100_000)
+    parser.add_argument("--eval-every", type=int, default=10_000)
+    parser.add_argument("--eval-episodes", type=int, default=20)
+    parser.add_argument("--num-envs", type=int, default=4)
+    parser.add_argument("--seeds", type=int, default=3)
+    args = parser.parse_args()
+
+    conf = ConfigManager("configs.yaml").load_config(FullConf)
+    prefix = (
+        "MultiInput"
+        if isinstance(make_fast(conf.world, conf.obs).observation_space, spaces.Dict)
+        else "Mlp"
+    )
+    algorithms = {
+        "PPO": (PPO, f"{prefix}Policy"),
+        "RecurrentPPO": (RecurrentPPO, f"{prefix}LstmPolicy"),
+    }
+
+    checkpoints = range(args.eval_every, args.timesteps + 1, args.eval_every)
+    print(f"{'alg':<14}{'mode':<11}" + "".join(f"{t:>10}" for t in checkpoints))
+
+    for name, (alg, policy) in algorithms.items():
+        for mode, overrides in MODES.items():
+            obs_conf = update_model(conf.obs, {"observation_handler": overrides})
+            curves = [
+                run(alg, policy, conf, obs_conf, args, seed)
+                for seed in range(args.seeds)
+            ]
+            mean_curve = np.mean(curves, axis=0)
+            print(
+                f"{name:<14}{mode:<11}"
+                + "".join(f"{score:>10.2f}" for score in mean_curve)
+            )
+
+
+if __name__ == "__main__":
+    main()
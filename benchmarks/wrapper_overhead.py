@@ -0,0 +1,93 @@
+"""
+Measures how much of a SYNGrid step is spent in wrapper layers.
+
+Compares the env created through `gym.make` (passive env checker + order enforcing) against the
+bare env from `make_fast`, with and without opt-in wrappers, and the batched vector env against
+Gymnasium's `SyncVectorEnv` over `gym.make` envs.
+
+Run from the project root:
+
+    python benchmarks/wrapper_overhead.py --steps 20000 --num-envs 8
+"""
+
+from syn_grid.config.config_manager import ConfigManager
+from syn_grid.config.models import FullConf
+from syn_grid.gymnasium.env_factory import make, make_fast, register_env
+
+import argparse
+import time
+import numpy as np
+import gymnasium as gym
+from gymnasium.wrappers import OrderEnforcing
+
+
+def time_env(env, steps: int, seed: int = 0) -> float:
+    """Return the mean wall time of one step in microseconds, resets included."""
+
+    rng = np.random.default_rng(seed)
+    actions = rng.integers(env.action_space.n, size=steps)
+    env.reset(seed=seed)
+
+    start = time.perf_counter()
+    for action in actions:
+        _, _, terminated, truncated, _ = env.step(int(action))
+        if terminated or truncated:
+            env.reset()
+    elapsed = time.perf_counter() - start
+
+    env.close()
+    return elapsed / steps * 1e6
+
+
+def time_vector_env(env, steps: int, seed: int = 0) -> float:
+    """Return the mean wall time of one sub-env step in microseconds, autoresets included."""
+
+    rng = np.random.default_rng(seed)
+    actions = rng.integers(env.single_action_space.n, size=(steps, env.num_envs))
+    env.reset(seed=seed)
+
+    start = time.perf_counter()
+    for batch in actions:
+        env.step(batch)
+    elapsed = time.perf_counter() - start
+
+    env.close()
+    return elapsed / (steps * env.num_envs) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--steps", type=int, default=20_000)
+    parser.add_argument("--num-envs", type=int, default=8)
+    args = parser.parse_args()
+
+    conf = ConfigManager("configs.yaml").load_config(FullConf)
+    register_env()
+
+    results = {
+        "gym.make": time_env(make(None, conf.world, conf.obs), args.steps),
+        "make_fast": time_env(make_fast(conf.world, conf.obs), args.steps),
+        "make_fast + OrderEnforcing": time_env(
+            make_fast(conf.world, conf.obs, wrappers=[OrderEnforcing]), args.steps
+        ),
+        f"SyncVectorEnv(gym.make) x{args.num_envs}": time_vector_env(
+            gym.vector.SyncVectorEnv(
+                [lambda: make(None, conf.world, conf.obs)] * args.num_envs,
+                autoreset_mode=gym.vector.AutoresetMode.SAME_STEP,
+            ),
+            args.steps // args.num_envs,
+        ),
+        f"make_fast(num_envs={args.num_envs})": time_vector_env(
+            make_fast(conf.world, conf.obs, num_envs=args.num_envs),
+            args.steps // args.num_envs,
+        ),
+    }
+
+    baseline = results["make_fast"]
+    print(f"{'env':<36}{'us/step':>10}{'vs bare':>10}")
+    for name, micros in results.items():
+        print(f"{name:<36}{micros:>10.2f}{micros / baseline:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
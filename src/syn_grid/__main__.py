@@ -1,7 +1,6 @@
 from syn_grid.config.config_manager import ConfigManager
 from syn_grid.config.models import ExperimentConfig, FullConf
 from syn_grid.utils.args_utils import parse_args, update_agent_conf_from_args
-from syn_grid.runners.human_runner.human_runner import HumanRunner
 from syn_grid.runners.agent_runners.agent_registry import ALGORITHMS
 from syn_grid.gymnasium.env_factory import register_env
 
@@ -31,11 +30,16 @@ def main():
     if len(sys.argv) > 1:
         args = parse_args()
         update_agent_conf_from_args(args, agent_conf)
+        # The overrides are set without validation, check the combined config again
+        FullConf.model_validate(full_conf.model_dump())
 
     # Initialize the appropriate runner:
     # - HumanRunner if manual control is enabled
     # - BaseAgentRunner otherwise
     if agent_conf.global_agent_conf.human_control:
+        # Imported here so headless runs never load pygame
+        from syn_grid.runners.human_runner.human_runner import HumanRunner
+
         runner = HumanRunner(run_conf, obs_conf.observation_handler.max_steps)
         runner.human_player_loop()
     else:
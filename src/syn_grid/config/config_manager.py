@@ -1,13 +1,26 @@
-from syn_grid.utils.paths_util import get_package_path, get_project_path
-
+from syn_grid.utils.paths_util import (
+    get_cache_path,
+    get_package_path,
+    get_project_path,
+)
+
+import os
+import sys
 import yaml
+import pickle
+import hashlib
+import tempfile
+import pydantic
 from pathlib import Path
-from typing import Type, TypeVar
+from typing import Any, Type, TypeVar
 from pydantic import BaseModel
 import datetime
 
 T = TypeVar("T", bound=BaseModel)
 
+# Validated configs of this process, pickled so every load hands out an independent instance
+_VALIDATED_CONFIGS: dict[str, bytes] = {}
+
 
 class ConfigManager:
     # ================= #
@@ -17,9 +30,13 @@ class ConfigManager:
     def __init__(self, config_file: str):
         self.yaml_path = Path(get_package_path("config", config_file))
         self.save_conf_path = Path(get_project_path("output", "saved_configs"))
+        self.cache_dir = Path(get_cache_path("configs"))
         if not self.yaml_path.exists():
             raise FileNotFoundError(f"Config file not found: {self.yaml_path}")
 
+        self._content: bytes = self.yaml_path.read_bytes()
+        self._raw: dict[str, Any] | None = None
+
     # ================= #
     #       API        #
     # ================= #
@@ -28,8 +45,9 @@ class ConfigManager:
         """
         Load a YAML file into a Pydantic model instance.
 
-        This method reads the YAML file specified in `self.yaml_path` and
-        parses it into an instance of the given Pydantic model class.
+        The file is read and parsed at most once per manager. Validated models are cached by the
+        hash of the file and model definitions, in memory and pickled in the user's cache
+        directory, so unchanged configs skip both YAML parsing and validation on later runs.
 
         Args:
             model_class: A subclass of `BaseModel` that the YAML data will be parsed into.
@@ -37,10 +55,32 @@ class ConfigManager:
             An instance of `model_class` populated with data from the YAML file.
         """
 
-        with self.yaml_path.open("r") as f:
-            raw = yaml.safe_load(f)
+        cache_key = self._get_cache_key(model_class)
+
+        cached = _VALIDATED_CONFIGS.get(cache_key)
+        if cached is None:
+            cached = self._read_cache_file(cache_key)
+        if cached is not None:
+            try:
+                config = pickle.loads(cached)
+            except Exception:
+                # A truncated, corrupt or stale cache file, whatever it fails with, is dropped and
+                # the config parsed again
+                self._remove_cache_file(cache_key)
+            else:
+                _VALIDATED_CONFIGS[cache_key] = cached
+                return config
+
+        if self._raw is None:
+            self._raw = yaml.safe_load(self._content)
+
+        config = model_class(**self._raw)
 
-        return model_class(**raw)
+        pickled = pickle.dumps(config, protocol=pickle.HIGHEST_PROTOCOL)
+        _VALIDATED_CONFIGS[cache_key] = pickled
+        self._write_cache_file(cache_key, pickled)
+
+        return config
 
     def save_snapshot(self, config: BaseModel, save_conf_id: str) -> None:
         """
@@ -58,3 +98,52 @@ class ConfigManager:
 
         with snapshot_file.open("w") as f:
             yaml.safe_dump(config.model_dump(), f)
+
+    # ================= #
+    #      Helpers      #
+    # ================= #
+
+    # === API === #
+
+    def _get_cache_key(self, model_class: Type[BaseModel]) -> str:
+        # The model definitions are part of the key so a schema change never loads a stale config
+        digest = hashlib.sha256(self._content)
+        digest.update(Path(sys.modules[model_class.__module__].__file__).read_bytes())  # type: ignore[arg-type]
+        digest.update(f"{model_class.__module__}.{model_class.__qualname__}".encode())
+        digest.update(pydantic.VERSION.encode())
+
+        return f"{self.yaml_path.stem}-{digest.hexdigest()[:32]}"
+
+    def _read_cache_file(self, cache_key: str) -> bytes | None:
+        try:
+            return (self.cache_dir / f"{cache_key}.pickle").read_bytes()
+        except OSError:
+            return None
+
+    def _write_cache_file(self, cache_key: str, pickled: bytes) -> None:
+        # Caching is best effort, e.g. the cache directory may not be writable. The file is written
+        # under a temporary name and renamed, so concurrent runs never see a partial pickle.
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, temp_name = tempfile.mkstemp(
+                dir=self.cache_dir, prefix=f"{cache_key}-", suffix=".tmp"
+            )
+        except OSError:
+            return
+
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(pickled)
+            os.replace(temp_name, self.cache_dir / f"{cache_key}.pickle")
+        except OSError:
+            self._remove_file(Path(temp_name))
+
+    def _remove_cache_file(self, cache_key: str) -> None:
+        self._remove_file(self.cache_dir / f"{cache_key}.pickle")
+
+    @staticmethod
+    def _remove_file(path: Path) -> None:
+        try:
+            path.unlink(missing_ok=True)
+        except OSError:
+            pass
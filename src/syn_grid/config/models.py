@@ -1,4 +1,4 @@
-from pydantic import BaseModel, model_validator
+from pydantic import BaseModel, Field, model_validator
 
 # ======================= #
 #   Experiment Settings   #
@@ -15,10 +15,24 @@ class SnapshotConf(BaseModel, frozen=True):
 # ----------------------- #
 
 
+class LayoutConf(BaseModel, frozen=True):
+    obstacles: list[tuple[int, int]] = Field(default_factory=list)
+    walls: list[tuple[tuple[int, int], tuple[int, int]]] = Field(default_factory=list)
+
+    @model_validator(mode="after")
+    def validate_config(self):
+        for (row_a, col_a), (row_b, col_b) in self.walls:
+            if abs(row_a - row_b) + abs(col_a - col_b) != 1:
+                raise ValueError("walls must lie between two adjacent cells")
+        return self
+
+
 class GridWorldConf(BaseModel, frozen=True):
     grid_rows: int
     grid_cols: int
     max_active_orbs: int
+    num_droids: int = 1
+    layout: LayoutConf = Field(default_factory=LayoutConf)
 
     @model_validator(mode="after")
     def validate_config(self):
@@ -26,6 +40,14 @@ class GridWorldConf(BaseModel, frozen=True):
             raise ValueError("grid_cols and grid_rows should be larger than 0")
         if self.max_active_orbs <= 0:
             raise ValueError("max_active_orbs should be larger than 0")
+        if self.num_droids <= 0:
+            raise ValueError("num_droids should be larger than 0")
+        for row, col in self.layout.obstacles:
+            if not (0 <= row < self.grid_rows and 0 <= col < self.grid_cols):
+                raise ValueError("obstacles must lie inside the grid")
+        free_cells = self.grid_rows * self.grid_cols - len(set(self.layout.obstacles))
+        if self.num_droids + self.max_active_orbs > free_cells:
+            raise ValueError("The grid is too small for all droids and active orbs")
         return self
 
 
@@ -103,11 +125,27 @@ class TierConf(BaseModel, frozen=True):
 class ObservationHandlerConf(BaseModel, frozen=True):
     perception: str
     max_steps: int
+    obs_dtype: str = "float32"
+    truncate_at_max_steps: bool = False
+    time_limit_reward: str = "score"
 
     @model_validator(mode="after")
     def validate_config(self):
-        if self.perception not in ["vector_easy", "vector_medium", "vector_hard"]:
+        if self.perception not in [
+            "vector_easy",
+            "vector_medium",
+            "vector_hard",
+            "composite_easy",
+            "composite_medium",
+            "composite_hard",
+            "egocentric",
+            "entity",
+        ]:
             raise ValueError("The value of difficulty is not allowed")
+        if self.obs_dtype not in ["float32", "float16", "uint8"]:
+            raise ValueError("obs_dtype must be float32, float16 or uint8")
+        if self.time_limit_reward not in ["score", "none"]:
+            raise ValueError("time_limit_reward must be score or none")
         return self
 
 
@@ -118,6 +156,15 @@ class PerceptionConf(BaseModel, frozen=True):
     grid_rows: int
     grid_cols: int
     max_active_orbs: int
+    flatten: bool = False
+    window_size: int = 5
+    observe_reachability: bool = False
+
+    @model_validator(mode="after")
+    def validate_config(self):
+        if self.window_size <= 0 or self.window_size % 2 == 0:
+            raise ValueError("window_size should be a positive odd number")
+        return self
 
 
 # ----------------------- #
@@ -139,11 +186,21 @@ class TrainAgentConf(BaseModel, frozen=False):
     render_mode: str | None
     timesteps: int
     iterations: int
+    n_envs: int = 1
+    vec_backend: str = "dummy"
 
     @model_validator(mode="after")
     def validate_config(self):
         if self.render_mode not in ["human", None]:
             raise ValueError("The value of render mode is not allowed")
+        if self.vec_backend not in ["dummy", "subprocess", "shared_memory", "native"]:
+            raise ValueError("The value of vec backend is not allowed")
+        if self.n_envs < 1:
+            raise ValueError("n_envs should be at least 1")
+        if self.render_mode == "human" and (
+            self.n_envs != 1 or self.vec_backend != "dummy"
+        ):
+            raise ValueError("Rendering needs a single env on the dummy vec backend")
         return self
 
 
@@ -153,6 +210,29 @@ class EvalAgentConf(BaseModel, frozen=False):
     num_eval_episodes: int
 
 
+class CurriculumStageConf(BaseModel, frozen=True):
+    grid_rows: int
+    grid_cols: int
+    max_tier: int
+    step_wise_scoring: bool
+
+
+class CurriculumConf(BaseModel, frozen=True):
+    enabled: bool = False
+    window: int = 100
+    patience: int = 200
+    min_delta: float = 0.5
+    stages: list[CurriculumStageConf] = Field(default_factory=list)
+
+    @model_validator(mode="after")
+    def validate_config(self):
+        if self.enabled and not self.stages:
+            raise ValueError("An enabled curriculum needs at least one stage")
+        if self.window <= 0 or self.patience <= 0:
+            raise ValueError("window and patience should be larger than 0")
+        return self
+
+
 # ======================= #
 #   Domain Config Blocks  #
 # ======================= #
@@ -176,6 +256,7 @@ class AgentConfig(BaseModel, frozen=False):
     global_agent_conf: GlobalAgentConf
     train_agent_conf: TrainAgentConf
     eval_agent_conf: EvalAgentConf
+    curriculum: CurriculumConf = Field(default_factory=CurriculumConf)
 
 
 ###########################
@@ -191,3 +272,19 @@ class FullConf(BaseModel):
     world: WorldConfig
     obs: ObsConfig
     agent: AgentConfig
+
+    @model_validator(mode="after")
+    def validate_config(self):
+        # The native vec backend batches Box observations only
+        perception = self.obs.observation_handler.perception
+        dict_obs = perception == "entity" or (
+            perception
+            in ["composite_easy", "composite_medium", "composite_hard", "egocentric"]
+            and not self.obs.perception.flatten
+        )
+        if self.agent.train_agent_conf.vec_backend == "native" and dict_obs:
+            raise ValueError(
+                "The native vec backend needs a perception with Box observations, flatten "
+                "composite and egocentric perceptions or pick another vec backend"
+            )
+        return self
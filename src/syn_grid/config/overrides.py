@@ -0,0 +1,103 @@
+from syn_grid.config.models import CurriculumStageConf, ObsConfig, WorldConfig
+
+from typing import Any, Sequence, TypeVar
+from pydantic import BaseModel
+
+T = TypeVar("T", bound=BaseModel)
+
+
+def update_model(conf: T, updates: dict[str, Any]) -> T:
+    """
+    Return a copy of a (frozen) config model with updates applied. Nested updates are dicts
+    matching the nested structure.
+
+    :param conf: The config model to copy.
+    :param updates: The values to replace, nested per sub-model.
+    :return: The updated copy.
+    """
+
+    new_conf = conf
+    for key, value in updates.items():
+        sub_conf = getattr(new_conf, key)
+        if isinstance(sub_conf, BaseModel) and isinstance(value, dict):
+            sub_conf = update_model(sub_conf, value)
+        else:
+            sub_conf = value
+        new_conf = new_conf.model_copy(update={key: sub_conf})
+
+    return new_conf
+
+
+def apply_stage_to_world(
+    run_conf: WorldConfig, stage: CurriculumStageConf
+) -> WorldConfig:
+    """
+    Apply a curriculum stage to a world config, propagating the grid size and max tier to every
+    block that repeats them.
+
+    :param run_conf: The world config to start from.
+    :param stage: The curriculum stage.
+    :return: The world config of the stage.
+    """
+
+    grid = {"grid_rows": stage.grid_rows, "grid_cols": stage.grid_cols}
+
+    return update_model(
+        run_conf,
+        {
+            "grid_world_conf": grid,
+            "renderer_conf": grid,
+            "droid_conf": grid,
+            "orb_factory_conf": {**grid, "max_tier": stage.max_tier},
+            "tier_orb_conf": {"step_wise_scoring": stage.step_wise_scoring},
+        },
+    )
+
+
+def apply_stage_to_obs(obs_conf: ObsConfig, stage: CurriculumStageConf) -> ObsConfig:
+    """
+    Size the perception for a curriculum stage. Sizing it for the largest stage keeps the
+    observation shape fixed while smaller stages are trained.
+
+    :param obs_conf: The observation config to start from.
+    :param stage: The curriculum stage.
+    :return: The observation config sized for the stage.
+    """
+
+    return update_model(
+        obs_conf,
+        {
+            "perception": {
+                "grid_rows": stage.grid_rows,
+                "grid_cols": stage.grid_cols,
+                "max_tier": stage.max_tier,
+            }
+        },
+    )
+
+
+def fit_obs_to_worlds(
+    obs_conf: ObsConfig, run_confs: Sequence[WorldConfig]
+) -> ObsConfig:
+    """
+    Size the perception for the largest of several world configs, so worlds with smaller grids,
+    lower max tiers or fewer active orbs are padded to one common observation shape.
+
+    :param obs_conf: The observation config to start from.
+    :param run_confs: The world configs that share the observation.
+    :return: The observation config sized for all worlds.
+    """
+
+    return update_model(
+        obs_conf,
+        {
+            "perception": {
+                "grid_rows": max(conf.grid_world_conf.grid_rows for conf in run_confs),
+                "grid_cols": max(conf.grid_world_conf.grid_cols for conf in run_confs),
+                "max_tier": max(conf.orb_factory_conf.max_tier for conf in run_confs),
+                "max_active_orbs": max(
+                    conf.grid_world_conf.max_active_orbs for conf in run_confs
+                ),
+            }
+        },
+    )
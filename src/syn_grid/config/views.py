@@ -0,0 +1,44 @@
+from syn_grid.config.models import DroidConf, GridWorldConf
+
+from dataclasses import dataclass
+
+# Pydantic models are convenient for loading and validating configs, but the step path only needs a
+# handful of plain values. These slotted, frozen views hold exactly those, precomputed once.
+
+
+@dataclass(frozen=True, slots=True)
+class DroidView:
+    max_row: int
+    max_col: int
+    start_position: tuple[int, int]
+    starting_score: float
+    step_penalty: float
+    tier_consumption_penalty: float
+
+    @classmethod
+    def from_conf(cls, conf: DroidConf) -> "DroidView":
+        return cls(
+            max_row=conf.grid_rows - 1,
+            max_col=conf.grid_cols - 1,
+            start_position=(conf.grid_rows // 2, conf.grid_cols // 2),
+            starting_score=conf.starting_score,
+            step_penalty=conf.step_penalty,
+            tier_consumption_penalty=conf.tier_consumption_penalty,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class GridWorldView:
+    grid_rows: int
+    grid_cols: int
+    max_active_orbs: int
+    num_droids: int
+
+    @classmethod
+    def from_conf(cls, conf: GridWorldConf) -> "GridWorldView":
+        return cls(
+            grid_rows=conf.grid_rows,
+            grid_cols=conf.grid_cols,
+            max_active_orbs=conf.max_active_orbs,
+            num_droids=conf.num_droids,
+        )
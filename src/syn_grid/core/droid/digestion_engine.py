@@ -14,6 +14,7 @@ class DigestionEngine:
 
     def reset(self):
         self.chained_tiers: int = self._NO_CHAIN
+        self.completed_chains: int = 0
         self._pending_reward: float = 0.0
 
     # ================= #
@@ -84,6 +85,7 @@ class DigestionEngine:
             if current_tier == consumed_orb.MAX_TIER:
                 # If max tier is reached, reset chain
                 self.chained_tiers = self._NO_CHAIN
+                self.completed_chains += 1
             else:
                 # Otherwise, continue the chain
                 self.chained_tiers = current_tier
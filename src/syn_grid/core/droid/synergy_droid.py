@@ -1,5 +1,7 @@
 from syn_grid.config.models import DroidConf
+from syn_grid.config.views import DroidView
 from syn_grid.core.orbs.base_orb import BaseOrb
+from syn_grid.core.grid_layout import GridLayout
 from syn_grid.gymnasium.action_space import DroidAction
 from syn_grid.core.droid.digestion_engine import DigestionEngine
 
@@ -18,18 +20,30 @@ class SynergyDroid:
         Defines the game world so the droid know its bounds, set its starting score and store it for later resetting.
         """
 
-        self._conf: Final[DroidConf] = conf
         self.DIGESTION_ENGINE: Final[DigestionEngine] = DigestionEngine()
+        self.configure(conf)
 
-    def reset(self) -> None:
+    def configure(self, conf: DroidConf, layout: GridLayout | None = None) -> None:
         """
-        Initialize Droids starting position at the center of the grid and reset its score and the digestion engine.
+        Replace the droid's config, e.g. when the world is reconfigured. Takes full effect at the
+        next reset.
+
+        :param conf: The new droid config.
+        :param layout: The layout the droid moves in, an open grid of the config's size if None.
+        """
+
+        self._conf: DroidView = DroidView.from_conf(conf)
+        self._layout: GridLayout = layout or GridLayout(conf.grid_rows, conf.grid_cols)
+
+    def reset(self, start_position: tuple[int, int] | None = None) -> None:
+        """
+        Initialize Droids starting position at the center of the grid (or the given position) and reset its score and the digestion engine.
         """
 
-        self.position: list[int] = [
-            self._conf.grid_rows // 2,
-            self._conf.grid_cols // 2,
-        ]
+        if start_position is None:
+            start_position = self._conf.start_position
+
+        self.position: list[int] = list(start_position)
         self.score: float = self._conf.starting_score
         self.DIGESTION_ENGINE.reset()
 
@@ -40,18 +54,11 @@ class SynergyDroid:
     def perform_action(self, agent_action: DroidAction) -> float:
         """Performs current action"""
 
-        # Move droid to the next cell
-        match agent_action:
-            case DroidAction.LEFT:
-                self._moveTowardsMinBound(1)
-            case DroidAction.RIGHT:
-                self._moveTowardsMaxBound(1, self._conf.grid_cols - 1)
-            case DroidAction.UP:
-                self._moveTowardsMinBound(0)
-            case DroidAction.DOWN:
-                self._moveTowardsMaxBound(0, self._conf.grid_rows - 1)
-            case _:
-                raise TypeError("This action isn't implemented")
+        if type(agent_action) is not DroidAction:
+            raise TypeError("This action isn't implemented")
+
+        # Move droid to the next cell, blocked moves keep it in place
+        self.position[:] = self._layout.get_next_position(self.position, agent_action)
 
         return self._apply_reward(self._conf.step_penalty)
 
@@ -67,12 +74,6 @@ class SynergyDroid:
     #      Helpers      #
     # ================= #
 
-    def _moveTowardsMinBound(self, axis: int) -> None:
-        self.position[axis] = max(self.position[axis] - 1, 0)
-
-    def _moveTowardsMaxBound(self, axis: int, bound: int) -> None:
-        self.position[axis] = min(self.position[axis] + 1, bound)
-
     def _apply_reward(self, reward: float):
         self.score += reward
         return reward
@@ -0,0 +1,250 @@
+from syn_grid.gymnasium.action_space import DroidAction
+
+import numpy as np
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Final, Sequence
+
+# Row and column offset of every action, indexed by `DroidAction.value`
+_ACTION_OFFSETS: Final[dict[DroidAction, tuple[int, int]]] = {
+    DroidAction.LEFT: (0, -1),
+    DroidAction.DOWN: (1, 0),
+    DroidAction.RIGHT: (0, 1),
+    DroidAction.UP: (-1, 0),
+}
+
+# Layouts are immutable, so every world with the same structure shares one instance and with it
+# the distance tables computed so far. Only the most recently used structures are kept, so
+# reconfigured or randomized worlds don't pile up layouts for the life of the process.
+_MAX_CACHED_LAYOUTS: Final[int] = 64
+
+# Number of int32 distances a layout keeps per source cell row, ~64 MiB. Small grids keep every
+# row, large grids only the rows of the most recently used source cells.
+_MAX_CACHED_DISTANCES: Final[int] = 2**24
+
+
+class GridLayout:
+    """
+    The static structure of a grid: its size, the blocked cells and the walls between cells.
+
+    Everything movement needs is precomputed once into a `next_cell[cell, action]` table, where
+    cells are numbered row-major. Moving into the grid border, an obstacle or through a wall
+    leaves the droid where it is, so a move is a single table lookup.
+
+    Shortest-path distances between cells are served from cached tables: open grids use the
+    Manhattan distance, other layouts run one BFS per source cell the first time it is needed and
+    keep its int32 row in a bounded LRU cache.
+    """
+
+    # ================= #
+    #       Init        #
+    # ================= #
+
+    def __init__(
+        self,
+        rows: int,
+        cols: int,
+        obstacles: Sequence[Sequence[int]] = (),
+        walls: Sequence[Sequence[Sequence[int]]] = (),
+    ):
+        self.ROWS: Final[int] = rows
+        self.COLS: Final[int] = cols
+        self.IS_OPEN: Final[bool] = not obstacles and not walls
+        # Distance of cells that can't be reached, larger than any real distance
+        self.UNREACHABLE: Final[int] = rows * cols
+
+        self.BLOCKED: Final[np.ndarray] = np.zeros(rows * cols, np.bool_)
+        for row, col in obstacles:
+            self.BLOCKED[self._get_cell(row, col)] = True
+
+        blocked_moves = set()
+        for (row_a, col_a), (row_b, col_b) in walls:
+            cell_a, cell_b = self._get_cell(row_a, col_a), self._get_cell(row_b, col_b)
+            blocked_moves.update(((cell_a, cell_b), (cell_b, cell_a)))
+
+        self.NEXT_CELL: Final[np.ndarray] = self._build_next_cell(blocked_moves)
+        self.FREE_CELLS: Final[np.ndarray] = np.flatnonzero(~self.BLOCKED)
+        self.ACTION_MASKS: Final[np.ndarray] = self._build_action_masks()
+
+        # Plain nested lists are much faster than numpy for single lookups on the step path
+        self._NEXT_POSITION: Final[list[list[tuple[int, int]]]] = [
+            [divmod(int(cell), cols) for cell in actions]  # type: ignore[misc]
+            for actions in self.NEXT_CELL
+        ]
+        # One BFS row per source cell, only the most recently used ones are kept
+        self._MAX_DISTANCE_ROWS: Final[int] = max(
+            1, _MAX_CACHED_DISTANCES // (rows * cols)
+        )
+        self._distances: OrderedDict[int, np.ndarray] = OrderedDict()
+
+    @classmethod
+    def get(
+        cls,
+        rows: int,
+        cols: int,
+        obstacles: Sequence[Sequence[int]] = (),
+        walls: Sequence[Sequence[Sequence[int]]] = (),
+    ) -> "GridLayout":
+        """
+        Return the shared layout for this structure, building it only the first time.
+
+        :param rows: Number of rows.
+        :param cols: Number of columns.
+        :param obstacles: The blocked `[row, col]` cells.
+        :param walls: Pairs of adjacent cells that can't be moved between.
+        :return: The cached layout.
+        """
+
+        return _get_cached_layout(
+            rows,
+            cols,
+            tuple(sorted(tuple(cell) for cell in obstacles)),
+            tuple(sorted(tuple(tuple(cell) for cell in wall) for wall in walls)),
+        )
+
+    # ================= #
+    #        API        #
+    # ================= #
+
+    def get_next_position(
+        self, position: Sequence[int], action: DroidAction
+    ) -> tuple[int, int]:
+        """
+        Look up where an action leads from a position.
+
+        :param position: The current `[row, col]` position.
+        :param action: The action to perform.
+        :return: The `(row, col)` after the move.
+        """
+
+        return self._NEXT_POSITION[position[0] * self.COLS + position[1]][action.value]
+
+    def get_distance(self, start: Sequence[int], end: Sequence[int]) -> int:
+        """
+        Number of moves on the shortest path between two positions, `UNREACHABLE` if there is
+        none.
+
+        :param start: The `[row, col]` to start from.
+        :param end: The `[row, col]` to reach.
+        :return: The shortest-path distance.
+        """
+
+        if self.IS_OPEN:
+            return abs(start[0] - end[0]) + abs(start[1] - end[1])
+
+        start_cell = start[0] * self.COLS + start[1]
+        distances = self._distances.get(start_cell)
+        if distances is None:
+            distances = self._run_bfs(start_cell)
+        else:
+            self._distances.move_to_end(start_cell)
+
+        return int(distances[end[0] * self.COLS + end[1]])
+
+    def get_action_mask(self, position: Sequence[int]) -> np.ndarray:
+        """
+        Return which actions actually move the droid away from a position. The row is a read-only
+        view into the shared table.
+
+        :param position: The `[row, col]` position.
+        :return: A boolean mask indexed by `DroidAction.value`.
+        """
+
+        return self.ACTION_MASKS[position[0] * self.COLS + position[1]]
+
+    def is_blocked(self, position: Sequence[int]) -> bool:
+        return bool(self.BLOCKED[position[0] * self.COLS + position[1]])
+
+    def get_nearest_free_position(
+        self, position: Sequence[int], taken: Sequence[Sequence[int]] = ()
+    ) -> tuple[int, int]:
+        """
+        Return the position itself when it is free, otherwise the next free cell in row-major
+        order (wrapping around).
+
+        :param position: The preferred `[row, col]` position.
+        :param taken: Positions that count as blocked, e.g. the ones of other droids.
+        :return: A free `(row, col)` position.
+        """
+
+        cell = position[0] * self.COLS + position[1]
+        taken_cells = {row * self.COLS + col for row, col in taken}
+        order = np.roll(self.FREE_CELLS, -np.searchsorted(self.FREE_CELLS, cell))
+
+        for free_cell in order:
+            if free_cell not in taken_cells:
+                return divmod(int(free_cell), self.COLS)  # type: ignore[return-value]
+
+        raise ValueError("There is no free cell left in the grid")
+
+    # ================= #
+    #      Helpers      #
+    # ================= #
+
+    def _get_cell(self, row: int, col: int) -> int:
+        if not (0 <= row < self.ROWS and 0 <= col < self.COLS):
+            raise ValueError(
+                f"[{row}, {col}] is outside the {self.ROWS}x{self.COLS} grid"
+            )
+
+        return row * self.COLS + col
+
+    def _run_bfs(self, start_cell: int) -> np.ndarray:
+        distances = np.full(self.ROWS * self.COLS, self.UNREACHABLE, np.int32)
+        distances[start_cell] = 0
+        frontier = np.array([start_cell])
+        distance = 0
+
+        # Expand all cells of one distance at once through the movement table
+        while frontier.size:
+            distance += 1
+            neighbours = np.unique(self.NEXT_CELL[frontier])
+            frontier = neighbours[distances[neighbours] == self.UNREACHABLE]
+            distances[frontier] = distance
+
+        self._distances[start_cell] = distances
+        if len(self._distances) > self._MAX_DISTANCE_ROWS:
+            self._distances.popitem(last=False)
+
+        return distances
+
+    def _build_action_masks(self) -> np.ndarray:
+        masks = self.NEXT_CELL != np.arange(self.ROWS * self.COLS)[:, None]
+
+        # A droid that can't move at all (e.g. on a 1x1 grid) may still pick any action
+        masks[~masks.any(axis=1)] = True
+        masks.setflags(write=False)
+
+        return masks
+
+    def _build_next_cell(self, blocked_moves: set[tuple[int, int]]) -> np.ndarray:
+        next_cell = np.empty((self.ROWS * self.COLS, len(DroidAction)), np.int64)
+
+        for cell in range(self.ROWS * self.COLS):
+            row, col = divmod(cell, self.COLS)
+            for action, (d_row, d_col) in _ACTION_OFFSETS.items():
+                target_row, target_col = row + d_row, col + d_col
+                target = target_row * self.COLS + target_col
+
+                if (
+                    not self.BLOCKED[cell]
+                    and 0 <= target_row < self.ROWS
+                    and 0 <= target_col < self.COLS
+                    and not self.BLOCKED[target]
+                    and (cell, target) not in blocked_moves
+                ):
+                    next_cell[cell, action.value] = target
+                else:
+                    next_cell[cell, action.value] = cell
+
+        return next_cell
+
+
+@lru_cache(maxsize=_MAX_CACHED_LAYOUTS)
+def _get_cached_layout(
+    rows: int,
+    cols: int,
+    obstacles: tuple[tuple[int, ...], ...],
+    walls: tuple[tuple[tuple[int, ...], ...], ...],
+) -> GridLayout:
+    return GridLayout(rows, cols, obstacles, walls)
@@ -6,15 +6,18 @@ from syn_grid.config.models import (
     NegativeConf,
     TierConf,
 )
+from syn_grid.config.views import GridWorldView
 from syn_grid.gymnasium.action_space import DroidAction
 from syn_grid.core.droid.synergy_droid import SynergyDroid
-from syn_grid.core.orbs.orb_meta import OrbMeta
+from syn_grid.core.grid_layout import GridLayout
+from syn_grid.core.spawn_sources import RandomSpawnSource, SpawnSource
+from syn_grid.core.orbs.orb_meta import DirectType, OrbMeta, SynergyType
 from syn_grid.core.orbs.orb_factory import OrbFactory
 from syn_grid.core.orbs.base_orb import BaseOrb
 
 import numpy as np
 from numpy.random import Generator, default_rng
-from typing import Final
+from typing import Final, Sequence
 
 
 class GridWorld:
@@ -31,42 +34,106 @@ class GridWorld:
         tier_orb_conf: TierConf,
     ):
         """
-        Initializes the grid world. Defines the game world's size and initializes the droid and orbs.
+        Initializes the grid world. Defines the game world's size and initializes the droids and orbs.
         """
 
-        # World
-        self._CONF: Final[GridWorldConf] = conf
-        self._DE_SPAWN_TIERS: Final[bool] = orb_manager_conf.de_spawn_tiers
-
-        # Droid
-        self.DROID: Final[SynergyDroid] = SynergyDroid(droid_conf)
+        # Droids, `DROID` is the one observed by perceptions (see `observe_from()`)
+        self.DROIDS: Final[list[SynergyDroid]] = []
+        self.DROID: SynergyDroid
 
         # Orbs
         self._ACTIVE_ORBS: Final[list[BaseOrb]] = []
         self._inactive_orbs: list[BaseOrb] = []
-        self.ALL_ORBS: Final[list[BaseOrb]] = OrbFactory(
-            orb_manager_conf, negative_orb_conf, tier_orb_conf
-        ).create_orbs()
+        self.ALL_ORBS: Final[list[BaseOrb]] = []
+
+        self.reconfigure(
+            conf, orb_manager_conf, droid_conf, negative_orb_conf, tier_orb_conf
+        )
+
+    def reconfigure(
+        self,
+        conf: GridWorldConf,
+        orb_manager_conf: OrbFactoryConf,
+        droid_conf: DroidConf,
+        negative_orb_conf: NegativeConf,
+        tier_orb_conf: TierConf,
+    ) -> None:
+        """
+        Apply new configs to the world, the world must be reset before it is stepped again.
 
-    def reset(self, rng: Generator | None = None) -> None:
+        The droids and the orb pool are kept: when the new config yields the same orb types and
+        tiers, the existing orbs are reconfigured in place, otherwise the pool is recreated.
         """
-        Reset the droid to its starting position and re-spawns the orb at a random location
+
+        # World
+        self._CONF: GridWorldView = GridWorldView.from_conf(conf)
+        self.LAYOUT: GridLayout = GridLayout.get(
+            conf.grid_rows, conf.grid_cols, conf.layout.obstacles, conf.layout.walls
+        )
+
+        # Category, type, tier and remaining life of the active orb on each cell (0 when empty),
+        # kept up to date on every spawn, tick and removal so perceptions can slice it directly
+        self.ORB_GRID: np.ndarray = np.zeros(
+            (conf.grid_rows, conf.grid_cols, 4), np.float32
+        )
+        self._DE_SPAWN_TIERS: bool = orb_manager_conf.de_spawn_tiers
+
+        # Droids
+        self.DROIDS[:] = self.DROIDS[: self._CONF.num_droids]
+        self.DROIDS.extend(
+            SynergyDroid(droid_conf)
+            for _ in range(len(self.DROIDS), self._CONF.num_droids)
+        )
+        for droid in self.DROIDS:
+            droid.configure(droid_conf, self.LAYOUT)
+        self._START_POSITIONS = self._get_start_positions(droid_conf)
+        self.DROID = self.DROIDS[0]
+
+        # Orbs
+        factory = OrbFactory(orb_manager_conf, negative_orb_conf, tier_orb_conf)
+        if not factory.configure_orbs(self.ALL_ORBS):
+            self.ALL_ORBS[:] = factory.create_orbs()
+
+    def reset(
+        self, rng: Generator | None = None, spawn_source: SpawnSource | None = None
+    ) -> None:
+        """
+        Reset the droids to their starting positions and re-spawns the orb at a random location
+
+        :param rng: Generator for the world's random choices, an unseeded one if None.
+        :param spawn_source: Where the spawn choices come from for this episode, e.g. a
+            `RandomSpawnSource` with its own streams or a `ScheduledSpawnSource` from a
+            `ScenarioBank`. Drawn from `rng` if None.
         """
 
-        # Reset Droid
-        self.DROID.reset()
+        # Reset Droids
+        for droid, start_position in zip(self.DROIDS, self._START_POSITIONS):
+            droid.reset(start_position)
+        self.DROID = self.DROIDS[0]
 
         # Reset the orb arrays
+        self.ORB_GRID.fill(0.0)
         self._ACTIVE_ORBS.clear()
         self._inactive_orbs.clear()
         self._inactive_orbs = self.ALL_ORBS.copy()
         for orb in self.ALL_ORBS:
             orb.reset()
 
+        # Episode counters, read by the environments' episode statistics
+        self.consumed_orbs: dict[DirectType | SynergyType, int] = {
+            orb_type: 0
+            for orb_type in (*DirectType, *SynergyType)
+            if orb_type.value != 0
+        }
+        self.despawned_orbs = 0
+
         if rng == None:
             rng = default_rng()
 
         self.rng = rng
+        self._spawn_source: SpawnSource = spawn_source or RandomSpawnSource(
+            rng, rng, self.LAYOUT.FREE_CELLS
+        )
 
         # Spawn the first orb
         self._spawn_random_orb_if_ready()
@@ -82,26 +149,59 @@ class GridWorld:
         step_penalty = self.DROID.perform_action(agent_action)
 
         for orb in self.ALL_ORBS:
-            if orb.is_active:
-                # only decrease timer for tier orbs if de-spawning is activated in the configs
-                if orb.META.TIER == 0 or self._DE_SPAWN_TIERS:
-                    orb.TIMER.tick()
-                if orb.TIMER.is_completed():
-                    orb.de_spawn()
-                    self._toggle_orb_to_inactive(orb)
-                elif self.DROID.position == orb.position:
-                    # consume orb
-                    reward = self.DROID.consume_orb(orb)
-                    self._toggle_orb_to_inactive(orb)
-            else:
-                # decrease the cooldown for inactive orbs
-                orb.TIMER.tick()
+            if self._tick_orb(orb) and self.DROID.position == orb.position:
+                # consume orb
+                reward = self._consume_orb(self.DROID, orb)
 
-        if len(self._ACTIVE_ORBS) < self._CONF.max_active_orbs:
-            self._spawn_random_orb_if_ready()
+        self._refill_orbs()
 
         return step_penalty + reward
 
+    def perform_agent_actions(
+        self, agent_actions: Sequence[DroidAction | None]
+    ) -> list[float]:
+        """
+        Move all droids at once, then advance the shared orbs a single time. When several droids
+        reach the same orb, a random one of them consumes it.
+
+        :param agent_actions: One action per droid, None keeps that droid idle (e.g. when its
+            episode is over).
+        :return: The reward of each droid, 0 for idle droids.
+        """
+
+        rewards = [
+            0.0 if action is None else droid.perform_action(action)
+            for droid, action in zip(self.DROIDS, agent_actions, strict=True)
+        ]
+
+        for orb in self.ALL_ORBS:
+            if not self._tick_orb(orb):
+                continue
+
+            indices = [
+                index
+                for index, (droid, action) in enumerate(zip(self.DROIDS, agent_actions))
+                if action is not None and droid.position == orb.position
+            ]
+            if indices:
+                index = (
+                    indices[0] if len(indices) == 1 else int(self.rng.choice(indices))
+                )
+                rewards[index] += self._consume_orb(self.DROIDS[index], orb)
+
+        self._refill_orbs()
+
+        return rewards
+
+    def observe_from(self, index: int) -> None:
+        """
+        Make droid `index` the one perceptions observe through `DROID`.
+
+        :param index: The index of the droid in `DROIDS`.
+        """
+
+        self.DROID = self.DROIDS[index]
+
     # === Getters === #
 
     def get_orb_positions(self, only_active: bool) -> list[list[int]]:
@@ -122,6 +222,35 @@ class GridWorld:
 
         return [o.META for o in self.ALL_ORBS]
 
+    def get_action_mask(self) -> np.ndarray:
+        return self.LAYOUT.get_action_mask(self.DROID.position)
+
+    def get_max_active_orbs(self) -> int:
+        return self._CONF.max_active_orbs
+
+    def get_active_orbs(self) -> list[BaseOrb]:
+        return self._ACTIVE_ORBS
+
+    def get_orb_distance(self, orb: BaseOrb) -> int:
+        return self.LAYOUT.get_distance(self.DROID.position, orb.position)
+
+    def can_reach_orb(self, orb: BaseOrb, distance: int) -> bool:
+        """
+        Whether the droid can reach an active orb before it de-spawns, given its distance. The
+        orb's timer ticks once per move and the orb is gone as soon as it completes.
+
+        :param orb: The active orb.
+        :param distance: The droid's shortest-path distance to the orb.
+        :return: True if the orb can still be consumed.
+        """
+
+        if distance >= self.LAYOUT.UNREACHABLE:
+            return False
+        if orb.META.TIER != 0 and not self._DE_SPAWN_TIERS:
+            return True
+
+        return distance < orb.TIMER.remaining
+
     def get_orb_categories(self) -> list[int]:
         return [o.META.CATEGORY.value for o in self.ALL_ORBS]
 
@@ -138,12 +267,67 @@ class GridWorld:
     #      Helpers      #
     # ================= #
 
+    # === Init === #
+
+    def _get_start_positions(self, droid_conf: DroidConf) -> list[tuple[int, int]]:
+        # A single droid starts at the center, several are spread evenly from the middle row on.
+        # Droids that would start on an obstacle move to the next free cell.
+        if self._CONF.num_droids == 1:
+            preferred = [(droid_conf.grid_rows // 2, droid_conf.grid_cols // 2)]
+        else:
+            cells = self._CONF.grid_rows * self._CONF.grid_cols
+            first_cell = (self._CONF.grid_rows // 2) * self._CONF.grid_cols
+            preferred = [
+                divmod(
+                    (first_cell + index * cells // self._CONF.num_droids) % cells,
+                    self._CONF.grid_cols,
+                )
+                for index in range(self._CONF.num_droids)
+            ]
+
+        positions: list[tuple[int, int]] = []
+        for position in preferred:
+            positions.append(self.LAYOUT.get_nearest_free_position(position, positions))
+
+        return positions
+
     # === API === #
 
+    def _tick_orb(self, orb: BaseOrb) -> bool:
+        # Returns whether the orb is still active and can be consumed this step
+        if not orb.is_active:
+            # decrease the cooldown for inactive orbs
+            orb.TIMER.tick()
+            return False
+
+        # only decrease timer for tier orbs if de-spawning is activated in the configs
+        if orb.META.TIER == 0 or self._DE_SPAWN_TIERS:
+            orb.TIMER.tick()
+            self.ORB_GRID[orb.position[0], orb.position[1], 3] = orb.TIMER.remaining
+        if orb.TIMER.is_completed():
+            orb.de_spawn()
+            self.despawned_orbs += 1
+            self._toggle_orb_to_inactive(orb)
+            return False
+
+        return True
+
+    def _refill_orbs(self) -> None:
+        if len(self._ACTIVE_ORBS) < self._CONF.max_active_orbs:
+            self._spawn_random_orb_if_ready()
+
+    def _consume_orb(self, droid: SynergyDroid, orb: BaseOrb) -> float:
+        self.consumed_orbs[orb.META.TYPE] += 1
+        reward = droid.consume_orb(orb)
+        self._toggle_orb_to_inactive(orb)
+
+        return reward
+
     def _toggle_orb_to_inactive(self, orb: BaseOrb):
         idx = self._ACTIVE_ORBS.index(orb)
         depleted = self._ACTIVE_ORBS.pop(idx)
         self._inactive_orbs.append(depleted)
+        self.ORB_GRID[orb.position[0], orb.position[1]] = 0.0
 
     # === Global === #
 
@@ -152,32 +336,34 @@ class GridWorld:
         if not ready_orbs:
             return
 
-        orb = self.rng.choice(ready_orbs)  # type: ignore[arg-type]
+        orb = ready_orbs[self._spawn_source.choose_orb(len(ready_orbs))]
         self._inactive_orbs.remove(orb)
 
+        # The config leaves a free cell for every active orb next to the droids
+        cols = self._CONF.grid_cols
+        taken_cells = {
+            row * cols + col
+            for row, col in [droid.position for droid in self.DROIDS]
+            + [active_orb.position for active_orb in self._ACTIVE_ORBS]
+        }
         while True:
-            position = [
-                int(self.rng.integers(0, self._CONF.grid_rows)),
-                int(self.rng.integers(0, self._CONF.grid_cols)),
-            ]
-
-            if self._empty_spawn_cell(position):
-                orb.spawn(position)
-                self._ACTIVE_ORBS.append(orb)
+            cell = self._spawn_source.next_cell()
+            if cell is None:
+                # The source ran out of cells, take the first free one in row-major order
+                cell = next(
+                    int(free_cell)
+                    for free_cell in self.LAYOUT.FREE_CELLS
+                    if free_cell not in taken_cells
+                )
+            if not self.LAYOUT.BLOCKED[cell] and cell not in taken_cells:
                 break
 
-    def _empty_spawn_cell(self, position: list[int]) -> bool:
-        # Check against droid
-        if position == self.DROID.position:
-            return False
-
-        # If there are no active orbs we can spawn right away
-        if len(self._ACTIVE_ORBS) == 0:
-            return True
-
-        # Else check against all active orbs
-        for r in self._ACTIVE_ORBS:
-            if position == r.position:
-                return False
-
-        return True
+        position = list(divmod(cell, cols))
+        orb.spawn(position)
+        self._ACTIVE_ORBS.append(orb)
+        self.ORB_GRID[position[0], position[1]] = (
+            orb.META.CATEGORY.value,
+            orb.META.TYPE.value,
+            orb.META.TIER,
+            orb.TIMER.remaining,
+        )
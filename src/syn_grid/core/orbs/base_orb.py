@@ -17,25 +17,26 @@ class BaseOrb(ABC):
         reward: float,
         cool_down: int,
         meta: OrbMeta,
+        life_span: int,
     ):
         self.position: list[int] = [-1, -1]
-        self.REWARD: Final[float] = reward
-        self._COOL_DOWN: Final[int] = cool_down
         self.META: Final[OrbMeta] = meta
         self.TIMER: Final[Timer] = Timer()
+        self._set_configurable_values(reward, cool_down, life_span)
 
-    @classmethod
-    def set_life_span(cls, grid_rows: int, grid_cols: int) -> None:
+    @staticmethod
+    def get_life_span(grid_rows: int, grid_cols: int) -> int:
         """
-        Set the maximum lifespan based on the grid size.
+        Get the maximum lifespan based on the grid size.
 
         The lifespan is defined as the maximum number of steps required to traverse the grid from one corner to the opposite corner using Manhattan distance.
 
         :param grid_rows: Number of rows
         :param grid_cols: Number of columns
+        :return: The lifespan in steps
         """
 
-        cls._LIFE_SPAN = (grid_rows - 1) + (grid_cols - 1)
+        return (grid_rows - 1) + (grid_cols - 1)
 
     def reset(self) -> None:
         self.is_active = False
@@ -64,3 +65,16 @@ class BaseOrb(ABC):
         self.is_active = False
         self.TIMER.set(self._COOL_DOWN)
         return self
+
+    # ================= #
+    #      Helpers      #
+    # ================= #
+
+    def _set_configurable_values(
+        self, reward: float, cool_down: int, life_span: int
+    ) -> None:
+        # Constant during an episode, only a world reconfiguration changes them (through the
+        # subclasses' configure()). The orb's identity in META is fixed at creation.
+        self.REWARD = reward
+        self._COOL_DOWN = cool_down
+        self._LIFE_SPAN = life_span
@@ -16,9 +16,24 @@ class NegativeOrb(BaseOrb):
     #       Init        #
     # ================= #
 
-    def __init__(self, conf: NegativeConf):
+    def __init__(self, conf: NegativeConf, life_span: int):
         super().__init__(
             conf.reward,
             conf.cool_down,
             OrbMeta(category=OrbCategory.DIRECT, type=DirectType.NEGATIVE),
+            life_span,
         )
+
+    # ================= #
+    #        API        #
+    # ================= #
+
+    def configure(self, conf: NegativeConf, life_span: int) -> None:
+        """
+        Reconfigure the orb in place.
+
+        :param conf: The new negative orb config.
+        :param life_span: Steps the orb stays active after spawning.
+        """
+
+        self._set_configurable_values(conf.reward, conf.cool_down, life_span)
@@ -20,6 +20,9 @@ class OrbFactory:
         self._MAX_ACTIVE_ORBS: Final[int] = orb_factory_conf.max_active_orbs
         self._MIN_POOL_SIZE: Final[int] = self._MAX_ACTIVE_ORBS * 3
         self._MAX_TIER: Final[int] = orb_factory_conf.max_tier
+        self._LIFE_SPAN: Final[int] = BaseOrb.get_life_span(
+            orb_factory_conf.grid_rows, orb_factory_conf.grid_cols
+        )
         self._ORB_FACTORY_CONF = orb_factory_conf
         self._NEGATIVE_ORB_CONF = negative_orb_conf
         self._TIER_ORB_CONF = tier_orb_conf
@@ -31,36 +34,72 @@ class OrbFactory:
     def create_orbs(self) -> list[BaseOrb]:
         """Create all orbs according to the config and weights"""
 
-        # Gets the ena—bed orbs and calculate their total weight
+        orbs: list[BaseOrb] = []
+        for orb_type, tier in self._plan_orbs():
+            if orb_type == "negative":
+                orbs.append(NegativeOrb(self._NEGATIVE_ORB_CONF, self._LIFE_SPAN))
+            elif orb_type == "tier":
+                orbs.append(self._create_tier_orb(tier))
+
+        return orbs
+
+    def get_pool_size(self) -> int:
+        """Return the number of orbs `create_orbs()` would create"""
+
+        return len(self._plan_orbs())
+
+    def configure_orbs(self, orbs: list[BaseOrb]) -> bool:
+        """
+        Reconfigure an existing orb pool in place when the config yields the same pool composition
+        (the same orb types and tiers in the same order), e.g. when only rewards, cooldowns or the
+        grid size change.
+
+        :param orbs: The orb pool to reconfigure, as returned by `create_orbs()`.
+        :return: True if the pool was reconfigured, False if it has to be recreated.
+        """
+
+        plan = self._plan_orbs()
+        if [self._get_orb_identity(orb) for orb in orbs] != plan:
+            return False
+
+        for orb in orbs:
+            if isinstance(orb, NegativeOrb):
+                orb.configure(self._NEGATIVE_ORB_CONF, self._LIFE_SPAN)
+            elif isinstance(orb, TierOrb):
+                orb.configure(self._TIER_ORB_CONF, self._MAX_TIER, self._LIFE_SPAN)
+
+        return True
+
+    # ================= #
+    #      Helpers      #
+    # ================= #
+
+    # === API === #
+
+    def _plan_orbs(self) -> list[tuple[str, int]]:
+        # The pool as (orb type, tier) pairs, in creation order
         enabled_orbs = self._get_conf_enabled_orbs()
         total_weight = sum(enabled_orbs.values())
 
-        # Shared setup
-        BaseOrb.set_life_span(
-            self._ORB_FACTORY_CONF.grid_rows, self._ORB_FACTORY_CONF.grid_cols
-        )
-        TierOrb.MAX_TIER = self._MAX_TIER
-
         # Calculate counts through ratios via orb weights
         ratios = [(orb_weight / total_weight) for orb_weight in enabled_orbs.values()]
         orb_counts = self._scale_ratios_to_counts(ratios)
         orb_counts = self._ensure_min_pool_size(orb_counts, ratios)
 
-        # Initialize orbs based on count per orb type
-        orbs: list[BaseOrb] = []
+        plan: list[tuple[str, int]] = []
         for i, orb_type in enumerate(enabled_orbs):
             if orb_type == "negative":
-                orbs.extend(
-                    [NegativeOrb(self._NEGATIVE_ORB_CONF) for _ in range(orb_counts[i])]
-                )
+                plan.extend([("negative", 0)] * orb_counts[i])
             elif orb_type == "tier":
-                self._initialize_tier_orbs(orbs, orb_counts[i])
+                plan.extend(("tier", tier) for tier in self._plan_tiers(orb_counts[i]))
 
-        return orbs
+        return plan
 
-    # ================= #
-    #      Helpers      #
-    # ================= #
+    def _get_orb_identity(self, orb: BaseOrb) -> tuple[str, int]:
+        if isinstance(orb, TierOrb):
+            return ("tier", orb.META.TIER)
+
+        return ("negative", 0)
 
     def _get_conf_enabled_orbs(self) -> dict[str, int]:
         """Return enabled orb types and their weights from orb_manager_conf"""
@@ -104,23 +143,24 @@ class OrbFactory:
 
         return counts_int
 
-    def _initialize_tier_orbs(self, orbs: list[BaseOrb], orb_count: int):
+    def _plan_tiers(self, orb_count: int) -> list[int]:
         # Default behavior when the projected total orb pool exceeds the minimum:
         # spawn one orb per tier and return early.
         if self._MAX_TIER >= orb_count:
-            for tier in range(1, self._MAX_TIER + 1):
-                orbs.append(TierOrb(tier, self._TIER_ORB_CONF))
-            return
+            return list(range(1, self._MAX_TIER + 1))
 
         # If total count can be evenly divided across tiers, spawn exactly that many orbs per tier.
         # Else, if total orbs cannot be evenly divided, distribute them one by one across tiers,
         # looping back to the first tier as needed.
         orbs_per_tier = orb_count / (self._MAX_TIER)
         if orbs_per_tier.is_integer():
-            for tier in range(1, self._MAX_TIER + 1):
-                for _ in range(int(orbs_per_tier)):
-                    orbs.append(TierOrb(tier, self._TIER_ORB_CONF))
-        else:
-            for i in range(orb_count):
-                tier = (i % self._MAX_TIER) + 1
-                orbs.append(TierOrb(tier, self._TIER_ORB_CONF))
+            return [
+                tier
+                for tier in range(1, self._MAX_TIER + 1)
+                for _ in range(int(orbs_per_tier))
+            ]
+
+        return [(i % self._MAX_TIER) + 1 for i in range(orb_count)]
+
+    def _create_tier_orb(self, tier: int) -> TierOrb:
+        return TierOrb(tier, self._TIER_ORB_CONF, self._MAX_TIER, self._LIFE_SPAN)
@@ -5,7 +5,6 @@ from syn_grid.core.orbs.orb_meta import (
     OrbCategory,
     SynergyType,
 )
-from typing import Final
 
 
 class TierOrb(BaseOrb):
@@ -21,30 +20,53 @@ class TierOrb(BaseOrb):
     # ================= #
 
     _LINEAR_REWARD_GROWTH: bool
-    _TIER_BASE_REWARD: Final[float]
-    _GROWTH_FACTOR: Final[float]
+    _TIER_BASE_REWARD: float
+    _GROWTH_FACTOR: float
     MAX_TIER: int
     STEP_WISE_SCORING: bool
 
-    def __init__(self, tier: int, conf: TierConf):
-        if tier > self.MAX_TIER:
-            raise ValueError("Tier is higher than the allowed max")
-
-        self._LINEAR_REWARD_GROWTH = conf.linear_reward_growth
-        self._TIER_BASE_REWARD = conf.base_reward
-        self._GROWTH_FACTOR = conf.growth_factor
-        self.STEP_WISE_SCORING = conf.step_wise_scoring
+    def __init__(self, tier: int, conf: TierConf, max_tier: int, life_span: int):
+        self._set_tier_values(tier, conf, max_tier)
 
         super().__init__(
             self._calculate_reward(tier),
             conf.cool_down,
             OrbMeta(OrbCategory.SYNERGY, SynergyType.TIER, tier),
+            life_span,
+        )
+
+    # ================= #
+    #        API        #
+    # ================= #
+
+    def configure(self, conf: TierConf, max_tier: int, life_span: int) -> None:
+        """
+        Reconfigure the orb in place, keeping its tier.
+
+        :param conf: The new tier orb config.
+        :param max_tier: The highest tier in the world.
+        :param life_span: Steps the orb stays active after spawning.
+        """
+
+        self._set_tier_values(self.META.TIER, conf, max_tier)
+        self._set_configurable_values(
+            self._calculate_reward(self.META.TIER), conf.cool_down, life_span
         )
 
     # ================= #
     #      Helpers      #
     # ================= #
 
+    def _set_tier_values(self, tier: int, conf: TierConf, max_tier: int) -> None:
+        if tier > max_tier:
+            raise ValueError("Tier is higher than the allowed max")
+
+        self.MAX_TIER = max_tier
+        self._LINEAR_REWARD_GROWTH = conf.linear_reward_growth
+        self._TIER_BASE_REWARD = conf.base_reward
+        self._GROWTH_FACTOR = conf.growth_factor
+        self.STEP_WISE_SCORING = conf.step_wise_scoring
+
     def _calculate_reward(self, tier_multiplier: int) -> float:
         """
         Calculate the reward based on the tier base and growth setting.
@@ -0,0 +1,179 @@
+from syn_grid.config.models import GridWorldConf, LayoutConf
+from syn_grid.core.grid_layout import GridLayout
+from syn_grid.core.spawn_sources import ScheduledSpawnSource
+
+import numpy as np
+from pathlib import Path
+from typing import Final, Sequence
+
+
+class ScenarioBank:
+    """
+    A set of pregenerated spawn schedules, one per seed, stored as compact arrays in an `.npz`
+    file. Evaluating several agents on the same bank runs all of them on identical scenarios, with
+    no RNG state to keep in sync across processes and no spawn sampling on the step path.
+
+    Each scenario holds enough orb draws for one spawn per step (the most a world can do) and a
+    stream of free cells to try them on, see `ScheduledSpawnSource`. The bank remembers the grid,
+    layout and episode length it was generated for and only plays on matching environments.
+    """
+
+    # ================= #
+    #       Init        #
+    # ================= #
+
+    def __init__(
+        self,
+        seeds: np.ndarray,
+        orb_draws: np.ndarray,
+        cells: np.ndarray,
+        grid_rows: int,
+        grid_cols: int,
+        max_steps: int,
+        layout: LayoutConf = LayoutConf(),
+    ):
+        if not (len(seeds) == len(orb_draws) == len(cells)):
+            raise ValueError("seeds, orb_draws and cells need one row per scenario")
+        if cells.size and cells.max() >= grid_rows * grid_cols:
+            raise ValueError("The cells don't fit the grid of the bank")
+
+        self.SEEDS: Final[np.ndarray] = seeds
+        self.GRID_ROWS: Final[int] = grid_rows
+        self.GRID_COLS: Final[int] = grid_cols
+        self.MAX_STEPS: Final[int] = max_steps
+        self.LAYOUT: Final[LayoutConf] = layout
+        self._ORB_DRAWS: Final[np.ndarray] = orb_draws
+        self._CELLS: Final[np.ndarray] = cells
+
+    @classmethod
+    def generate(
+        cls,
+        seeds: Sequence[int],
+        conf: GridWorldConf,
+        max_steps: int,
+        cells_per_spawn: int = 4,
+    ) -> "ScenarioBank":
+        """
+        Pregenerate the spawn schedule of every seed.
+
+        :param seeds: One seed per scenario.
+        :param conf: The grid world the scenarios are played on, cells blocked by its layout are
+            never scheduled.
+        :param max_steps: The episode length, one orb draw is generated per step plus the first
+            spawn.
+        :param cells_per_spawn: Cells generated per orb draw, spawns on taken cells use up more
+            than one.
+        :return: The new bank.
+        """
+
+        free_cells = GridLayout.get(
+            conf.grid_rows, conf.grid_cols, conf.layout.obstacles, conf.layout.walls
+        ).FREE_CELLS
+        cell_dtype = (
+            np.uint16 if conf.grid_rows * conf.grid_cols <= 1 << 16 else np.int64
+        )
+        spawns = max_steps + 1
+
+        orb_draws = np.empty((len(seeds), spawns), np.uint16)
+        cells = np.empty((len(seeds), spawns * cells_per_spawn), cell_dtype)
+        for index, seed in enumerate(seeds):
+            rng = np.random.default_rng(seed)
+            orb_draws[index] = rng.integers(0, 1 << 16, spawns, dtype=np.uint16)
+            cells[index] = free_cells[rng.integers(0, len(free_cells), cells.shape[1])]
+
+        return cls(
+            np.asarray(seeds, np.int64),
+            orb_draws,
+            cells,
+            conf.grid_rows,
+            conf.grid_cols,
+            max_steps,
+            conf.layout,
+        )
+
+    @classmethod
+    def load(cls, path: str | Path) -> "ScenarioBank":
+        """
+        Load a bank saved with `save()`.
+
+        :param path: The `.npz` file.
+        :return: The loaded bank.
+        """
+
+        with np.load(path) as data:
+            grid_rows, grid_cols = data["grid_shape"].tolist()
+            return cls(
+                data["seeds"],
+                data["orb_draws"],
+                data["cells"],
+                grid_rows,
+                grid_cols,
+                int(data["max_steps"]),
+                LayoutConf(
+                    obstacles=data["obstacles"].tolist(),
+                    walls=data["walls"].tolist(),
+                ),
+            )
+
+    # ================= #
+    #        API        #
+    # ================= #
+
+    def __len__(self) -> int:
+        return len(self.SEEDS)
+
+    def save(self, path: str | Path) -> None:
+        """
+        Write the bank to a compressed `.npz` file.
+
+        :param path: The file to write.
+        """
+
+        np.savez_compressed(
+            path,
+            seeds=self.SEEDS,
+            orb_draws=self._ORB_DRAWS,
+            cells=self._CELLS,
+            grid_shape=np.array([self.GRID_ROWS, self.GRID_COLS]),
+            max_steps=np.array(self.MAX_STEPS),
+            obstacles=np.array(self.LAYOUT.obstacles, np.int64).reshape(-1, 2),
+            walls=np.array(self.LAYOUT.walls, np.int64).reshape(-1, 2, 2),
+        )
+
+    def get_spawn_source(self, index: int) -> ScheduledSpawnSource:
+        """
+        :param index: The scenario to replay.
+        :return: A fresh spawn source for one episode of the scenario.
+        """
+
+        return ScheduledSpawnSource(self._ORB_DRAWS[index], self._CELLS[index])
+
+    def check_fits(self, conf: GridWorldConf, max_steps: int) -> None:
+        """
+        :param conf: The grid world the bank should be played on.
+        :param max_steps: The episode length of the environment.
+        :raises ValueError: If the world's grid, layout or episode length differs from the bank's.
+        """
+
+        if (conf.grid_rows, conf.grid_cols) != (self.GRID_ROWS, self.GRID_COLS):
+            raise ValueError(
+                f"The scenario bank was made for a {self.GRID_ROWS}x{self.GRID_COLS} grid, "
+                f"not {conf.grid_rows}x{conf.grid_cols}"
+            )
+        if _get_layout_key(conf.layout) != _get_layout_key(self.LAYOUT):
+            raise ValueError(
+                "The scenario bank was made for other obstacles or walls than the world's"
+            )
+        if max_steps != self.MAX_STEPS:
+            raise ValueError(
+                f"The scenario bank was made for episodes of {self.MAX_STEPS} steps, "
+                f"not {max_steps}"
+            )
+
+
+def _get_layout_key(layout: LayoutConf) -> tuple:
+    # Obstacles and walls are sets, their order and the direction of a wall don't matter
+    return (
+        sorted(tuple(cell) for cell in layout.obstacles),
+        sorted(tuple(sorted(tuple(cell) for cell in wall)) for wall in layout.walls),
+    )
@@ -0,0 +1,92 @@
+import numpy as np
+from numpy.random import Generator
+from typing import Final
+from abc import ABC, abstractmethod
+
+
+class SpawnSource(ABC):
+    """
+    Supplies the random choices `GridWorld` makes when it spawns an orb: which of the ready orbs
+    spawns and which cells are tried for it. Cells are numbered row-major and drawn until a free
+    one comes up, so a single spawn may use several of them. A source without cells left makes the
+    world fall back to its first free cell.
+    """
+
+    @abstractmethod
+    def choose_orb(self, ready_orbs: int) -> int:
+        """
+        :param ready_orbs: The number of orbs that are ready to spawn.
+        :return: The index of the orb to spawn.
+        """
+
+    @abstractmethod
+    def next_cell(self) -> int | None:
+        """
+        :return: The next cell to try the spawn on, None once there are no cells left.
+        """
+
+
+class RandomSpawnSource(SpawnSource):
+    """
+    Draws the spawn choices from numpy generators. Environments pass separate orb and cell
+    streams (see `get_spawn_rngs()`), both may also be the same generator. Cells are drawn from
+    the free cells of the layout only, so blocked cells never cost a draw and the stream doesn't
+    depend on how many cells the layout blocks.
+    """
+
+    def __init__(self, orb_rng: Generator, cell_rng: Generator, free_cells: np.ndarray):
+        self._ORB_RNG: Final[Generator] = orb_rng
+        self._CELL_RNG: Final[Generator] = cell_rng
+        self._FREE_CELLS: Final[np.ndarray] = free_cells
+
+    def choose_orb(self, ready_orbs: int) -> int:
+        return int(self._ORB_RNG.integers(0, ready_orbs))
+
+    def next_cell(self) -> int:
+        return int(self._FREE_CELLS[self._CELL_RNG.integers(0, len(self._FREE_CELLS))])
+
+
+class ScheduledSpawnSource(SpawnSource):
+    """
+    Replays pregenerated spawn choices (see `ScenarioBank`) without any RNG calls.
+
+    Orb choices are stored as 16-bit fractions of the number of ready orbs, so one schedule stays
+    valid whatever orbs happen to be ready. Only the schedule is fixed, not the spawns themselves:
+    which orbs are ready and which cells are taken still depends on the agent's actions, but every
+    agent facing the same schedule draws from the same tape. Orb draws start over from the
+    beginning when they run out, cells don't: a tape of taken cells would be tried forever, so an
+    exhausted tape hands the spawn to the world's free-cell fallback instead.
+    """
+
+    # ================= #
+    #       Init        #
+    # ================= #
+
+    def __init__(self, orb_draws: np.ndarray, cells: np.ndarray):
+        if not len(orb_draws) or not len(cells):
+            raise ValueError("A spawn schedule needs at least one orb draw and cell")
+
+        # Plain lists are much faster than numpy for single lookups on the step path
+        self._ORB_DRAWS: Final[list[int]] = orb_draws.tolist()
+        self._CELLS: Final[list[int]] = cells.tolist()
+        self._orb_index = 0
+        self._cell_index = 0
+
+    # ================= #
+    #        API        #
+    # ================= #
+
+    def choose_orb(self, ready_orbs: int) -> int:
+        draw = self._ORB_DRAWS[self._orb_index]
+        self._orb_index = (self._orb_index + 1) % len(self._ORB_DRAWS)
+
+        return (draw * ready_orbs) >> 16
+
+    def next_cell(self) -> int | None:
+        if self._cell_index == len(self._CELLS):
+            return None
+
+        cell = self._CELLS[self._cell_index]
+        self._cell_index += 1
+
+        return cell
@@ -1,7 +1,11 @@
 from syn_grid.config.models import WorldConfig, ObsConfig
+from syn_grid.gymnasium.environment import SYNGridEnv
+from syn_grid.gymnasium.vector_env import SYNGridVectorEnv
 
 import gymnasium as gym
+from typing import Callable, Sequence
 from gymnasium import Env
+from gymnasium.vector import VectorEnv
 from gymnasium.envs.registration import registry, register
 from gymnasium.utils.env_checker import check_env
 
@@ -19,8 +23,11 @@ def register_env() -> None:
 def make(render_mode: str | None, run_conf: WorldConfig, obs_conf: ObsConfig) -> Env:
     """
     Creates the registered environment and check it for correctness, used when training or evaluating the agent.
+    The id is registered here as well, worker processes of the subprocess and shared memory vec
+    backends build their envs without running `register_env()` from the entry point.
     """
 
+    register_env()
     env = gym.make(
         "syn_grid-v0", render_mode=render_mode, run_conf=run_conf, obs_conf=obs_conf
     )
@@ -28,5 +35,40 @@ def make(render_mode: str | None, run_conf: WorldConfig, obs_conf: ObsConfig) ->
     return env
 
 
+def make_fast(
+    run_conf: WorldConfig | Sequence[WorldConfig],
+    obs_conf: ObsConfig,
+    render_mode: str | None = None,
+    num_envs: int | None = None,
+    wrappers: Sequence[Callable] = (),
+) -> Env | VectorEnv:
+    """
+    Creates the bare environment without going through `gym.make`, which stacks a passive env
+    checker and order enforcing wrapper on top of every env. Only the given wrappers are applied.
+
+    :param run_conf: The world configuration, or one per environment of the vector env.
+    :param obs_conf: The observation configuration.
+    :param render_mode: The render mode, only supported for a single environment.
+    :param num_envs: If given, a batched `SYNGridVectorEnv` with this many environments is created.
+    :param wrappers: Callables applied in order to the created env, e.g. wrapper classes.
+    :return: The environment, wrapped only by the given wrappers.
+    """
+
+    env: Env | VectorEnv
+    if num_envs is None:
+        if isinstance(run_conf, Sequence):
+            raise ValueError("Several world configs need a vector environment")
+        env = SYNGridEnv(run_conf, obs_conf, render_mode=render_mode)
+    else:
+        if render_mode is not None:
+            raise ValueError("The vector environment can't be rendered")
+        env = SYNGridVectorEnv(num_envs, run_conf, obs_conf)
+
+    for wrapper in wrappers:
+        env = wrapper(env)
+
+    return env
+
+
 def check_my_env(env: Env):
     check_env(env.unwrapped)
@@ -1,20 +1,47 @@
 import gymnasium as gym
+import numpy as np
+import time
+from typing import Any, Final
 from gymnasium import spaces
+from numpy.random import Generator, PCG64, SeedSequence
 
 from syn_grid.config.models import WorldConfig, ObsConfig
 from syn_grid.core.grid_world import GridWorld
+from syn_grid.core.scenario_bank import ScenarioBank
+from syn_grid.core.spawn_sources import RandomSpawnSource
+from syn_grid.core.orbs.orb_factory import OrbFactory
+from syn_grid.core.orbs.base_orb import BaseOrb
+from syn_grid.core.orbs.orb_meta import DirectType, SynergyType
 from syn_grid.gymnasium.action_space import DroidAction
 from syn_grid.gymnasium.observation_space.observation_handler import (
     ObservationHandler,
 )
-from syn_grid.rendering.pygame_renderer import PygameRenderer
+from syn_grid.utils.seeding import get_spawn_rngs
+
+# Info keys of the statistics added next to `info["episode"]` at the end of an episode, passed as
+# `info_keywords` to SB3's monitors so they end up in the monitor csv
+EPISODE_INFO_KEYWORDS: Final[tuple[str, ...]] = (
+    "episode_chains",
+    *(
+        f"episode_consumed_{orb_type.name.lower()}"
+        for orb_type in (*DirectType, *SynergyType)
+        if orb_type.value != 0
+    ),
+    "episode_despawns",
+    "episode_duration",
+)
 
 
 class SYNGridEnv(gym.Env):
     """
     SYNGrid reinforcement learning environment.
 
-    A discrete grid-world environment for benchmarking single-agent RL.
+    A discrete grid-world environment for benchmarking single-agent RL. Worlds with several
+    droids are rejected, those are played through `SYNGridParallelEnv`.
+
+    Running steps return an empty info, the episode statistics are added once the episode is over.
+    The action mask is always available through `action_masks()`, with `info_action_mask` it is
+    also added to every info as `info["action_mask"]`.
     """
 
     # ================= #
@@ -33,9 +60,21 @@ class SYNGridEnv(gym.Env):
         run_conf: WorldConfig,
         obs_conf: ObsConfig,
         render_mode: str | None = None,
+        info_action_mask: bool = False,
     ):
+        self._check_single_droid(run_conf)
+        ObservationHandler.check_fits_observation(run_conf, obs_conf)
+
         # Set up bench environment;
         self.render_mode = render_mode
+        self._run_conf = run_conf
+        self._obs_conf = obs_conf
+        self._pending_reconfiguration: (
+            tuple[WorldConfig, ObsConfig, ObservationHandler, spaces.Space] | None
+        ) = None
+        self._scenario_bank: ScenarioBank | None = None
+        self._INFO_ACTION_MASK: Final[bool] = info_action_mask
+        self._spawn_rngs: tuple[Generator, Generator] | None = None
         self.world = GridWorld(
             run_conf.grid_world_conf,
             run_conf.orb_factory_conf,
@@ -45,9 +84,7 @@ class SYNGridEnv(gym.Env):
         )
 
         if self.render_mode == "human":
-            self.renderer = PygameRenderer(
-                run_conf.renderer_conf, self.metadata["render_fps"]
-            )
+            self._make_renderer(run_conf)
 
         # Set up Gymnasium environment:
 
@@ -67,43 +104,240 @@ class SYNGridEnv(gym.Env):
     # ======================== #
 
     def reset(self, *, seed=None, options=None):
+        self.reset_world(seed, (options or {}).get("scenario"))
+
+        if self.render_mode == "human":
+            self.render()
+
+        self.observe()
+
+        # Return observation and info
+        info: dict[str, Any] = {}
+        if self._INFO_ACTION_MASK:
+            info["action_mask"] = self.action_masks()
+        return self.obs, info
+
+    def step(self, action: int):
+        reward, terminated, truncated = self.step_world(action)
+
+        if self.render_mode == "human":
+            self.render()
+
+        self.observe()
+
+        info: dict[str, Any] = (
+            self.get_episode_info() if terminated or truncated else {}
+        )
+        if self._INFO_ACTION_MASK:
+            info["action_mask"] = self.action_masks()
+
+        # Return observation, reward, terminated, truncated and info
+        return self.obs, reward, terminated, truncated, info
+
+    # ================= #
+    #        API        #
+    # ================= #
+
+    def reconfigure(
+        self, run_conf: WorldConfig, obs_conf: ObsConfig | None = None
+    ) -> None:
+        """
+        Change the configuration of the live environment, e.g. rewards, spawn weights, cooldowns or
+        the grid size. The change is validated right away and applied at the next reset, so it is
+        safe to call mid-episode. The orb pool and observation buffers are reused where possible.
+
+        The observation layout (shape and dtype) must stay the same so agents and vectorized
+        wrappers built for this env stay valid. To vary the grid size, size the observation for the
+        largest grid.
+
+        :param run_conf: The new world config.
+        :param obs_conf: The new observation config, or None to keep the current one.
+        :raises ValueError: If the new configs would change the observation layout, the world
+            doesn't fit the observation or has more than one droid.
+        """
+
+        self._check_single_droid(run_conf)
+        obs_conf = obs_conf if obs_conf is not None else self._obs_conf
+        ObservationHandler.check_fits_observation(run_conf, obs_conf)
+        pool_size = OrbFactory(
+            run_conf.orb_factory_conf,
+            run_conf.negative_orb_conf,
+            run_conf.tier_orb_conf,
+        ).get_pool_size()
+
+        handler = self._observation_handler
+        space = self.observation_space
+        if obs_conf != self._obs_conf or pool_size != len(self.world.ALL_ORBS):
+            handler = ObservationHandler(obs_conf, pool_size)
+            space = handler.setup_obs_space()
+            ObservationHandler.check_same_layout(self.observation_space, space)
+
+        self._pending_reconfiguration = (run_conf, obs_conf, handler, space)
+
+    def reset_world(
+        self, seed: int | SeedSequence | None = None, scenario: int | None = None
+    ) -> None:
+        """
+        Reset the world without building an observation. `reset()` is this plus the observation,
+        vectorized envs call it directly and observe all worlds at once.
+
+        Seeding derives independent streams for the world, the orb selection and the spawn cells
+        from one `SeedSequence` (see `syn_grid.utils.seeding`), they carry on across unseeded
+        resets.
+
+        :param seed: Seed for the environment's random generators, either an int or a seed
+            sequence, e.g. one of `get_env_seed_sequences()`.
+        :param scenario: Index of the scenario of the bank set with `use_scenario_bank()` whose
+            spawns to replay, passed to `reset()` as `options={"scenario": index}`. Without a seed
+            the scenario's own seed is used.
+        :raises ValueError: If a scenario is requested but no bank is set.
+        """
+
+        spawn_source = None
+        if scenario is not None:
+            if self._scenario_bank is None:
+                raise ValueError("Set a scenario bank before resetting to a scenario")
+            if seed is None:
+                seed = int(self._scenario_bank.SEEDS[scenario])
+            spawn_source = self._scenario_bank.get_spawn_source(scenario)
+
         # Gymnasium requires this call to control randomness and reproduce scenarios.
-        super().reset(seed=seed)
+        if isinstance(seed, SeedSequence):
+            super().reset()
+            self.np_random = Generator(PCG64(seed))
+        else:
+            super().reset(seed=seed)
+        if seed is not None or self._spawn_rngs is None:
+            self._spawn_rngs = get_spawn_rngs(self.np_random)
+
+        if self._pending_reconfiguration is not None:
+            self._apply_reconfiguration(*self._pending_reconfiguration)
+        if spawn_source is not None:
+            self._scenario_bank.check_fits(  # type: ignore[union-attr]
+                self._run_conf.grid_world_conf,
+                self._obs_conf.observation_handler.max_steps,
+            )
 
         # Reset the environment.
-        self.world.reset(self.np_random)
+        if spawn_source is None:
+            spawn_source = RandomSpawnSource(
+                *self._spawn_rngs, self.world.LAYOUT.FREE_CELLS
+            )
+        self.world.reset(self.np_random, spawn_source)
         self._observation_handler.reset()
 
-        if self.render_mode == "human":
-            self.render()
+        self._episode_return = 0.0
+        self._episode_length = 0
+        self._episode_start = time.perf_counter()
 
-        self.obs = self._observation_handler.get_observation(self.world)
+    def use_scenario_bank(self, bank: ScenarioBank | None) -> None:
+        """
+        Set the bank that `reset(options={"scenario": index})` replays scenarios from, so every
+        agent evaluated on it sees the same spawn schedules. Resets without a scenario keep
+        sampling spawns from the environment's generator.
 
-        # Return observation and info (not used)
-        return self.obs, {}
+        :param bank: The scenario bank, or None to remove it.
+        """
+
+        self._scenario_bank = bank
+
+    def step_world(self, action: int) -> tuple[float, bool, bool]:
+        """
+        Advance the world by one action without building an observation.
+
+        :param action: The droid action to perform.
+        :return: The reward and whether the episode terminated or was truncated.
+        """
 
-    def step(self, action: int):
         # Perform action and adjust variables affected by it
         reward = self.world.perform_agent_action(DroidAction(action))
         self._observation_handler.steps_left -= 1
 
-        terminated, reward = self._check_episode_end(False, reward)
+        reward, terminated, truncated = self._check_episode_end(reward)
+        self._episode_return += reward
+        self._episode_length += 1
 
-        if self.render_mode == "human":
-            self.render()
+        return reward, terminated, truncated
+
+    def observe(self) -> np.ndarray | dict[str, np.ndarray]:
+        """
+        Build the observation of the current world state, e.g. after stepping it with
+        `step_world()`.
+
+        :return: The observation.
+        """
 
         self.obs = self._observation_handler.get_observation(self.world)
+        return self.obs
 
-        # Return observation, reward, terminated, truncated and info (TODO: truncated and info is
-        # not used now, but maybe add info at termination so result can be persisted in the eval()
-        # method)
-        return (
-            self.obs,
-            reward,
-            terminated,
-            False,
-            {},
-        )
+    def get_orb_slots(self) -> list[BaseOrb | None]:
+        """
+        Which orb each orb slot of the current observation shows, see
+        `BasePerception.get_orb_slots()`.
+
+        :return: One entry per slot, None for empty slots, empty if the perception has no slots.
+        """
+
+        return self._observation_handler.perception.get_orb_slots(self.world)
+
+    @property
+    def orb_slot_count(self) -> int:
+        return self._observation_handler.perception.get_orb_slot_count()
+
+    def action_masks(self) -> np.ndarray:
+        """
+        Which actions move the droid, moves into the border, an obstacle or a wall are masked out.
+        Used by sb3-contrib's `MaskablePPO`, envs built with `info_action_mask` also pass it through
+        `info["action_mask"]`.
+
+        :return: A read-only boolean mask indexed by `DroidAction.value`.
+        """
+
+        return self.world.get_action_mask()
+
+    def get_episode_info(self) -> dict[str, Any]:
+        """
+        Statistics of the current episode, `step()` adds them to the info once the episode is over.
+        `info["episode"]` holds the return (`r`) and length (`l`) under the keys of SB3's
+        `Monitor`, so SB3 picks them up on its own. The other statistics have their own keys (see
+        `EPISODE_INFO_KEYWORDS`), since SB3's monitors replace `info["episode"]` with theirs.
+
+        :return: The info entries: `episode`, the completed tier chains, the orbs consumed per type,
+            the de-spawned orbs and the episode's wall time in seconds.
+        """
+
+        info: dict[str, Any] = {
+            "episode": {"r": self._episode_return, "l": self._episode_length},
+            "episode_chains": sum(
+                droid.DIGESTION_ENGINE.completed_chains for droid in self.world.DROIDS
+            ),
+        }
+        for orb_type, count in self.world.consumed_orbs.items():
+            info[f"episode_consumed_{orb_type.name.lower()}"] = count
+        info["episode_despawns"] = self.world.despawned_orbs
+        info["episode_duration"] = round(time.perf_counter() - self._episode_start, 6)
+
+        return info
+
+    @property
+    def steps_left(self) -> int:
+        return self._observation_handler.steps_left
+
+    @property
+    def run_conf(self) -> WorldConfig:
+        return self._run_conf
+
+    @property
+    def obs_conf(self) -> ObsConfig:
+        return self._obs_conf
+
+    def get_dequantization_params(self) -> dict:
+        """
+        Affine parameters that map compact (uint8/float16) observations back to float32, used by
+        `DequantizeExtractor`. See `ObservationHandler.get_dequantization_params()`.
+        """
+
+        return self._observation_handler.get_dequantization_params()
 
     def render(self) -> None:
         self.renderer.render(
@@ -119,6 +353,55 @@ class SYNGridEnv(gym.Env):
     #       Helpers      #
     # ================== #
 
+    # === Init === #
+
+    @staticmethod
+    def _check_single_droid(run_conf: WorldConfig) -> None:
+        # Only the first droid would act, the others would just stand in the way of spawns
+        num_droids = run_conf.grid_world_conf.num_droids
+        if num_droids != 1:
+            raise ValueError(
+                f"SYNGridEnv plays a single droid, not {num_droids}, use SYNGridParallelEnv "
+                "for several droids"
+            )
+
+    def _make_renderer(self, run_conf: WorldConfig) -> None:
+        # Imported here so headless environments never load pygame
+        from syn_grid.rendering.pygame_renderer import PygameRenderer
+
+        self.renderer = PygameRenderer(
+            run_conf.renderer_conf, self.metadata["render_fps"]
+        )
+
+    # === API === #
+
+    def _apply_reconfiguration(
+        self,
+        run_conf: WorldConfig,
+        obs_conf: ObsConfig,
+        handler: ObservationHandler,
+        space: spaces.Space,
+    ) -> None:
+        self.world.reconfigure(
+            run_conf.grid_world_conf,
+            run_conf.orb_factory_conf,
+            run_conf.droid_conf,
+            run_conf.negative_orb_conf,
+            run_conf.tier_orb_conf,
+        )
+
+        self._observation_handler = handler
+        self.observation_space = space
+
+        if self.render_mode == "human" and (
+            run_conf.renderer_conf != self._run_conf.renderer_conf
+        ):
+            self._make_renderer(run_conf)
+
+        self._run_conf = run_conf
+        self._obs_conf = obs_conf
+        self._pending_reconfiguration = None
+
     # === Gymnasium contract === #
 
     def _get_hud_data(self) -> dict[str, int | float]:
@@ -130,15 +413,21 @@ class SYNGridEnv(gym.Env):
 
         return hud_data
 
-    def _check_episode_end(
-        self, terminated: bool, reward: float
-    ) -> tuple[bool, float]:
+    def _check_episode_end(self, reward: float) -> tuple[float, bool, bool]:
+        handler = self._observation_handler
+
         if self.world.DROID.score <= 0:
-            terminated = True
-            reward -= self._observation_handler.steps_left
+            return reward - handler.steps_left, True, False
 
-        if (self._observation_handler.steps_left <= 0) and not terminated:
-            terminated = True
-            reward += self.world.DROID.score
+        if handler.steps_left <= 0:
+            if handler.TIME_LIMIT_BONUS:
+                reward += self.world.DROID.score
+
+            # A time limit isn't part of the task when truncating, learners bootstrap past it
+            return (
+                reward,
+                not handler.TRUNCATE_AT_MAX_STEPS,
+                handler.TRUNCATE_AT_MAX_STEPS,
+            )
 
-        return terminated, reward
+        return reward, False, False
@@ -6,42 +6,254 @@ from syn_grid.gymnasium.observation_space.perceptions.vector import (
     MediumVectorPerception,
     HardVectorPerception,
 )
-from syn_grid.config.models import ObsConfig
+from syn_grid.gymnasium.observation_space.perceptions.composite import (
+    EasyCompositePerception,
+    MediumCompositePerception,
+    HardCompositePerception,
+)
+from syn_grid.gymnasium.observation_space.perceptions.egocentric import (
+    EgocentricPerception,
+)
+from syn_grid.gymnasium.observation_space.perceptions.entity import (
+    EntityPerception,
+)
+from syn_grid.config.models import ObsConfig, WorldConfig
 from syn_grid.core.grid_world import GridWorld
 
 import numpy as np
 from gymnasium import spaces
-from typing import Final, Type
+from typing import Final, Sequence, Type
 
 PERCEPTIONS = {
     "vector_easy": EasyVectorPerception,
     "vector_medium": MediumVectorPerception,
     "vector_hard": HardVectorPerception,
+    "composite_easy": EasyCompositePerception,
+    "composite_medium": MediumCompositePerception,
+    "composite_hard": HardCompositePerception,
+    "egocentric": EgocentricPerception,
+    "entity": EntityPerception,
+}
+
+OBS_DTYPES = {
+    "float32": np.float32,
+    "float16": np.float16,
+    "uint8": np.uint8,
 }
 
 
 class ObservationHandler:
+    # The top uint8 code is left unused so SB3 doesn't mistake quantized (H, W, C) observations for
+    # images, which it would transpose and rescale on its own.
+    _UINT8_MAX_CODE: Final[int] = 254
+
     # ================= #
     #       Init        #
     # ================= #
 
     def __init__(self, conf: ObsConfig, orbs: int) -> None:
         self._max_steps: Final[int] = conf.observation_handler.max_steps
+        self.TRUNCATE_AT_MAX_STEPS: Final[bool] = (
+            conf.observation_handler.truncate_at_max_steps
+        )
+        self.TIME_LIMIT_BONUS: Final[bool] = (
+            conf.observation_handler.time_limit_reward == "score"
+        )
+        self._OBS_DTYPE: Final[type] = OBS_DTYPES[conf.observation_handler.obs_dtype]
         perception_type: Type[BasePerception] = PERCEPTIONS[
             conf.observation_handler.perception
         ]
         self.perception: Final[BasePerception] = perception_type(conf.perception, orbs)
+        self._batch_scratch: np.ndarray | None = None
 
     # ================= #
     #        API        #
     # ================= #
 
     def setup_obs_space(self) -> spaces.Space:
-        return self.perception.setup_obs_space()
+        space = self.perception.setup_obs_space()
+        self._perception_space: spaces.Space = space
+
+        if self._OBS_DTYPE == np.float32:
+            return space
+
+        # Quantization parameters per Box, keyed by the dict key (None for plain Box spaces)
+        self._quantization: dict[str | None, tuple[np.ndarray, np.ndarray]] = {}
+
+        if isinstance(space, spaces.Dict):
+            return spaces.Dict(
+                {key: self._compact_box(sub, key) for key, sub in space.spaces.items()}
+            )
+
+        return self._compact_box(space, None)
 
     def reset(self) -> None:
         self.steps_left: int = self._max_steps
         self.perception.reset()
 
-    def get_observation(self, state: GridWorld) -> np.ndarray:
-        return self.perception.get_observation(state, self.steps_left)
+    def get_observation(self, state: GridWorld) -> np.ndarray | dict[str, np.ndarray]:
+        obs = self.perception.get_observation(state, self.steps_left)
+
+        if self._OBS_DTYPE == np.float32:
+            return obs
+
+        if isinstance(obs, dict):
+            return {key: self._encode(val, key) for key, val in obs.items()}
+
+        return self._encode(obs, None)
+
+    def fill_batch(
+        self, worlds: Sequence[GridWorld], steps_left: np.ndarray, out: np.ndarray
+    ) -> np.ndarray:
+        """
+        Write the observations of several worlds into the rows of `out`, in the configured dtype.
+        Only valid after `setup_obs_space()` and for Box observation spaces.
+
+        :param worlds: The worlds to observe, one per row of `out`.
+        :param steps_left: The steps left in the episode of each world.
+        :param out: A `(len(worlds), *obs_shape)` array that receives the observations.
+        :return: The filled `out` array.
+        """
+
+        if self._OBS_DTYPE == np.float32:
+            return self.perception.fill_batch(worlds, steps_left, out)
+
+        # Compact dtypes are built in float32 first, the scratch array is reused between calls
+        scratch_shape = (len(worlds), *self._perception_space.shape)  # type: ignore[misc]
+        if self._batch_scratch is None or self._batch_scratch.shape != scratch_shape:
+            self._batch_scratch = np.empty(scratch_shape, np.float32)
+
+        self.perception.fill_batch(worlds, steps_left, self._batch_scratch)
+        out[:] = self._encode(self._batch_scratch, None)
+
+        return out
+
+    def reset_batch_entry(self, index: int) -> None:
+        self.perception.reset_batch_entry(index)
+
+    @staticmethod
+    def check_fits_observation(run_conf: WorldConfig, obs_conf: ObsConfig) -> None:
+        """
+        Check that a world fits the bounds the perception is sized for. Smaller worlds are padded,
+        larger ones would overflow the observation or leave its space.
+
+        :param run_conf: The world config.
+        :param obs_conf: The observation config.
+        :raises ValueError: If the world is larger than the perception.
+        """
+
+        perception = obs_conf.perception
+        too_large = run_conf.orb_factory_conf.max_tier > perception.max_tier
+        if not PERCEPTIONS[obs_conf.observation_handler.perception].FITS_ANY_GRID:
+            too_large = too_large or (
+                run_conf.grid_world_conf.grid_rows > perception.grid_rows
+                or run_conf.grid_world_conf.grid_cols > perception.grid_cols
+                or run_conf.grid_world_conf.max_active_orbs > perception.max_active_orbs
+            )
+
+        if too_large:
+            raise ValueError(
+                "The world config doesn't fit the observation, size the perception for the "
+                "largest world (see fit_obs_to_worlds())"
+            )
+
+    @staticmethod
+    def check_same_layout(space: spaces.Space, new_space: spaces.Space) -> None:
+        """
+        Check that a new observation space has the same layout (keys, shapes and dtypes) as the
+        current one, bounds may differ.
+
+        :param space: The current observation space.
+        :param new_space: The observation space that would replace it.
+        :raises ValueError: If the layouts differ.
+        """
+
+        if isinstance(space, spaces.Dict) and isinstance(new_space, spaces.Dict):
+            if space.spaces.keys() == new_space.spaces.keys():
+                for key, sub_space in space.spaces.items():
+                    ObservationHandler.check_same_layout(sub_space, new_space[key])
+                return
+        elif (
+            type(space) is type(new_space)
+            and space.shape == new_space.shape
+            and space.dtype == new_space.dtype
+        ):
+            return
+
+        raise ValueError(
+            f"The observation layout can't change, got {new_space} instead of {space}"
+        )
+
+    def get_dequantization_params(
+        self,
+    ) -> dict[str, np.ndarray] | dict[str, dict[str, np.ndarray]]:
+        """
+        Return the affine parameters that map compact observations back to float32 values. Only
+        valid after `setup_obs_space()`.
+
+        A float32 value is recovered as `code * scale + offset`. For dict observations the
+        parameters are nested under each key.
+
+        :return: A dict with `scale` and `offset` arrays, or a dict of those per observation key.
+        """
+
+        space = self._perception_space
+
+        if isinstance(space, spaces.Dict):
+            return {
+                key: self._get_box_dequantization(sub, key)
+                for key, sub in space.spaces.items()
+            }
+
+        return self._get_box_dequantization(space, None)
+
+    # ================= #
+    #      Helpers      #
+    # ================= #
+
+    # === Init === #
+
+    def _compact_box(self, space: spaces.Space, key: str | None) -> spaces.Box:
+        if not isinstance(space, spaces.Box):
+            raise TypeError("Compact observation dtypes require Box observation spaces")
+
+        if self._OBS_DTYPE == np.float16:
+            return spaces.Box(
+                low=space.low.astype(np.float16),
+                high=space.high.astype(np.float16),
+                shape=space.shape,
+                dtype=np.float16,
+            )
+
+        if not (np.all(np.isfinite(space.low)) and np.all(np.isfinite(space.high))):
+            raise ValueError("uint8 observations require finite observation bounds")
+
+        low = space.low.astype(np.float32)
+        value_range = np.maximum(space.high - space.low, np.finfo(np.float32).eps)
+        self._quantization[key] = (low, (self._UINT8_MAX_CODE / value_range))
+
+        return spaces.Box(
+            low=0, high=self._UINT8_MAX_CODE, shape=space.shape, dtype=np.uint8
+        )
+
+    # === API === #
+
+    def _encode(self, values: np.ndarray, key: str | None) -> np.ndarray:
+        if self._OBS_DTYPE == np.float16:
+            return values.astype(np.float16)
+
+        low, inv_step = self._quantization[key]
+        codes = np.rint((values - low) * inv_step)
+        return np.clip(codes, 0, self._UINT8_MAX_CODE).astype(np.uint8)
+
+    def _get_box_dequantization(
+        self, space: spaces.Space, key: str | None
+    ) -> dict[str, np.ndarray]:
+        if self._OBS_DTYPE == np.uint8:
+            low, inv_step = self._quantization[key]
+            return {"scale": (1.0 / inv_step).astype(np.float32), "offset": low}
+
+        return {
+            "scale": np.ones(space.shape, dtype=np.float32),
+            "offset": np.zeros(space.shape, dtype=np.float32),
+        }
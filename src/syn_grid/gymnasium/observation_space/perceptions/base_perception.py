@@ -6,10 +6,14 @@ from syn_grid.core.grid_world import GridWorld
 import numpy as np
 from abc import ABC, abstractmethod
 from gymnasium import spaces
-from typing import Final
+from typing import Final, Sequence
 
 
 class BasePerception(ABC):
+    # Whether worlds larger than the configured grid or with more active orbs still fit the
+    # observation, e.g. because it only shows a fixed window around the droid
+    FITS_ANY_GRID: bool = False
+
     # ================= #
     #        Init       #
     # ================= #
@@ -30,7 +34,63 @@ class BasePerception(ABC):
         self._MAX_CATEGORY: Final[int] = len(OrbCategory) - 1
         self._MAX_TYPE: Final[int] = max(len(DirectType) - 1, len(SynergyType) - 1)
         self._MAX_TIER: Final[int] = conf.max_tier
-        self._MAX_ORB_LIFESPAN: Final[int] = BaseOrb._LIFE_SPAN
+        self._MAX_ORB_LIFESPAN: Final[int] = BaseOrb.get_life_span(
+            conf.grid_rows, conf.grid_cols
+        )
+        self._OBSERVE_REACHABILITY: Final[bool] = conf.observe_reachability
+
+    # ================= #
+    #        API        #
+    # ================= #
+
+    def fill_batch(
+        self, worlds: Sequence[GridWorld], steps_left: np.ndarray, out: np.ndarray
+    ) -> np.ndarray:
+        """
+        Write the observations of several worlds straight into the rows of a caller-owned array.
+
+        By default every observation is built on its own and copied into its row. Perceptions that
+        can work across worlds override this and skip the per-world arrays entirely.
+
+        :param worlds: The worlds to observe, one per row of `out`.
+        :param steps_left: The steps left in the episode of each world.
+        :param out: A `(len(worlds), *obs_shape)` array that receives the observations.
+        :return: The filled `out` array.
+        """
+
+        for index, world in enumerate(worlds):
+            obs = self.get_observation(world, int(steps_left[index]))
+            if isinstance(obs, dict):
+                raise TypeError("Batched observations require Box observation spaces")
+            out[index] = obs
+
+        return out
+
+    def reset_batch_entry(self, index: int) -> None:
+        """
+        Forget any state kept for row `index` of `fill_batch()`, called when that world resets.
+
+        :param index: The row of the world that was reset.
+        """
+
+    def get_orb_slot_count(self) -> int:
+        """
+        :return: The number of orb slots of the observation, 0 if the perception doesn't show
+            orbs in slots, e.g. because it places them on a grid.
+        """
+
+        return 0
+
+    def get_orb_slots(self, state: GridWorld) -> list[BaseOrb | None]:
+        """
+        Which orb each slot of the last observation of `state` shows, so layers such as
+        `OrbOptions` can refer to orbs the way the agent sees them.
+
+        :param state: The observed world.
+        :return: One entry per slot, None for empty slots.
+        """
+
+        return []
 
     # ================= #
     #      Helpers      #
@@ -54,6 +114,17 @@ class BasePerception(ABC):
     def _get_max_orb_data(self) -> list[int]:
         return [self._MAX_ORB_LIFESPAN]
 
+    def _get_max_orb_reachability(self) -> list[int]:
+        # Droid-to-orb distance and whether the orb can be reached before it de-spawns
+        return [self._MAX_ORB_LIFESPAN, 1]
+
+    def _get_orb_reachability(self, state: GridWorld, orb: BaseOrb) -> tuple[int, int]:
+        distance = state.get_orb_distance(orb)
+        reachable = int(state.can_reach_orb(orb, distance))
+
+        # Unreachable orbs report the largest observable distance
+        return min(distance, self._MAX_ORB_LIFESPAN), reachable
+
     # ================= #
     #  Abstract methods #
     # ================= #
@@ -65,4 +136,6 @@ class BasePerception(ABC):
     def setup_obs_space(self) -> spaces.Space: ...
 
     @abstractmethod
-    def get_observation(self, state: GridWorld, steps_left: int) -> np.ndarray: ...
+    def get_observation(
+        self, state: GridWorld, steps_left: int
+    ) -> np.ndarray | dict[str, np.ndarray]: ...
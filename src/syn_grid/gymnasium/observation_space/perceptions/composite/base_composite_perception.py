@@ -0,0 +1,145 @@
+from syn_grid.gymnasium.observation_space.perceptions.base_perception import (
+    BasePerception,
+)
+from syn_grid.config.models import PerceptionConf
+from syn_grid.core.grid_world import GridWorld
+from syn_grid.core.orbs.base_orb import BaseOrb
+
+import numpy as np
+from gymnasium import spaces
+from typing import Final
+
+
+class BaseCompositePerception(BasePerception):
+    """
+    Spatial grid plus a vector of global values, stored in one contiguous float32 buffer.
+
+    The observation is a dict with a `grid` (H, W, C) and a `global` entry. Both are views into the
+    same buffer which is rewritten in place every step, so no arrays or dicts are created after
+    `setup_obs_space()`. With `flatten` enabled in the perception config the buffer itself is
+    returned as a single Box, laid out as the flattened grid followed by the global values.
+
+    Subclasses decide how much information is exposed through the two class flags below. With
+    `observe_reachability` the orb planes also get the droid-to-orb distance and whether the orb
+    can be reached before it de-spawns.
+    """
+
+    _OBSERVE_ORB_LIFE: bool
+    _OBSERVE_TIER_CHAIN: bool
+
+    # ================= #
+    #        Init       #
+    # ================= #
+
+    def __init__(self, conf: PerceptionConf, orbs: int) -> None:
+        super().__init__(conf, orbs)
+        self._FLATTEN: Final[bool] = conf.flatten
+
+    # ================= #
+    #        API        #
+    # ================= #
+
+    def reset(self) -> None: ...
+
+    def setup_obs_space(self) -> spaces.Space:
+        channel_max_vals = [1, *self._get_max_orb_identity()]
+        if self._OBSERVE_ORB_LIFE:
+            channel_max_vals.extend(self._get_max_orb_data())
+        if self._OBSERVE_REACHABILITY:
+            channel_max_vals.extend(self._get_max_orb_reachability())
+
+        global_max_vals = [*self._get_max_global_values(), self._MAX_SCORE]
+        if self._OBSERVE_TIER_CHAIN:
+            global_max_vals.append(self._MAX_TIER_CHAIN)
+
+        self._ROWS = self._MAX_GRID_Y + 1
+        self._COLS = self._MAX_GRID_X + 1
+        self._CHANNELS = len(channel_max_vals)
+        self._GRID_SIZE = self._ROWS * self._COLS * self._CHANNELS
+
+        # Scale factors used to normalize raw values, guarded against zero maxima (e.g. 1x1 grids)
+        self._CHANNEL_SCALE = 1.0 / np.maximum(
+            np.asarray(channel_max_vals[1:], dtype=np.float32), 1.0
+        )
+        self._GLOBAL_SCALE = 1.0 / np.maximum(
+            np.asarray(global_max_vals, dtype=np.float32), 1.0
+        )
+
+        # One buffer, two views: nothing is concatenated or rebuilt per step
+        self._buffer = np.zeros(self._GRID_SIZE + len(global_max_vals), np.float32)
+        self._grid = self._buffer[: self._GRID_SIZE].reshape(
+            self._ROWS, self._COLS, self._CHANNELS
+        )
+        self._global = self._buffer[self._GRID_SIZE :]
+        self._obs = {"grid": self._grid, "global": self._global}
+
+        if self._FLATTEN:
+            return spaces.Box(
+                low=0.0, high=1.0, shape=self._buffer.shape, dtype=np.float32
+            )
+
+        return spaces.Dict(
+            {
+                "grid": spaces.Box(
+                    low=0.0, high=1.0, shape=self._grid.shape, dtype=np.float32
+                ),
+                "global": spaces.Box(
+                    low=0.0, high=1.0, shape=self._global.shape, dtype=np.float32
+                ),
+            }
+        )
+
+    def get_observation(
+        self, state: GridWorld, steps_left: int
+    ) -> np.ndarray | dict[str, np.ndarray]:
+        self._grid.fill(0.0)
+
+        # Droid plane
+        droid_y, droid_x = state.DROID.position
+        self._grid[droid_y, droid_x, 0] = 1.0
+
+        # Orb planes
+        for orb in state.ALL_ORBS:
+            if orb.is_active:
+                y, x = orb.position
+                self._grid[y, x, 1:] = self._CHANNEL_SCALE * self._get_orb_values(
+                    state, orb
+                )
+
+        # Global values
+        self._global[0] = steps_left
+        self._global[1] = min(max(state.DROID.score, 0.0), self._MAX_SCORE)
+        if self._OBSERVE_TIER_CHAIN:
+            self._global[2] = state.DROID.DIGESTION_ENGINE.chained_tiers
+        self._global *= self._GLOBAL_SCALE
+
+        if self._FLATTEN:
+            return self._buffer
+
+        return self._obs
+
+    def get_flat_observation(self) -> np.ndarray:
+        """
+        Return the contiguous buffer behind the latest observation, without copying.
+
+        :return: The flattened grid followed by the global values.
+        """
+
+        return self._buffer
+
+    # ================= #
+    #      Helpers      #
+    # ================= #
+
+    def _get_orb_values(self, state: GridWorld, orb: BaseOrb) -> tuple[int, ...]:
+        values: tuple[int, ...] = (
+            orb.META.CATEGORY.value,
+            orb.META.TYPE.value,
+            orb.META.TIER,
+        )
+        if self._OBSERVE_ORB_LIFE:
+            values += (orb.TIMER.remaining,)
+        if self._OBSERVE_REACHABILITY:
+            values += self._get_orb_reachability(state, orb)
+
+        return values
@@ -1,6 +1,13 @@
-from syn_grid.gymnasium.observation_space.perceptions.base_perception import (
-    BasePerception,
+from syn_grid.gymnasium.observation_space.perceptions.composite.base_composite_perception import (
+    BaseCompositePerception,
 )
 
 
-class EasyCompositePerception(BasePerception): ...
+class EasyCompositePerception(BaseCompositePerception):
+    """
+    Composite perception with everything exposed: orb identity and remaining life in the grid,
+    steps left, score and the current tier chain in the global vector.
+    """
+
+    _OBSERVE_ORB_LIFE = True
+    _OBSERVE_TIER_CHAIN = True
@@ -1,6 +1,13 @@
-from syn_grid.gymnasium.observation_space.perceptions.base_perception import (
-    BasePerception,
+from syn_grid.gymnasium.observation_space.perceptions.composite.base_composite_perception import (
+    BaseCompositePerception,
 )
 
 
-class HardCompositePerception(BasePerception): ...
+class HardCompositePerception(BaseCompositePerception):
+    """
+    Composite perception without orb lifetimes or the tier chain, so the agent has to remember
+    which tiers it has already consumed.
+    """
+
+    _OBSERVE_ORB_LIFE = False
+    _OBSERVE_TIER_CHAIN = False
@@ -1,6 +1,12 @@
-from syn_grid.gymnasium.observation_space.perceptions.base_perception import (
-    BasePerception,
+from syn_grid.gymnasium.observation_space.perceptions.composite.base_composite_perception import (
+    BaseCompositePerception,
 )
 
 
-class MediumCompositePerception(BasePerception): ...
+class MediumCompositePerception(BaseCompositePerception):
+    """
+    Composite perception without orb lifetimes. The agent still sees its current tier chain.
+    """
+
+    _OBSERVE_ORB_LIFE = False
+    _OBSERVE_TIER_CHAIN = True
@@ -0,0 +1 @@
+from .egocentric_perception import EgocentricPerception
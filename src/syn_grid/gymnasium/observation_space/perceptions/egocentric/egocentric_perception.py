@@ -0,0 +1,126 @@
+from syn_grid.gymnasium.observation_space.perceptions.base_perception import (
+    BasePerception,
+)
+from syn_grid.config.models import PerceptionConf
+from syn_grid.core.grid_world import GridWorld
+
+import numpy as np
+from gymnasium import spaces
+from typing import Final
+
+
+class EgocentricPerception(BasePerception):
+    """
+    Fixed k×k window centered on the droid plus a vector of global values.
+
+    The window is sliced from the world's `ORB_GRID` and blocked cells, so neither its size nor
+    the work per step depends on the grid size or the orb pool. Cells outside the grid are padded
+    as blocked. Channels are: blocked, orb category, orb type, orb tier and remaining orb life.
+    Like the composite perceptions, the observation is a dict of views into one buffer, or the
+    buffer itself with `flatten` enabled.
+    """
+
+    FITS_ANY_GRID = True
+
+    # ================= #
+    #        Init       #
+    # ================= #
+
+    def __init__(self, conf: PerceptionConf, orbs: int) -> None:
+        super().__init__(conf, orbs)
+        self._FLATTEN: Final[bool] = conf.flatten
+        self._SIZE: Final[int] = conf.window_size
+        self._RADIUS: Final[int] = conf.window_size // 2
+
+    # ================= #
+    #        API        #
+    # ================= #
+
+    def reset(self) -> None: ...
+
+    def setup_obs_space(self) -> spaces.Space:
+        channel_max_vals = [
+            1,
+            *self._get_max_orb_identity(),
+            *self._get_max_orb_data(),
+        ]
+        global_max_vals = [
+            *self._get_max_global_values(),
+            self._MAX_SCORE,
+            self._MAX_TIER_CHAIN,
+        ]
+
+        self._CHANNELS = len(channel_max_vals)
+        self._GRID_SIZE = self._SIZE * self._SIZE * self._CHANNELS
+
+        # Scale factors for the orb channels, guarded against zero maxima
+        self._ORB_SCALE = 1.0 / np.maximum(
+            np.asarray(channel_max_vals[1:], dtype=np.float32), 1.0
+        )
+        self._GLOBAL_SCALE = 1.0 / np.maximum(
+            np.asarray(global_max_vals, dtype=np.float32), 1.0
+        )
+
+        self._buffer = np.zeros(self._GRID_SIZE + len(global_max_vals), np.float32)
+        self._window = self._buffer[: self._GRID_SIZE].reshape(
+            self._SIZE, self._SIZE, self._CHANNELS
+        )
+        self._global = self._buffer[self._GRID_SIZE :]
+        self._obs = {"grid": self._window, "global": self._global}
+
+        if self._FLATTEN:
+            return spaces.Box(
+                low=0.0, high=1.0, shape=self._buffer.shape, dtype=np.float32
+            )
+
+        return spaces.Dict(
+            {
+                "grid": spaces.Box(
+                    low=0.0, high=1.0, shape=self._window.shape, dtype=np.float32
+                ),
+                "global": spaces.Box(
+                    low=0.0, high=1.0, shape=self._global.shape, dtype=np.float32
+                ),
+            }
+        )
+
+    def get_observation(
+        self, state: GridWorld, steps_left: int
+    ) -> np.ndarray | dict[str, np.ndarray]:
+        orb_grid = state.ORB_GRID
+        rows, cols = orb_grid.shape[:2]
+        top = state.DROID.position[0] - self._RADIUS
+        left = state.DROID.position[1] - self._RADIUS
+
+        # Overlap of the window with the grid, in grid and in window coordinates
+        row_start, row_end = max(top, 0), min(top + self._SIZE, rows)
+        col_start, col_end = max(left, 0), min(left + self._SIZE, cols)
+        window = self._window[
+            row_start - top : row_end - top, col_start - left : col_end - left
+        ]
+
+        # Everything outside the grid is padding, which counts as blocked
+        self._window.fill(0.0)
+        self._window[..., 0] = 1.0
+        window[..., 0] = state.LAYOUT.BLOCKED.reshape(rows, cols)[
+            row_start:row_end, col_start:col_end
+        ]
+        np.multiply(
+            orb_grid[row_start:row_end, col_start:col_end],
+            self._ORB_SCALE,
+            out=window[..., 1:],
+        )
+
+        # Orbs of worlds larger than the configured grid can outlive the normalized lifespan
+        np.minimum(window[..., 1:], 1.0, out=window[..., 1:])
+
+        # Global values
+        self._global[0] = steps_left
+        self._global[1] = min(max(state.DROID.score, 0.0), self._MAX_SCORE)
+        self._global[2] = state.DROID.DIGESTION_ENGINE.chained_tiers
+        self._global *= self._GLOBAL_SCALE
+
+        if self._FLATTEN:
+            return self._buffer
+
+        return self._obs
@@ -0,0 +1 @@
+from .entity_perception import EntityPerception
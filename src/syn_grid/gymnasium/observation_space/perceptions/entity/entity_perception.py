@@ -0,0 +1,130 @@
+from syn_grid.gymnasium.observation_space.perceptions.base_perception import (
+    BasePerception,
+)
+from syn_grid.config.models import PerceptionConf
+from syn_grid.core.grid_world import GridWorld
+from syn_grid.core.orbs.base_orb import BaseOrb
+
+import numpy as np
+from gymnasium import spaces
+from typing import Final
+
+
+class EntityPerception(BasePerception):
+    """
+    Padded list of the active orbs plus a vector of global values.
+
+    Every active orb is one row of `entities`: its position followed by its category, type, tier
+    and remaining life, all normalized. With `observe_reachability` the droid-to-orb distance and
+    whether the orb can be reached before it de-spawns are appended. The list has room for `max_active_orbs` orbs, `mask`
+    marks which rows hold an orb. Only active orbs are visited, so the observation size and the
+    work per step follow the number of orbs rather than the number of cells. The order of the
+    rows carries no meaning, use a permutation-invariant extractor such as `DeepSetsExtractor`.
+    """
+
+    # ================= #
+    #        Init       #
+    # ================= #
+
+    def __init__(self, conf: PerceptionConf, orbs: int) -> None:
+        super().__init__(conf, orbs)
+        self._MAX_ENTITIES: Final[int] = conf.max_active_orbs
+
+    # ================= #
+    #        API        #
+    # ================= #
+
+    def reset(self) -> None: ...
+
+    def setup_obs_space(self) -> spaces.Space:
+        entity_max_vals = [
+            *self._get_max_orb_positions(),
+            *self._get_max_orb_identity(),
+            *self._get_max_orb_data(),
+        ]
+        if self._OBSERVE_REACHABILITY:
+            entity_max_vals.extend(self._get_max_orb_reachability())
+        global_max_vals = [
+            *self._get_max_droid_positions(),
+            *self._get_max_global_values(),
+            *self._get_max_droid_data(),
+        ]
+
+        self._ENTITY_SCALE = 1.0 / np.maximum(
+            np.asarray(entity_max_vals, dtype=np.float32), 1.0
+        )
+        self._GLOBAL_SCALE = 1.0 / np.maximum(
+            np.asarray(global_max_vals, dtype=np.float32), 1.0
+        )
+
+        self._entities = np.zeros(
+            (self._MAX_ENTITIES, len(entity_max_vals)), np.float32
+        )
+        self._mask = np.zeros(self._MAX_ENTITIES, np.float32)
+        self._global = np.zeros(len(global_max_vals), np.float32)
+        self._obs = {
+            "entities": self._entities,
+            "mask": self._mask,
+            "global": self._global,
+        }
+
+        return spaces.Dict(
+            {
+                "entities": spaces.Box(
+                    low=0.0, high=1.0, shape=self._entities.shape, dtype=np.float32
+                ),
+                "mask": spaces.Box(
+                    low=0.0, high=1.0, shape=self._mask.shape, dtype=np.float32
+                ),
+                "global": spaces.Box(
+                    low=0.0, high=1.0, shape=self._global.shape, dtype=np.float32
+                ),
+            }
+        )
+
+    def get_observation(
+        self, state: GridWorld, steps_left: int
+    ) -> dict[str, np.ndarray]:
+        active_orbs = state.get_active_orbs()[: self._MAX_ENTITIES]
+        count = len(active_orbs)
+
+        self._entities[count:] = 0.0
+        self._mask[:count] = 1.0
+        self._mask[count:] = 0.0
+
+        for row, orb in zip(self._entities, active_orbs):
+            row[:6] = (
+                orb.position[0],
+                orb.position[1],
+                orb.META.CATEGORY.value,
+                orb.META.TYPE.value,
+                orb.META.TIER,
+                orb.TIMER.remaining,
+            )
+            if self._OBSERVE_REACHABILITY:
+                row[6:] = self._get_orb_reachability(state, orb)
+        self._entities[:count] *= self._ENTITY_SCALE
+        np.minimum(self._entities, 1.0, out=self._entities)
+
+        # Global values
+        droid = state.DROID
+        self._global[:] = (
+            droid.position[0],
+            droid.position[1],
+            steps_left,
+            min(max(droid.score, 0.0), self._MAX_SCORE),
+            droid.DIGESTION_ENGINE.chained_tiers,
+        )
+        self._global *= self._GLOBAL_SCALE
+        np.minimum(self._global, 1.0, out=self._global)
+
+        return self._obs
+
+    def get_orb_slot_count(self) -> int:
+        return self._MAX_ENTITIES
+
+    def get_orb_slots(self, state: GridWorld) -> list[BaseOrb | None]:
+        active_orbs: list[BaseOrb | None] = list(
+            state.get_active_orbs()[: self._MAX_ENTITIES]
+        )
+        return active_orbs + [None] * (self._MAX_ENTITIES - len(active_orbs))
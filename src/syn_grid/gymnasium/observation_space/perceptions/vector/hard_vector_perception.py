@@ -7,6 +7,7 @@ from syn_grid.core.orbs.base_orb import BaseOrb
 
 from gymnasium import spaces
 import numpy as np
+from typing import Sequence
 
 
 class HardVectorPerception(BasePerception):
@@ -17,6 +18,9 @@ class HardVectorPerception(BasePerception):
     def __init__(self, conf: PerceptionConf, orbs: int) -> None:
         super().__init__(conf, orbs)
 
+        # One slot map per row of `fill_batch()`, the single env map is kept separately
+        self._batch_slot_maps: list[dict[int, int]] = []
+
     # ================= #
     #        API        #
     # ================= #
@@ -56,33 +60,37 @@ class HardVectorPerception(BasePerception):
 
     def get_observation(self, state: GridWorld, steps_left: int) -> np.ndarray:
         obs = np.full(self._SHAPE, -1.0, dtype=np.float32)
+        self._write_observation(state, obs, self._orb_slot_map)
 
-        # Droid data
-        droid_y, droid_x = state.DROID.position
-        obs[0] = droid_y
-        obs[1] = droid_x
+        return obs
 
-        self._prune_orb_slot_map(state)
+    def get_orb_slot_count(self) -> int:
+        return self._MAX_ACTIVE_ORBS
 
-        # Available orb data
-        for orb_index_in_all_orbs_list, orb in enumerate(state.ALL_ORBS):
-            if orb.is_active:
+    def get_orb_slots(self, state: GridWorld) -> list[BaseOrb | None]:
+        slots: list[BaseOrb | None] = [None] * self._MAX_ACTIVE_ORBS
+        for orb_index, obs_start_index in self._orb_slot_map.items():
+            slots[self._AVAILABLE_SLOTS.index(obs_start_index)] = state.ALL_ORBS[
+                orb_index
+            ]
 
-                # Assign a permanent grid slot if this orb is new
-                if orb_index_in_all_orbs_list not in self._orb_slot_map:
-                    for obs_start_index in self._AVAILABLE_SLOTS:
-                        if obs_start_index not in self._orb_slot_map.values():
-                            self._orb_slot_map[orb_index_in_all_orbs_list] = (
-                                obs_start_index
-                            )
-                            break
+        return slots
 
-                # Write orb data to its assigned slot
-                obs_start_index = self._orb_slot_map.get(orb_index_in_all_orbs_list)
-                if obs_start_index is not None:
-                    self._add_orb_data(orb, obs, obs_start_index)
+    def fill_batch(
+        self, worlds: Sequence[GridWorld], steps_left: np.ndarray, out: np.ndarray
+    ) -> np.ndarray:
+        while len(self._batch_slot_maps) < len(worlds):
+            self._batch_slot_maps.append({})
 
-        return obs
+        out.fill(-1.0)
+        for world, row, slot_map in zip(worlds, out, self._batch_slot_maps):
+            self._write_observation(world, row, slot_map)
+
+        return out
+
+    def reset_batch_entry(self, index: int) -> None:
+        if index < len(self._batch_slot_maps):
+            self._batch_slot_maps[index].clear()
 
     # ================= #
     #      Helpers      #
@@ -96,15 +104,41 @@ class HardVectorPerception(BasePerception):
         for i in range(1, self._MAX_ACTIVE_ORBS):
             self._AVAILABLE_SLOTS.append(self._AVAILABLE_SLOTS[i - 1] + num_orb_slots)
 
-    def _prune_orb_slot_map(self, state: GridWorld):
-        if not self._orb_slot_map:
+    def _write_observation(
+        self, state: GridWorld, obs: np.ndarray, orb_slot_map: dict[int, int]
+    ) -> None:
+        # Droid data
+        droid_y, droid_x = state.DROID.position
+        obs[0] = droid_y
+        obs[1] = droid_x
+
+        self._prune_orb_slot_map(state, orb_slot_map)
+
+        # Available orb data
+        for orb_index_in_all_orbs_list, orb in enumerate(state.ALL_ORBS):
+            if orb.is_active:
+
+                # Assign a permanent grid slot if this orb is new
+                if orb_index_in_all_orbs_list not in orb_slot_map:
+                    for obs_start_index in self._AVAILABLE_SLOTS:
+                        if obs_start_index not in orb_slot_map.values():
+                            orb_slot_map[orb_index_in_all_orbs_list] = obs_start_index
+                            break
+
+                # Write orb data to its assigned slot
+                obs_start_index = orb_slot_map.get(orb_index_in_all_orbs_list)
+                if obs_start_index is not None:
+                    self._add_orb_data(orb, obs, obs_start_index)
+
+    def _prune_orb_slot_map(self, state: GridWorld, orb_slot_map: dict[int, int]):
+        if not orb_slot_map:
             return
 
         active_indices = {i for i, orb in enumerate(state.ALL_ORBS) if orb.is_active}
 
-        for orb_index in list(self._orb_slot_map.keys()):
+        for orb_index in list(orb_slot_map.keys()):
             if orb_index not in active_indices:
-                del self._orb_slot_map[orb_index]
+                del orb_slot_map[orb_index]
 
     def _add_orb_data(self, orb: BaseOrb, obs: np.ndarray, obs_index: int) -> None:
         orb_y, orb_x = orb.position
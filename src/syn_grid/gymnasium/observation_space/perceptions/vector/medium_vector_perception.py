@@ -3,9 +3,11 @@ from syn_grid.gymnasium.observation_space.perceptions.base_perception import (
 )
 from syn_grid.config.models import PerceptionConf
 from syn_grid.core.grid_world import GridWorld
+from syn_grid.core.orbs.base_orb import BaseOrb
 
 import numpy as np
 from gymnasium import spaces
+from typing import Sequence
 
 
 class MediumVectorPerception(BasePerception):
@@ -33,6 +35,7 @@ class MediumVectorPerception(BasePerception):
         self._max_vals.extend(orb_data * self._ORBS_IN_ENV)
 
         self._SHAPE = len(self._max_vals)
+        self._MAX_VALS_ARR = np.asarray(self._max_vals, dtype=np.float32)
 
         low = np.full(self._SHAPE, -1.0, dtype=np.float32)
         low[0:2] = 0.0
@@ -75,3 +78,38 @@ class MediumVectorPerception(BasePerception):
                 obs_index += self._num_orb_slots
 
         return obs
+
+    def get_orb_slot_count(self) -> int:
+        return self._ORBS_IN_ENV
+
+    def get_orb_slots(self, state: GridWorld) -> list[BaseOrb | None]:
+        # Every orb of the pool has its own slot
+        return [orb if orb.is_active else None for orb in state.ALL_ORBS]
+
+    def fill_batch(
+        self, worlds: Sequence[GridWorld], steps_left: np.ndarray, out: np.ndarray
+    ) -> np.ndarray:
+        num_worlds = len(worlds)
+
+        # Gather the raw values of every world, then normalize them all in one go
+        droid_positions = np.array([w.DROID.position for w in worlds], np.float32)
+        orb_values = np.array(
+            [
+                [(*o.position, o.META.CATEGORY.value, o.META.TYPE.value, o.META.TIER)]
+                for w in worlds
+                for o in w.ALL_ORBS
+            ],
+            np.float32,
+        ).reshape(num_worlds, self._ORBS_IN_ENV, self._num_orb_slots)
+        active = np.array(
+            [w.get_orb_is_active_status(False) for w in worlds], dtype=bool
+        )
+
+        out.fill(-1.0)
+        out[:, 0:2] = droid_positions / self._MAX_VALS_ARR[0:2]
+
+        orb_rows = out[:, 2:].reshape(num_worlds, self._ORBS_IN_ENV, -1)
+        orb_max_vals = self._MAX_VALS_ARR[2:].reshape(self._ORBS_IN_ENV, -1)
+        np.copyto(orb_rows, orb_values / orb_max_vals, where=active[..., None])
+
+        return out
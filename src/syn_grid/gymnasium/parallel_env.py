@@ -0,0 +1,168 @@
+from syn_grid.config.models import WorldConfig, ObsConfig
+from syn_grid.core.grid_world import GridWorld
+from syn_grid.core.spawn_sources import RandomSpawnSource
+from syn_grid.gymnasium.action_space import DroidAction
+from syn_grid.gymnasium.observation_space.observation_handler import (
+    ObservationHandler,
+)
+from syn_grid.utils.seeding import get_spawn_rngs
+
+import numpy as np
+from numpy.random import Generator
+from typing import Any, Final
+from gymnasium import spaces
+from gymnasium.utils import seeding
+
+
+class SYNGridParallelEnv:
+    """
+    Multi-droid SYNGrid environment where all droids act at the same time, following the
+    PettingZoo `ParallelEnv` API (without depending on PettingZoo).
+
+    All droids share one `GridWorld` with `num_droids` droids, so the orb timers and spawns are
+    advanced once per step no matter how many droids there are. Each droid observes the world
+    through its own `ObservationHandler`. A droid whose score drops to 0 leaves the episode, the
+    others keep going until the steps run out.
+    """
+
+    metadata = {"name": "syn_grid_parallel_v0"}
+
+    # ================= #
+    #       Init        #
+    # ================= #
+
+    def __init__(self, run_conf: WorldConfig, obs_conf: ObsConfig):
+        self.world: Final[GridWorld] = GridWorld(
+            run_conf.grid_world_conf,
+            run_conf.orb_factory_conf,
+            run_conf.droid_conf,
+            run_conf.negative_orb_conf,
+            run_conf.tier_orb_conf,
+        )
+
+        self.possible_agents: Final[list[str]] = [
+            f"droid_{index}" for index in range(len(self.world.DROIDS))
+        ]
+        self.agents: list[str] = []
+
+        self._HANDLERS: Final[dict[str, ObservationHandler]] = {
+            agent: ObservationHandler(obs_conf, len(self.world.ALL_ORBS))
+            for agent in self.possible_agents
+        }
+        self._OBSERVATION_SPACES: Final[dict[str, spaces.Space]] = {
+            agent: handler.setup_obs_space()
+            for agent, handler in self._HANDLERS.items()
+        }
+        self._ACTION_SPACE: Final = spaces.Discrete(len(DroidAction))
+        self._np_random: Generator | None = None
+        self._spawn_rngs: tuple[Generator, Generator]
+
+    # ======================== #
+    #    ParallelEnv contract  #
+    # ======================== #
+
+    def observation_space(self, agent: str) -> spaces.Space:
+        return self._OBSERVATION_SPACES[agent]
+
+    def action_space(self, agent: str) -> spaces.Space:
+        return self._ACTION_SPACE
+
+    def reset(
+        self, seed: int | None = None, options: dict[str, Any] | None = None
+    ) -> tuple[dict[str, Any], dict[str, dict]]:
+        if seed is not None or self._np_random is None:
+            self._np_random, _ = seeding.np_random(seed)
+            self._spawn_rngs = get_spawn_rngs(self._np_random)
+
+        self.world.reset(
+            self._np_random,
+            RandomSpawnSource(*self._spawn_rngs, self.world.LAYOUT.FREE_CELLS),
+        )
+        for handler in self._HANDLERS.values():
+            handler.reset()
+        self.agents = self.possible_agents.copy()
+
+        return self._observe(), {agent: {} for agent in self.agents}
+
+    def step(self, actions: dict[str, int]) -> tuple[
+        dict[str, Any],
+        dict[str, float],
+        dict[str, bool],
+        dict[str, bool],
+        dict[str, dict],
+    ]:
+        world_actions = [
+            DroidAction(actions[agent]) if agent in self.agents else None
+            for agent in self.possible_agents
+        ]
+        world_rewards = self.world.perform_agent_actions(world_actions)
+
+        rewards: dict[str, float] = {}
+        terminations: dict[str, bool] = {}
+        truncations: dict[str, bool] = {}
+        for index, agent in enumerate(self.possible_agents):
+            if agent not in self.agents:
+                continue
+
+            handler = self._HANDLERS[agent]
+            handler.steps_left -= 1
+            rewards[agent], terminations[agent], truncations[agent] = (
+                self._check_episode_end(index, handler, world_rewards[index])
+            )
+
+        observations = self._observe()
+        self.agents = [
+            agent
+            for agent in self.agents
+            if not (terminations[agent] or truncations[agent])
+        ]
+
+        return (
+            observations,
+            rewards,
+            terminations,
+            truncations,
+            {agent: {} for agent in terminations},
+        )
+
+    def close(self) -> None: ...
+
+    # ================= #
+    #      Helpers      #
+    # ================= #
+
+    def _observe(self) -> dict[str, Any]:
+        observations = {}
+        for index, agent in enumerate(self.possible_agents):
+            if agent in self.agents:
+                self.world.observe_from(index)
+                obs = self._HANDLERS[agent].get_observation(self.world)
+
+                # Handlers reuse their buffers, so each agent gets its own copy
+                if isinstance(obs, dict):
+                    observations[agent] = {key: np.copy(v) for key, v in obs.items()}
+                else:
+                    observations[agent] = np.copy(obs)
+        self.world.observe_from(0)
+
+        return observations
+
+    def _check_episode_end(
+        self, index: int, handler: ObservationHandler, reward: float
+    ) -> tuple[float, bool, bool]:
+        # Same rules as `SYNGridEnv`, applied to each droid on its own
+        droid = self.world.DROIDS[index]
+
+        if droid.score <= 0:
+            return reward - handler.steps_left, True, False
+
+        if handler.steps_left <= 0:
+            if handler.TIME_LIMIT_BONUS:
+                reward += droid.score
+            return (
+                reward,
+                not handler.TRUNCATE_AT_MAX_STEPS,
+                handler.TRUNCATE_AT_MAX_STEPS,
+            )
+
+        return reward, False, False
@@ -0,0 +1,255 @@
+from syn_grid.config.models import WorldConfig, ObsConfig
+from syn_grid.gymnasium.environment import SYNGridEnv
+from syn_grid.gymnasium.action_space import DroidAction
+from syn_grid.gymnasium.observation_space.observation_handler import (
+    ObservationHandler,
+)
+from syn_grid.utils.seeding import get_env_seed_sequences
+
+import numpy as np
+from numpy.random import SeedSequence
+from copy import deepcopy
+from typing import Any, Callable, Final, Sequence
+from gymnasium import spaces
+from gymnasium.vector import AutoresetMode, VectorEnv
+from gymnasium.vector.utils import batch_space
+
+
+class SYNGridVectorEnv(VectorEnv):
+    """
+    Runs `num_envs` headless SYNGrid environments in-process and observes them as one batch.
+    Every environment can get its own world config, e.g. to train on several scenarios at once,
+    as long as all of them fit the one observation layout (see `fit_obs_to_worlds()`).
+
+    The worlds are stepped without building per-env observations; afterwards one batched
+    `ObservationHandler` writes every observation straight into a single `(num_envs, *obs_shape)`
+    array. Finished episodes are reset within the same step, their last observation is passed
+    through `info["final_obs"]`, following Gymnasium's `SAME_STEP` autoreset mode, and their
+    statistics (see `SYNGridEnv.get_episode_info()`) under their info keys as one array per
+    statistic, each masked like `info["_episode"]`. Only perceptions with Box observations are
+    supported, dict observations are rejected.
+    """
+
+    metadata = {"autoreset_mode": AutoresetMode.SAME_STEP}
+
+    # ================= #
+    #       Init        #
+    # ================= #
+
+    def __init__(
+        self,
+        num_envs: int,
+        run_conf: WorldConfig | Sequence[WorldConfig],
+        obs_conf: ObsConfig,
+        copy: bool = True,
+    ):
+        run_confs = (
+            run_conf if isinstance(run_conf, Sequence) else [run_conf] * num_envs
+        )
+        if len(run_confs) != num_envs:
+            raise ValueError(
+                f"Expected {num_envs} world configs, got {len(run_confs)} instead"
+            )
+        for conf in run_confs:
+            ObservationHandler.check_fits_observation(conf, obs_conf)
+
+        self.num_envs = num_envs
+        self.copy = copy
+        self._obs_conf = obs_conf
+        self.envs: Final[list[SYNGridEnv]] = [
+            SYNGridEnv(conf, obs_conf) for conf in run_confs
+        ]
+        self._WORLDS: Final = [env.world for env in self.envs]
+
+        self._observation_handler = ObservationHandler(
+            obs_conf, len(self._WORLDS[0].ALL_ORBS)
+        )
+        self.single_observation_space = self._observation_handler.setup_obs_space()
+        if not isinstance(self.single_observation_space, spaces.Box):
+            raise ValueError(
+                "SYNGridVectorEnv only supports Box observations, the "
+                f"'{obs_conf.observation_handler.perception}' perception returns a dict "
+                "(composite and egocentric perceptions can be flattened)"
+            )
+        for env in self.envs:
+            ObservationHandler.check_same_layout(
+                self.single_observation_space, env.observation_space
+            )
+        self.single_action_space = self.envs[0].action_space
+        self.observation_space = batch_space(self.single_observation_space, num_envs)
+        self.action_space = batch_space(self.single_action_space, num_envs)
+
+        self._observations = np.zeros(
+            self.observation_space.shape, self.observation_space.dtype  # type: ignore[arg-type]
+        )
+        self._steps_left = np.zeros(num_envs, np.int64)
+        self._cells = np.zeros(num_envs, np.int64)
+        self._action_masks = np.zeros((num_envs, len(DroidAction)), np.bool_)
+        self._rewards = np.zeros(num_envs, np.float64)
+        self._pre_reset_hooks: list[Callable[[np.ndarray], None]] = []
+        self._terminations = np.zeros(num_envs, np.bool_)
+        self._truncations = np.zeros(num_envs, np.bool_)
+
+    # ======================== #
+    #    Gymnasium contract    #
+    # ======================== #
+
+    def reset(
+        self,
+        *,
+        seed: int | Sequence[int | SeedSequence | None] | None = None,
+        options: dict[str, Any] | None = None,
+    ) -> tuple[np.ndarray, dict[str, Any]]:
+        # An int seed spawns one independent seed sequence per environment
+        if seed is None:
+            seeds: Sequence[int | SeedSequence | None] = [None] * self.num_envs
+        elif isinstance(seed, int):
+            super().reset(seed=seed)
+            seeds = get_env_seed_sequences(seed, self.num_envs)
+        else:
+            seeds = seed
+
+        for index, (env, env_seed) in enumerate(zip(self.envs, seeds, strict=True)):
+            env.reset_world(env_seed)
+            self._observation_handler.reset_batch_entry(index)
+
+        self._observe()
+
+        return self._get_observations(), self._add_action_masks({})
+
+    def step(
+        self, actions: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, dict[str, Any]]:
+        for index, (env, action) in enumerate(zip(self.envs, actions, strict=True)):
+            (
+                self._rewards[index],
+                self._terminations[index],
+                self._truncations[index],
+            ) = env.step_world(int(action))
+
+        self._observe()
+        infos: dict[str, Any] = {}
+
+        dones = self._terminations | self._truncations
+        if dones.any():
+            finished = np.flatnonzero(dones)
+            for hook in self._pre_reset_hooks:
+                hook(finished)
+
+            for index in finished:
+                infos = self._add_info(
+                    infos,
+                    {
+                        "final_obs": self._observations[index].copy(),
+                        "final_info": {},
+                        **self.envs[index].get_episode_info(),
+                    },
+                    index,
+                )
+                self.envs[index].reset_world()
+                self._observation_handler.reset_batch_entry(index)
+
+            # Episode ends are rare, observing the whole batch again keeps the fill fully batched
+            self._observe()
+
+        return (
+            self._get_observations(),
+            np.copy(self._rewards),
+            np.copy(self._terminations),
+            np.copy(self._truncations),
+            self._add_action_masks(infos),
+        )
+
+    # ================= #
+    #        API        #
+    # ================= #
+
+    def reconfigure(
+        self,
+        run_conf: WorldConfig,
+        obs_conf: ObsConfig | None = None,
+        indices: Sequence[int] | None = None,
+    ) -> None:
+        """
+        Change the configuration of some or all environments in place, see
+        `SYNGridEnv.reconfigure()`. Each environment applies its new world config at its next
+        reset, the observation config applies to the whole batch right away. One batched handler
+        observes every environment, so a new observation config can't be limited to some of them.
+
+        :param run_conf: The new world config.
+        :param obs_conf: The new observation config for all environments, or None to keep it.
+        :param indices: The environments to reconfigure, all of them if None.
+        :raises ValueError: If the new configs would change the observation layout, or a new
+            observation config is given for only some of the environments.
+        """
+
+        if indices is not None and obs_conf is not None and obs_conf != self._obs_conf:
+            raise ValueError(
+                "A new observation config applies to all environments, reconfigure them "
+                "without indices"
+            )
+        ObservationHandler.check_fits_observation(run_conf, obs_conf or self._obs_conf)
+
+        # The environments validate the new layout before anything is changed
+        for index in range(self.num_envs) if indices is None else indices:
+            self.envs[index].reconfigure(run_conf, obs_conf)
+
+        if obs_conf is not None and obs_conf != self._obs_conf:
+            handler = ObservationHandler(obs_conf, len(self._WORLDS[0].ALL_ORBS))
+            ObservationHandler.check_same_layout(
+                self.single_observation_space, handler.setup_obs_space()
+            )
+            self._observation_handler = handler
+            self._obs_conf = obs_conf
+
+    def add_pre_reset_hook(self, hook: Callable[[np.ndarray], None]) -> None:
+        """
+        Register a callable that sees the worlds of finished episodes before the same-step
+        autoreset replaces them, e.g. to read values of their final state.
+
+        :param hook: Called with the indices of the finished environments.
+        """
+
+        self._pre_reset_hooks.append(hook)
+
+    def action_masks(self) -> np.ndarray:
+        """
+        The action mask of every environment, see `SYNGridEnv.action_masks()`. When all worlds
+        share one layout the masks are gathered from its table in a single indexing operation.
+
+        :return: A `(num_envs, n_actions)` boolean array.
+        """
+
+        layout = self._WORLDS[0].LAYOUT
+        if any(world.LAYOUT is not layout for world in self._WORLDS):
+            for index, world in enumerate(self._WORLDS):
+                self._action_masks[index] = world.get_action_mask()
+            return self._action_masks.copy()
+
+        for index, world in enumerate(self._WORLDS):
+            row, col = world.DROID.position
+            self._cells[index] = row * layout.COLS + col
+
+        return layout.ACTION_MASKS[self._cells]
+
+    # ================= #
+    #      Helpers      #
+    # ================= #
+
+    # === Gymnasium contract === #
+
+    def _observe(self) -> None:
+        for index, env in enumerate(self.envs):
+            self._steps_left[index] = env.steps_left
+
+        self._observation_handler.fill_batch(
+            self._WORLDS, self._steps_left, self._observations
+        )
+
+    def _add_action_masks(self, infos: dict[str, Any]) -> dict[str, Any]:
+        infos["action_mask"] = self.action_masks()
+        infos["_action_mask"] = np.ones(self.num_envs, np.bool_)
+        return infos
+
+    def _get_observations(self) -> np.ndarray:
+        return deepcopy(self._observations) if self.copy else self._observations
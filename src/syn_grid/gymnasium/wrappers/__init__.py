@@ -0,0 +1,4 @@
+from .frame_stack import FrameStack
+from .tier_shaping import TierShaping, TierShapingVector, get_tier_potentials
+from .orb_options import OrbOptions
+from .trajectory_recorder import TrajectoryRecorder, TrajectoryReplayer
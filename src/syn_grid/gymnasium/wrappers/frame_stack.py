@@ -0,0 +1,80 @@
+import gymnasium as gym
+import numpy as np
+from gymnasium import spaces
+from typing import Any, Final
+
+
+class FrameStack(gym.Wrapper):
+    """
+    Stacks the last `n_stack` observations inside the environment, oldest first.
+
+    Frames live in a ring buffer of length `2 * n_stack` where every frame is written twice, at
+    `head` and `head + n_stack`. The latest `n_stack` frames are then always the contiguous slice
+    `[head + 1, head + 1 + n_stack)`, so the stacked observation is a view into the buffer and a
+    step costs two frame writes instead of a concatenation of the whole stack.
+
+    The returned observation is only valid until the next step; copy it if it needs to be kept
+    (SB3 vector envs and buffers already do). At reset the stack is padded with the first frame.
+    One-dimensional observations are returned flattened to `(n_stack * D,)` so MLP policies can
+    consume them directly, others keep a leading stack axis.
+    """
+
+    # ================= #
+    #       Init        #
+    # ================= #
+
+    def __init__(self, env: gym.Env, n_stack: int):
+        super().__init__(env)
+
+        if n_stack < 1:
+            raise ValueError("n_stack should be larger than 0")
+        if not isinstance(env.observation_space, spaces.Box):
+            raise TypeError("FrameStack only supports Box observation spaces")
+
+        self.N_STACK: Final[int] = n_stack
+        frame_space = env.observation_space
+        self._FLATTEN: Final[bool] = len(frame_space.shape) == 1
+
+        self._ring = np.zeros((2 * n_stack, *frame_space.shape), frame_space.dtype)
+        self._head = 0
+
+        low = np.repeat(frame_space.low[None], n_stack, axis=0)
+        high = np.repeat(frame_space.high[None], n_stack, axis=0)
+        if self._FLATTEN:
+            low, high = low.reshape(-1), high.reshape(-1)
+        self.observation_space = spaces.Box(
+            low=low, high=high, dtype=frame_space.dtype  # type: ignore[arg-type]
+        )
+
+    # ======================== #
+    #    Gymnasium contract    #
+    # ======================== #
+
+    def reset(
+        self, *, seed: int | None = None, options: dict[str, Any] | None = None
+    ) -> tuple[np.ndarray, dict[str, Any]]:
+        obs, info = self.env.reset(seed=seed, options=options)
+
+        self._ring[:] = obs
+        self._head = 0
+
+        return self._stacked_view(), info
+
+    def step(self, action):
+        obs, reward, terminated, truncated, info = self.env.step(action)
+
+        self._head = (self._head + 1) % self.N_STACK
+        self._ring[self._head] = obs
+        self._ring[self._head + self.N_STACK] = obs
+
+        return self._stacked_view(), reward, terminated, truncated, info
+
+    # ================= #
+    #      Helpers      #
+    # ================= #
+
+    def _stacked_view(self) -> np.ndarray:
+        stack = self._ring[self._head + 1 : self._head + 1 + self.N_STACK]
+        if self._FLATTEN:
+            return stack.reshape(-1)
+        return stack
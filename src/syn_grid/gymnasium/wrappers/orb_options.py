@@ -0,0 +1,143 @@
+from syn_grid.gymnasium.action_space import DroidAction
+from syn_grid.gymnasium.environment import SYNGridEnv
+from syn_grid.core.orbs.base_orb import BaseOrb
+
+import gymnasium as gym
+from gymnasium import spaces
+from typing import Any, Final
+
+_OPPOSITE_ACTIONS: Final[dict[DroidAction, DroidAction]] = {
+    DroidAction.LEFT: DroidAction.RIGHT,
+    DroidAction.RIGHT: DroidAction.LEFT,
+    DroidAction.UP: DroidAction.DOWN,
+    DroidAction.DOWN: DroidAction.UP,
+}
+
+
+class OrbOptions(gym.Wrapper):
+    """
+    Options layer where the agent picks a target orb instead of a direction.
+
+    Action `i` targets the orb in the i-th orb slot of the observation the agent just received,
+    e.g. the i-th orb of the "vector_hard" perception or the i-th row of the "entity" perception,
+    so the policy can tell which orb an action means. Perceptions without orb slots (composite and
+    egocentric) are rejected. The droid then follows the shortest path from the layout's distance
+    tables until it consumes the orb, the orb disappears, `timeout` steps have passed or the
+    episode ends. The last action waits: the droid steps out and back for `wait_steps` steps, so
+    new orbs get the chance to spawn. Targeting an empty slot waits as well.
+
+    Steps follow SMDP semantics: the reward is the discounted sum of the primitive rewards and
+    `info["option_steps"]` holds the number of primitive steps, so the agent should discount the
+    next value by `gamma ** option_steps`. Intermediate steps skip the observation entirely, only
+    the final state is observed. The wrapper must sit directly on a `SYNGridEnv`.
+    """
+
+    # ================= #
+    #       Init        #
+    # ================= #
+
+    def __init__(
+        self,
+        env: gym.Env,
+        gamma: float = 0.99,
+        timeout: int = 20,
+        wait_steps: int = 2,
+    ):
+        if not isinstance(env, SYNGridEnv):
+            raise TypeError("OrbOptions must wrap a SYNGridEnv directly")
+        if timeout < 1 or wait_steps < 1:
+            raise ValueError("timeout and wait_steps should be larger than 0")
+        if not env.orb_slot_count:
+            raise ValueError(
+                "OrbOptions needs a perception that shows orbs in slots, e.g. vector_hard or "
+                "entity"
+            )
+
+        super().__init__(env)
+        self._ENV: Final[SYNGridEnv] = env
+        self._GAMMA: Final[float] = gamma
+        self._TIMEOUT: Final[int] = timeout
+        self._WAIT_STEPS: Final[int] = wait_steps
+        self._WAIT_OPTION: Final[int] = env.orb_slot_count
+
+        self.action_space = spaces.Discrete(self._WAIT_OPTION + 1)
+
+    # ======================== #
+    #    Gymnasium contract    #
+    # ======================== #
+
+    def step(self, action: int) -> tuple[Any, float, bool, bool, dict[str, Any]]:
+        # The slots of the last observation, the one the agent picked its action from
+        orb_slots = self._ENV.get_orb_slots()
+        orb = orb_slots[action] if action < len(orb_slots) else None
+
+        if orb is not None and orb.is_active:
+            reward, terminated, truncated, steps = self._go_to_orb(orb)
+        else:
+            reward, terminated, truncated, steps = self._wait()
+
+        info: dict[str, Any] = {"option_steps": steps}
+        if terminated or truncated:
+            info.update(self._ENV.get_episode_info())
+
+        return self._ENV.observe(), reward, terminated, truncated, info
+
+    # ================= #
+    #      Helpers      #
+    # ================= #
+
+    def _go_to_orb(self, orb: BaseOrb) -> tuple[float, bool, bool, int]:
+        world = self._ENV.world
+        layout = world.LAYOUT
+        target = list(orb.position)
+
+        if layout.get_distance(world.DROID.position, target) >= layout.UNREACHABLE:
+            return self._wait()
+
+        reward, discount, steps = 0.0, 1.0, 0
+        while steps < self._TIMEOUT:
+            position = world.DROID.position
+            action = min(
+                DroidAction,
+                key=lambda a: layout.get_distance(
+                    layout.get_next_position(position, a), target
+                ),
+            )
+
+            step_reward, terminated, truncated = self._ENV.step_world(action.value)
+            reward += discount * step_reward
+            discount *= self._GAMMA
+            steps += 1
+
+            # Arrival and de-spawning both leave the orb inactive (or respawned elsewhere)
+            if terminated or truncated or not orb.is_active or orb.position != target:
+                return reward, terminated, truncated, steps
+
+        return reward, False, False, steps
+
+    def _wait(self) -> tuple[float, bool, bool, int]:
+        world = self._ENV.world
+        layout = world.LAYOUT
+        position = world.DROID.position
+
+        # Step into any open neighbour and back, a droid boxed in just bumps into its walls
+        action = next(
+            (
+                a
+                for a in DroidAction
+                if layout.get_next_position(position, a) != tuple(position)
+            ),
+            DroidAction.LEFT,
+        )
+
+        reward, discount = 0.0, 1.0
+        for step in range(self._WAIT_STEPS):
+            step_reward, terminated, truncated = self._ENV.step_world(action.value)
+            reward += discount * step_reward
+            discount *= self._GAMMA
+            action = _OPPOSITE_ACTIONS[action]
+
+            if terminated or truncated:
+                return reward, terminated, truncated, step + 1
+
+        return reward, False, False, self._WAIT_STEPS
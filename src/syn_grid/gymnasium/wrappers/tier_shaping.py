@@ -0,0 +1,177 @@
+from syn_grid.core.grid_world import GridWorld
+from syn_grid.core.orbs.synergy.tier_orb import TierOrb
+
+import gymnasium as gym
+import numpy as np
+from gymnasium.vector import VectorEnv, VectorWrapper
+from typing import Any, Final, Sequence
+
+
+def get_tier_potentials(
+    worlds: Sequence[GridWorld], out: np.ndarray | None = None
+) -> np.ndarray:
+    """
+    Potential of each world's state for tier shaping: minus the normalized shortest-path
+    distance from the droid to the nearest active tier orb that continues its chain, -1 when there
+    is none on the grid.
+
+    The distances are gathered for the whole batch first, open grids are then resolved in one
+    vectorized Manhattan computation and only layouts with obstacles or walls fall back to their
+    cached distance tables.
+
+    :param worlds: The worlds to compute the potential of.
+    :param out: Optional array that receives the potentials.
+    :return: One potential per world, in [-1, 0].
+    """
+
+    if out is None:
+        out = np.empty(len(worlds), np.float64)
+    out.fill(-1.0)
+
+    world_indices, droid_positions, orb_positions = [], [], []
+    for index, world in enumerate(worlds):
+        next_tier = world.DROID.DIGESTION_ENGINE.chained_tiers + 1
+        for orb in world.get_active_orbs():
+            if isinstance(orb, TierOrb) and orb.META.TIER == next_tier:
+                world_indices.append(index)
+                droid_positions.append(world.DROID.position)
+                orb_positions.append(orb.position)
+
+    if not world_indices:
+        return out
+
+    indices = np.asarray(world_indices)
+    distances = np.abs(np.asarray(droid_positions) - np.asarray(orb_positions)).sum(
+        axis=1
+    )
+    for row, index in enumerate(world_indices):
+        layout = worlds[index].LAYOUT
+        if not layout.IS_OPEN:
+            distances[row] = layout.get_distance(
+                droid_positions[row], orb_positions[row]
+            )
+
+    max_distances = np.asarray(
+        [max(worlds[i].LAYOUT.ROWS + worlds[i].LAYOUT.COLS - 2, 1) for i in indices]
+    )
+    potentials = -np.minimum(distances / max_distances, 1.0)
+
+    # Keep the closest target orb of every world
+    np.maximum.at(out, indices, potentials)
+
+    return out
+
+
+class TierShaping(gym.Wrapper):
+    """
+    Potential-based reward shaping toward the next tier orb of the droid's chain.
+
+    Every step adds `scale * (gamma * phi(s') - phi(s))` to the reward, with `phi` from
+    `get_tier_potentials()` and `phi(s') = 0` once the episode terminated. A truncated episode
+    keeps the potential of its final state, since the agent bootstraps from that state. Shaping of
+    this form leaves the optimal policy unchanged (Ng et al., 1999) as long as `gamma` matches the
+    agent's discount factor.
+    """
+
+    # ================= #
+    #       Init        #
+    # ================= #
+
+    def __init__(self, env: gym.Env, gamma: float = 0.99, scale: float = 1.0):
+        super().__init__(env)
+        self._GAMMA: Final[float] = gamma
+        self._SCALE: Final[float] = scale
+        self._WORLDS: Final[list[GridWorld]] = [
+            env.unwrapped.world  # type: ignore[attr-defined]
+        ]
+        self._potential = np.zeros(1)
+
+    # ======================== #
+    #    Gymnasium contract    #
+    # ======================== #
+
+    def reset(
+        self, *, seed: int | None = None, options: dict[str, Any] | None = None
+    ) -> tuple[Any, dict[str, Any]]:
+        obs, info = self.env.reset(seed=seed, options=options)
+        get_tier_potentials(self._WORLDS, self._potential)
+
+        return obs, info
+
+    def step(self, action: Any) -> tuple[Any, float, bool, bool, dict[str, Any]]:
+        obs, reward, terminated, truncated, info = self.env.step(action)
+
+        previous = self._potential[0]
+        get_tier_potentials(self._WORLDS, self._potential)
+        next_potential = 0.0 if terminated else self._potential[0]
+
+        shaping = self._SCALE * (self._GAMMA * next_potential - previous)
+        return obs, float(reward) + shaping, terminated, truncated, info
+
+
+class TierShapingVector(VectorWrapper):
+    """
+    `TierShaping` for a `SYNGridVectorEnv`, computing the potentials of all its worlds as one
+    batch. Environments that finished their episode are already reset in the same step, so their
+    new potential is taken from the fresh episode. The final transition uses `phi(s') = 0` when the
+    episode terminated and the potential of the final state, read through the vector env's
+    pre-reset hook, when it was truncated.
+    """
+
+    # ================= #
+    #       Init        #
+    # ================= #
+
+    def __init__(self, env: VectorEnv, gamma: float = 0.99, scale: float = 1.0):
+        super().__init__(env)
+        self._GAMMA: Final[float] = gamma
+        self._SCALE: Final[float] = scale
+        self._WORLDS: Final[list[GridWorld]] = [
+            sub_env.world for sub_env in env.unwrapped.envs  # type: ignore[attr-defined]
+        ]
+        self._potentials = np.zeros(self.num_envs)
+        self._previous = np.zeros(self.num_envs)
+        self._final_potentials = np.zeros(self.num_envs)
+        env.unwrapped.add_pre_reset_hook(  # type: ignore[attr-defined]
+            self._store_final_potentials
+        )
+
+    # ======================== #
+    #    Gymnasium contract    #
+    # ======================== #
+
+    def reset(
+        self,
+        *,
+        seed: int | list[int | None] | None = None,
+        options: dict[str, Any] | None = None,
+    ) -> tuple[Any, dict[str, Any]]:
+        obs, info = self.env.reset(seed=seed, options=options)
+        get_tier_potentials(self._WORLDS, self._potentials)
+
+        return obs, info
+
+    def step(
+        self, actions: Any
+    ) -> tuple[Any, np.ndarray, np.ndarray, np.ndarray, dict[str, Any]]:
+        obs, rewards, terminations, truncations, infos = self.env.step(actions)
+
+        self._previous[:] = self._potentials
+        get_tier_potentials(self._WORLDS, self._potentials)
+        next_potentials = np.where(
+            terminations,
+            0.0,
+            np.where(truncations, self._final_potentials, self._potentials),
+        )
+
+        shaping = self._SCALE * (self._GAMMA * next_potentials - self._previous)
+        return obs, rewards + shaping, terminations, truncations, infos
+
+    # ================= #
+    #      Helpers      #
+    # ================= #
+
+    def _store_final_potentials(self, indices: np.ndarray) -> None:
+        self._final_potentials[indices] = get_tier_potentials(
+            [self._WORLDS[index] for index in indices]
+        )
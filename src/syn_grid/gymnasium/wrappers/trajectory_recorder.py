@@ -0,0 +1,280 @@
+from syn_grid.config.models import ObsConfig, WorldConfig
+from syn_grid.core.grid_world import GridWorld
+from syn_grid.gymnasium.environment import SYNGridEnv
+
+import gymnasium as gym
+import numpy as np
+from pathlib import Path
+from typing import Any, Final, Iterator
+
+# Four 2-bit actions share one byte, the first one in the lowest bits
+_SHIFTS: Final[np.ndarray] = np.array([0, 2, 4, 6], np.uint8)
+
+
+def pack_actions(actions: np.ndarray) -> np.ndarray:
+    """
+    Pack actions in [0, 3] into 2 bits each.
+
+    :param actions: The actions of one episode.
+    :return: `ceil(len(actions) / 4)` bytes.
+    """
+
+    padded = np.zeros(-(-len(actions) // 4) * 4, np.uint8)
+    padded[: len(actions)] = actions
+
+    return np.bitwise_or.reduce(padded.reshape(-1, 4) << _SHIFTS, axis=1)
+
+
+def unpack_actions(packed: np.ndarray, length: int) -> np.ndarray:
+    """
+    Undo `pack_actions()`.
+
+    :param packed: The packed bytes.
+    :param length: The number of actions.
+    :return: The actions.
+    """
+
+    return ((packed[:, None] >> _SHIFTS) & 3).reshape(-1)[:length]
+
+
+class TrajectoryRecorder(gym.Wrapper):
+    """
+    Records episodes as their seed plus the action stream, packed 2 bits per action, instead of
+    storing observations. `TrajectoryReplayer` reconstructs any step exactly by re-simulating the
+    world, so thousands of evaluation episodes fit in a few kilobytes.
+
+    Resets without a seed get one drawn from the recorder's own generator, so every episode can be
+    replayed on its own. With `record_rewards` the rewards are kept as sparse change points: only
+    the steps where the reward differs from the previous step. Only finished episodes are saved.
+
+    The wrapped env must be a `SYNGridEnv`, possibly behind wrappers that leave the actions
+    untouched, and its configs must not change while recording. Scenario bank resets are not
+    supported.
+    """
+
+    # ================= #
+    #       Init        #
+    # ================= #
+
+    def __init__(
+        self,
+        env: gym.Env,
+        path: str | Path,
+        record_rewards: bool = False,
+        seed: int | None = None,
+    ):
+        if not isinstance(env.unwrapped, SYNGridEnv):
+            raise TypeError("TrajectoryRecorder must wrap a SYNGridEnv")
+
+        super().__init__(env)
+        self._ENV: Final[SYNGridEnv] = env.unwrapped
+        self._PATH: Final[Path] = Path(path)
+        self._RECORD_REWARDS: Final[bool] = record_rewards
+        self._seed_rng = np.random.default_rng(seed)
+
+        self._confs: tuple[WorldConfig, ObsConfig] | None = None
+        self._seeds: list[int] = []
+        self._lengths: list[int] = []
+        self._packed_actions: list[np.ndarray] = []
+        self._reward_steps: list[np.ndarray] = []
+        self._reward_values: list[np.ndarray] = []
+
+        self._actions: list[int] = []
+        self._rewards: list[float] = []
+        self._episode_seed: int | None = None
+
+    # ======================== #
+    #    Gymnasium contract    #
+    # ======================== #
+
+    def reset(
+        self, *, seed: int | None = None, options: dict[str, Any] | None = None
+    ) -> tuple[Any, dict[str, Any]]:
+        if options and "scenario" in options:
+            raise ValueError("Scenario bank resets can't be recorded")
+        if seed is None:
+            seed = int(self._seed_rng.integers(1 << 31))
+
+        obs, info = self.env.reset(seed=seed, options=options)
+
+        confs = (self._ENV.run_conf, self._ENV.obs_conf)
+        if self._confs is None:
+            self._confs = confs
+        elif confs != self._confs:
+            raise ValueError("The env configs changed while recording")
+
+        self._episode_seed = seed
+        self._actions.clear()
+        self._rewards.clear()
+
+        return obs, info
+
+    def step(self, action: Any) -> tuple[Any, float, bool, bool, dict[str, Any]]:
+        obs, reward, terminated, truncated, info = self.env.step(action)
+
+        self._actions.append(int(action))
+        self._rewards.append(float(reward))
+        if terminated or truncated:
+            self._finish_episode()
+
+        return obs, reward, terminated, truncated, info
+
+    def close(self) -> None:
+        self.save()
+        super().close()
+
+    # ================= #
+    #        API        #
+    # ================= #
+
+    def save(self) -> None:
+        """
+        Write all finished episodes to the recorder's `.npz` file.
+        """
+
+        if self._confs is None:
+            return
+
+        data: dict[str, np.ndarray] = {
+            "seeds": np.asarray(self._seeds, np.int64),
+            "lengths": np.asarray(self._lengths, np.int64),
+            "actions": np.concatenate([np.zeros(0, np.uint8), *self._packed_actions]),
+            "world_conf": np.array(self._confs[0].model_dump_json()),
+            "obs_conf": np.array(self._confs[1].model_dump_json()),
+        }
+        if self._RECORD_REWARDS:
+            data["reward_counts"] = np.asarray(
+                [len(steps) for steps in self._reward_steps], np.int64
+            )
+            data["reward_steps"] = np.concatenate(
+                [np.zeros(0, np.int32), *self._reward_steps]
+            )
+            data["reward_values"] = np.concatenate(
+                [np.zeros(0, np.float32), *self._reward_values]
+            )
+
+        np.savez_compressed(self._PATH, **data)
+
+    # ================= #
+    #      Helpers      #
+    # ================= #
+
+    def _finish_episode(self) -> None:
+        self._seeds.append(self._episode_seed)  # type: ignore[arg-type]
+        self._lengths.append(len(self._actions))
+        self._packed_actions.append(pack_actions(np.asarray(self._actions, np.uint8)))
+
+        if self._RECORD_REWARDS:
+            rewards = np.asarray(self._rewards, np.float32)
+            changes = np.flatnonzero(np.diff(rewards, prepend=np.nan) != 0)
+            self._reward_steps.append(changes.astype(np.int32))
+            self._reward_values.append(rewards[changes])
+
+
+class TrajectoryReplayer:
+    """
+    Reads the episodes written by `TrajectoryRecorder` and re-simulates them through the world,
+    skipping observations, so any step of any episode can be inspected or rendered.
+    """
+
+    # ================= #
+    #       Init        #
+    # ================= #
+
+    def __init__(self, path: str | Path):
+        with np.load(path) as data:
+            self.SEEDS: Final[np.ndarray] = data["seeds"]
+            self.LENGTHS: Final[np.ndarray] = data["lengths"]
+            self._ACTIONS: Final[np.ndarray] = data["actions"]
+            self._ENV: Final[SYNGridEnv] = SYNGridEnv(
+                WorldConfig.model_validate_json(str(data["world_conf"])),
+                ObsConfig.model_validate_json(str(data["obs_conf"])),
+            )
+
+            self._rewards: tuple[np.ndarray, ...] | None = None
+            if "reward_steps" in data:
+                self._rewards = (
+                    data["reward_counts"],
+                    data["reward_steps"],
+                    data["reward_values"],
+                )
+
+        # Byte offset of every episode in the packed action stream
+        self._OFFSETS: Final[np.ndarray] = np.concatenate(
+            [[0], np.cumsum(-(-self.LENGTHS // 4))]
+        )
+
+    # ================= #
+    #        API        #
+    # ================= #
+
+    def __len__(self) -> int:
+        return len(self.SEEDS)
+
+    def get_actions(self, episode: int) -> np.ndarray:
+        """
+        :param episode: The episode index.
+        :return: The episode's actions.
+        """
+
+        packed = self._ACTIONS[self._OFFSETS[episode] : self._OFFSETS[episode + 1]]
+        return unpack_actions(packed, int(self.LENGTHS[episode]))
+
+    def get_rewards(self, episode: int) -> np.ndarray | None:
+        """
+        :param episode: The episode index.
+        :return: The reward of every step, None if rewards weren't recorded.
+        """
+
+        if self._rewards is None:
+            return None
+
+        counts, steps, values = self._rewards
+        start = int(counts[:episode].sum())
+        end = start + int(counts[episode])
+
+        # Forward-fill the change points over the episode
+        rewards = np.empty(int(self.LENGTHS[episode]), np.float32)
+        bounds = np.append(steps[start:end], len(rewards))
+        for value, (first, last) in zip(values[start:end], zip(bounds, bounds[1:])):
+            rewards[first:last] = value
+
+        return rewards
+
+    def iter_steps(self, episode: int) -> Iterator[tuple[int, GridWorld, float]]:
+        """
+        Re-simulate an episode, yielding after every step. The world is reused between steps.
+
+        :param episode: The episode index.
+        :return: An iterator over the step index, the world after the step and its reward.
+        """
+
+        self._ENV.reset_world(int(self.SEEDS[episode]))
+        for step, action in enumerate(self.get_actions(episode)):
+            reward, _, _ = self._ENV.step_world(int(action))
+            yield step, self._ENV.world, reward
+
+    def replay(
+        self, episode: int, steps: int | None = None, observe: bool = False
+    ) -> SYNGridEnv:
+        """
+        Re-simulate an episode up to a step. The world state is always exact, perceptions that
+        keep orbs in the same slots across steps ("vector_hard") only reproduce the recorded
+        observation when every step is observed.
+
+        :param episode: The episode index.
+        :param steps: The number of steps to replay, the whole episode if None.
+        :param observe: Build the observation on every step, like the recorded env did.
+        :return: The replay env in that state, call `observe()` on it for the observation.
+        """
+
+        self._ENV.reset_world(int(self.SEEDS[episode]))
+        if observe:
+            self._ENV.observe()
+
+        for action in self.get_actions(episode)[:steps]:
+            self._ENV.step_world(int(action))
+            if observe:
+                self._ENV.observe()
+
+        return self._ENV
@@ -1,10 +1,33 @@
-from syn_grid.runners.agent_runners.sb3 import StatelessPPO, LstmPPO, FrameStackDQN
 from syn_grid.runners.agent_runners.base_agent_runner import BaseAgentRunner
 
-from typing import Type
+from importlib import import_module
+from typing import Iterator, Mapping, Type
 
-ALGORITHMS: dict[str, Type[BaseAgentRunner]] = {
-    "PPO": StatelessPPO,
-    "RPPO": LstmPPO,
-    "DQN": FrameStackDQN,
-}
+
+class _LazyRunnerRegistry(Mapping[str, Type[BaseAgentRunner]]):
+    """
+    Maps algorithm names to runner classes, importing a runner's module only when it is looked up.
+    Counting or listing the algorithms (e.g. for CLI choices) never imports torch or SB3.
+    """
+
+    def __init__(self, runners: dict[str, str]) -> None:
+        self._RUNNERS = runners
+
+    def __getitem__(self, name: str) -> Type[BaseAgentRunner]:
+        module_name, class_name = self._RUNNERS[name].split(":")
+        return getattr(import_module(module_name), class_name)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._RUNNERS)
+
+    def __len__(self) -> int:
+        return len(self._RUNNERS)
+
+
+ALGORITHMS: Mapping[str, Type[BaseAgentRunner]] = _LazyRunnerRegistry(
+    {
+        "PPO": "syn_grid.runners.agent_runners.sb3.stateless_ppo:StatelessPPO",
+        "RPPO": "syn_grid.runners.agent_runners.sb3.lstm_ppo:LstmPPO",
+        "DQN": "syn_grid.runners.agent_runners.sb3.frame_stack_dqn:FrameStackDQN",
+    }
+)
@@ -1,14 +1,25 @@
 from syn_grid.runners.agent_runners.base_agent_runner import BaseAgentRunner
 from syn_grid.config.models import AgentConfig, WorldConfig, ObsConfig
+from syn_grid.runners.agent_runners.utils.extractors import DequantizeExtractor
+from syn_grid.runners.agent_runners.utils.callbacks import CurriculumCallback
+from syn_grid.runners.agent_runners.utils.vec_envs import SB3VecEnvAdapter
+from syn_grid.config.overrides import apply_stage_to_world, apply_stage_to_obs
+from syn_grid.gymnasium.vector_env import SYNGridVectorEnv
+from syn_grid.gymnasium.environment import EPISODE_INFO_KEYWORDS
 
 
 import os
 from typing import Type, TypeVar, Any, Generic
 from pathlib import Path
-from stable_baselines3.common.monitor import Monitor
 from stable_baselines3.common.base_class import BaseAlgorithm
-from stable_baselines3.common.vec_env import DummyVecEnv
+from stable_baselines3.common.vec_env import (
+    DummyVecEnv,
+    SubprocVecEnv,
+    VecEnv,
+    VecMonitor,
+)
 from gymnasium import Env
+from gymnasium.vector import AsyncVectorEnv, AutoresetMode, VectorEnv
 
 T = TypeVar("T", bound=BaseAlgorithm)
 
@@ -27,51 +38,135 @@ class BaseSB3Runner(BaseAgentRunner, Generic[T]):
         algorithm: Type[T],
         lstm_hidden_size: int | None = None,
     ):
+        curriculum = conf.curriculum
+        self._CURRICULUM_CALLBACK: CurriculumCallback | None = None
+
+        if curriculum.enabled:
+            # The perception is sized for the last stage so the observation shape never changes,
+            # training starts in the first stage and evaluation runs in the last one
+            stages = curriculum.stages
+            obs_conf = apply_stage_to_obs(obs_conf, stages[-1])
+            start_stage = stages[0] if conf.global_agent_conf.training else stages[-1]
+
+            if conf.global_agent_conf.training:
+                self._CURRICULUM_CALLBACK = CurriculumCallback(curriculum, run_conf)
+            run_conf = apply_stage_to_world(run_conf, start_stage)
+
         super().__init__(conf, obs_conf, run_conf)
         super()._construct_model_id(lstm_hidden_size)
         self._HYPER_PARAMETERS = hyper_parameters
         self._ALGORITHM = algorithm
 
     # ================= #
-    #      Helpers      #
+    #        API        #
     # ================= #
 
-    def _make_env(self, render_mode: str | None) -> Env:
-        env = self._make_raw_env(render_mode)
+    def eval(self) -> None:
+        """
+        Run the trained model on a single rendered env for the configured number of episodes and
+        print the average reward and length. Runners only change the env through
+        `_make_raw_env()`, recurrent policies that carry a state between steps bring their own loop.
+        """
+
+        # prep model and env
+        env = self._make_raw_env("human")
+        model = self._load_model(env)
 
-        if self.train_conf.enable_output and self.conf.training:
-            env = self._wrap_in_monitor(env)
+        # stores total reward and episode length for each evaluation episode
+        episode_rewards = []
+        episode_lengths = []
 
-        return env
+        try:
+            for _ in range(self.eval_conf.num_eval_episodes):
+                # start the eval loop
+                obs, _ = env.reset()
+                done = False
+                total_reward = 0.0
+                step_count = 0
+                while not done:
+                    action, _ = model.predict(obs, deterministic=True)
+                    obs, reward, terminated, truncated, info = env.step(action)
+
+                    total_reward += float(reward)
+                    step_count += 1
+                    done = truncated or terminated
+
+                episode_rewards.append(total_reward)
+                episode_lengths.append(step_count)
+        except Exception as e:
+            print(f"System crashed: {e}")
+            raise
+        finally:
+            env.close()
 
-    # === Wrappers === #
+        avg_reward = sum(episode_rewards) / len(episode_rewards)
+        avg_length = sum(episode_lengths) / len(episode_lengths)
+        print(
+            f"Eval over {self.eval_conf.num_eval_episodes} episodes: average reward = {avg_reward:.2f}, average length = {avg_length:.1f}"
+        )
 
-    def _wrap_in_monitor(self, env: Env) -> Env:
+    # ================= #
+    #      Helpers      #
+    # ================= #
+
+    # === Env === #
+
+    def _make_vec_env(self, render_mode: str | None) -> VecEnv:
         """
-        Wrap the environment with a Monitor for logging.
-        The created csv is needed for plotting our own graphs with matplotlib later.
+        Create the environments on the configured vec backend. Only training runs several
+        environments, evaluation always steps a single one. With output enabled, a VecMonitor
+        writes the episodes of all environments, with the env's episode statistics, to one csv per
+        run, which is needed for plotting our own graphs with matplotlib later.
         """
 
-        return Monitor(env=env, filename=str(self.log_dir / self._get_log_identifier()))
+        training = self.conf.training
+        n_envs = self.train_conf.n_envs if training else 1
+        backend = self.train_conf.vec_backend if training else "dummy"
+        env_fns = [lambda: self._make_raw_env(render_mode)] * n_envs
+
+        venv: VecEnv
+        if backend == "dummy":
+            venv = DummyVecEnv(env_fns)
+        elif backend == "subprocess":
+            venv = SubprocVecEnv(env_fns)
+        elif backend == "shared_memory":
+            venv = SB3VecEnvAdapter(
+                AsyncVectorEnv(
+                    env_fns,
+                    shared_memory=True,
+                    autoreset_mode=AutoresetMode.SAME_STEP,
+                )
+            )
+        else:
+            venv = SB3VecEnvAdapter(self._make_native_vec_env(n_envs))
 
-    def _make_wrapped_dummy_vec_env(self, render_mode: str | None) -> DummyVecEnv:
-        return DummyVecEnv([lambda: self._make_env(render_mode)])
+        if self.train_conf.enable_output and training:
+            venv = VecMonitor(
+                venv,
+                filename=str(self.log_dir / self._get_log_identifier()),
+                info_keywords=EPISODE_INFO_KEYWORDS,
+            )
+
+        return venv
+
+    def _make_native_vec_env(self, n_envs: int) -> VectorEnv:
+        return SYNGridVectorEnv(n_envs, self.run_conf, self.obs_conf)
 
     # === Model === #
 
-    def _get_model(self, env: Env | DummyVecEnv) -> T:
+    def _get_model(self, env: Env | VecEnv) -> T:
         if self.train_conf.continue_training or not self.conf.training:
             return self._load_model(env)
         else:
             return self._create_model(env)
 
-    def _load_model(self, env: Env | DummyVecEnv) -> T:
+    def _load_model(self, env: Env | VecEnv) -> T:
         model_path = self._get_model_path()
         return self._ALGORITHM.load(
             model_path, env=env, device=self._HYPER_PARAMETERS["device"]
         )
 
-    def _create_model(self, env: Env | DummyVecEnv) -> T:
+    def _create_model(self, env: Env | VecEnv) -> T:
         os.environ["CUDA_VISIBLE_DEVICES"] = ""
 
         return self._ALGORITHM(
@@ -80,12 +175,42 @@ class BaseSB3Runner(BaseAgentRunner, Generic[T]):
             tensorboard_log=(
                 str(self.log_dir) if self.train_conf.enable_output else None
             ),
-            **self._HYPER_PARAMETERS,
+            **self._get_hyper_parameters(env),
         )
 
+    def _get_hyper_parameters(self, env: Env | VecEnv) -> dict[str, Any]:
+        if self.obs_conf.observation_handler.obs_dtype != "uint8":
+            return self._HYPER_PARAMETERS
+
+        # Put the dequantizing extractor in front of whatever extractor the policy would use
+        if isinstance(env, VecEnv):
+            params = env.env_method("get_dequantization_params", indices=0)[0]
+        else:
+            params = env.unwrapped.get_dequantization_params()  # type: ignore[attr-defined]
+
+        policy_kwargs = dict(self._HYPER_PARAMETERS.get("policy_kwargs", {}))
+        policy_kwargs["features_extractor_kwargs"] = {
+            "scale": self._collect_param(params, "scale"),
+            "offset": self._collect_param(params, "offset"),
+            "features_extractor_class": policy_kwargs.pop(
+                "features_extractor_class", None
+            ),
+            "features_extractor_kwargs": policy_kwargs.get("features_extractor_kwargs"),
+        }
+        policy_kwargs["features_extractor_class"] = DequantizeExtractor
+
+        return {**self._HYPER_PARAMETERS, "policy_kwargs": policy_kwargs}
+
+    def _collect_param(self, params: dict, name: str) -> Any:
+        # Plain Box spaces have the arrays at the top level, dict spaces nest them per key
+        if name in params:
+            return params[name]
+
+        return {key: sub[name] for key, sub in params.items()}
+
     # === Train === #
 
-    def _train_model(self, model: T, env: Env | DummyVecEnv):
+    def _train_model(self, model: T, env: Env | VecEnv):
         try:
             # This loop will keep training based on timesteps and iterations.
             # After the timesteps are completed, the model is saved and training
@@ -98,6 +223,7 @@ class BaseSB3Runner(BaseAgentRunner, Generic[T]):
                 # Train the model
                 model.learn(
                     total_timesteps=self.train_conf.timesteps,
+                    callback=self._CURRICULUM_CALLBACK,
                     tb_log_name=self._get_log_identifier(),
                     reset_num_timesteps=False,
                 )
@@ -1,20 +1,60 @@
 from syn_grid.runners.agent_runners.sb3.base_sb3_runner import BaseSB3Runner
+from syn_grid.runners.agent_runners.utils.replay_buffers import FrameStackReplayBuffer
 from syn_grid.config.models import AgentConfig, WorldConfig, ObsConfig
+from syn_grid.gymnasium.wrappers import FrameStack
 
+import numpy as np
+from typing import Any, Final
+from gymnasium import Env
+from gymnasium.vector import VectorEnv
+from stable_baselines3 import DQN
+
+
+class FrameStackDQN(BaseSB3Runner[DQN]):
+    _N_STACK: Final[int] = 4
 
-class FrameStackDQN(BaseSB3Runner):
     # ================= #
     #       Init        #
     # ================= #
 
-    def __init__(
-        self, conf: AgentConfig, obs_conf: ObsConfig, run_conf: WorldConfig
-    ): ...
+    def __init__(self, conf: AgentConfig, obs_conf: ObsConfig, run_conf: WorldConfig):
+        hyper_parameters = {
+            "policy": "MlpPolicy",
+            "device": "cpu",
+            "buffer_size": 100_000,
+            "learning_starts": 1_000,
+            "batch_size": 64,
+            "learning_rate": 5e-4,
+            "target_update_interval": 1_000,
+            "exploration_fraction": 0.2,
+            "replay_buffer_class": FrameStackReplayBuffer,
+            "replay_buffer_kwargs": {"n_stack": self._N_STACK},
+        }
+        super().__init__(conf, obs_conf, run_conf, hyper_parameters, DQN)
 
     # ================= #
     #        API        #
     # ================= #
 
-    def train(self) -> None: ...
+    def train(self) -> None:
+        env = self._make_vec_env(self.train_conf.render_mode)
+        model = self._get_model(env)
+
+        self._train_model(model, env)
+
+    # ================= #
+    #      Helpers      #
+    # ================= #
+
+    def _make_raw_env(self, render_mode: str | None) -> Env:
+        # Stacking happens inside the env so the replay buffer only has to keep the newest frame
+        return FrameStack(super()._make_raw_env(render_mode), self._N_STACK)
+
+    def _make_native_vec_env(self, n_envs: int) -> VectorEnv:
+        raise ValueError(
+            "FrameStackDQN stacks frames per env, use another vec backend than native"
+        )
 
-    def eval(self) -> None: ...
+    def _collect_param(self, params: dict, name: str) -> Any:
+        # Dequantization parameters are per frame, the policy sees n_stack frames back to back
+        return np.tile(super()._collect_param(params, name), self._N_STACK)
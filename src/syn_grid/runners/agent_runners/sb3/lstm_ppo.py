@@ -40,14 +40,14 @@ class LstmPPO(BaseSB3Runner[RecurrentPPO]):
     # ================= #
 
     def train(self) -> None:
-        env = self._make_wrapped_dummy_vec_env(self.train_conf.render_mode)
+        env = self._make_vec_env(self.train_conf.render_mode)
         model = self._get_model(env)
 
         self._train_model(model, env)
 
     def eval(self) -> None:
         # prep model and env
-        env = self._make_wrapped_dummy_vec_env("human")
+        env = self._make_vec_env("human")
         model = self._get_model(env)
 
         # prep lstm variables
@@ -0,0 +1,87 @@
+from syn_grid.config.models import CurriculumConf, WorldConfig
+from syn_grid.config.overrides import apply_stage_to_world
+
+import numpy as np
+from collections import deque
+from typing import Final
+from stable_baselines3.common.callbacks import BaseCallback
+
+
+class CurriculumCallback(BaseCallback):
+    """
+    Advances the training envs through the curriculum stages whenever the rolling mean episode
+    return plateaus.
+
+    Returns are tracked from the rollout rewards and dones, so no Monitor wrapper is needed. When
+    the rolling mean over the last `window` episodes hasn't improved by `min_delta` for `patience`
+    episodes, every env is reconfigured to the next stage through `env_method("reconfigure")`,
+    which takes effect at each env's next reset.
+    """
+
+    # ================= #
+    #       Init        #
+    # ================= #
+
+    def __init__(self, conf: CurriculumConf, run_conf: WorldConfig, verbose: int = 0):
+        super().__init__(verbose)
+        self._CONF: Final[CurriculumConf] = conf
+        self._STAGE_CONFS: Final[list[WorldConfig]] = [
+            apply_stage_to_world(run_conf, stage) for stage in conf.stages
+        ]
+        self.stage = 0
+
+        self._returns: deque[float] = deque(maxlen=conf.window)
+        self._reset_plateau_tracking()
+
+    # ================= #
+    #      Helpers      #
+    # ================= #
+
+    # === SB3 contract === #
+
+    def _init_callback(self) -> None:
+        self._episode_returns = np.zeros(self.training_env.num_envs)
+
+    def _on_step(self) -> bool:
+        self._episode_returns += self.locals["rewards"]
+
+        for index in np.flatnonzero(self.locals["dones"]):
+            self._returns.append(float(self._episode_returns[index]))
+            self._episode_returns[index] = 0.0
+            self._update_plateau()
+
+        self.logger.record("curriculum/stage", self.stage)
+        return True
+
+    # === Curriculum === #
+
+    def _update_plateau(self) -> None:
+        if self.stage >= len(self._STAGE_CONFS) - 1:
+            return
+        if len(self._returns) < self._CONF.window:
+            return
+
+        mean_return = float(np.mean(self._returns))
+        if mean_return > self._best_mean + self._CONF.min_delta:
+            self._best_mean = mean_return
+            self._episodes_without_progress = 0
+            return
+
+        self._episodes_without_progress += 1
+        if self._episodes_without_progress >= self._CONF.patience:
+            self._advance()
+
+    def _advance(self) -> None:
+        self.stage += 1
+        self.training_env.env_method("reconfigure", self._STAGE_CONFS[self.stage])
+
+        # Returns of the previous stage say nothing about the new one
+        self._returns.clear()
+        self._reset_plateau_tracking()
+
+        if self.verbose > 0:
+            print(f"Curriculum advanced to stage {self.stage}")
+
+    def _reset_plateau_tracking(self) -> None:
+        self._best_mean = -np.inf
+        self._episodes_without_progress = 0
@@ -1,8 +1,13 @@
 import torch as th
 import torch.nn as nn
+import numpy as np
 from gymnasium import spaces
 from typing import Any
-from stable_baselines3.common.torch_layers import BaseFeaturesExtractor
+from stable_baselines3.common.torch_layers import (
+    BaseFeaturesExtractor,
+    CombinedExtractor,
+    FlattenExtractor,
+)
 
 # TODO: look over these. TinyGridCNN works and can train CnnPolicy, but I haven't checked the logic
 # yet. GroupedMetaExtractor is for learning the agent to process a dict in its logically structured
@@ -102,3 +107,221 @@ class TinyGridCNN(BaseFeaturesExtractor):
         # Convert from channels-last (H, W, C) to channels-first (C, H, W)
         x = observations.permute(0, 3, 1, 2)
         return self.linear(self.cnn(x))
+
+
+class CompositeExtractor(BaseFeaturesExtractor):
+    """
+    Feature extractor for the composite perceptions: a small CNN over the `grid` view and an MLP
+    over the `global` view, concatenated into one feature vector.
+    """
+
+    @classmethod
+    def get_agent_hyperparameters(cls) -> dict[str, Any]:
+        return {
+            "policy": "MultiInputPolicy",
+            "device": "cpu",
+            "ent_coef": 0.02,
+            "policy_kwargs": {
+                "features_extractor_class": cls,
+                "normalize_images": False,
+            },
+        }
+
+    def __init__(self, observation_space: spaces.Dict, features_dim: int = 96):
+        super().__init__(observation_space, features_dim)
+        grid_shape = observation_space.spaces["grid"].shape
+        global_dim = observation_space.spaces["global"].shape[0]
+        self._build_networks(grid_shape, global_dim, features_dim)
+
+    def forward(self, observations: dict[str, th.Tensor]) -> th.Tensor:
+        return self._combine(observations["grid"], observations["global"])
+
+    # === Helpers === #
+
+    def _build_networks(
+        self, grid_shape: tuple[int, ...], global_dim: int, features_dim: int
+    ) -> None:
+        rows, cols, channels = grid_shape
+
+        # Padding keeps the spatial size, so even 1x1 grids are valid input
+        self.grid_net = nn.Sequential(
+            nn.Conv2d(channels, 16, kernel_size=3, stride=1, padding=1),
+            nn.ReLU(),
+            nn.Conv2d(16, 32, kernel_size=3, stride=1, padding=1),
+            nn.ReLU(),
+            nn.Flatten(),
+        )
+        self.global_net = nn.Sequential(nn.Linear(global_dim, 32), nn.ReLU())
+        self.linear = nn.Sequential(
+            nn.Linear(32 * rows * cols + 32, features_dim), nn.ReLU()
+        )
+
+    def _combine(self, grid: th.Tensor, global_values: th.Tensor) -> th.Tensor:
+        # Channels last (B, H, W, C) -> channels first (B, C, H, W)
+        grid_features = self.grid_net(grid.permute(0, 3, 1, 2))
+        global_features = self.global_net(global_values)
+        return self.linear(th.cat([grid_features, global_features], dim=1))
+
+
+class FlatCompositeExtractor(CompositeExtractor):
+    """
+    Same network as `CompositeExtractor`, but fed with the flattened composite buffer
+    (`flatten: true` in the perception config). The batch is split back into grid and global
+    values with tensor views, so the policy gets one input key and one copy per step.
+    """
+
+    @classmethod
+    def get_agent_hyperparameters(
+        cls, grid_shape: tuple[int, int, int] = (5, 5, 5)
+    ) -> dict[str, Any]:
+        return {
+            "policy": "MlpPolicy",
+            "device": "cpu",
+            "ent_coef": 0.02,
+            "policy_kwargs": {
+                "features_extractor_class": cls,
+                "features_extractor_kwargs": {"grid_shape": grid_shape},
+            },
+        }
+
+    def __init__(
+        self,
+        observation_space: spaces.Box,
+        grid_shape: tuple[int, int, int],
+        features_dim: int = 96,
+    ):
+        BaseFeaturesExtractor.__init__(self, observation_space, features_dim)
+        self._GRID_SHAPE = tuple(grid_shape)
+        self._GRID_SIZE = int(np.prod(grid_shape))
+        global_dim = observation_space.shape[0] - self._GRID_SIZE
+        self._build_networks(self._GRID_SHAPE, global_dim, features_dim)
+
+    def forward(self, observations: th.Tensor) -> th.Tensor:
+        grid = observations[:, : self._GRID_SIZE].reshape(-1, *self._GRID_SHAPE)
+        return self._combine(grid, observations[:, self._GRID_SIZE :])
+
+
+class DeepSetsExtractor(BaseFeaturesExtractor):
+    """
+    Permutation-invariant feature extractor for the entity perception. Every entity row goes
+    through the same MLP, the results are averaged over the rows marked valid in `mask` and
+    concatenated with an MLP over the `global` values.
+    """
+
+    @classmethod
+    def get_agent_hyperparameters(cls) -> dict[str, Any]:
+        return {
+            "policy": "MultiInputPolicy",
+            "device": "cpu",
+            "ent_coef": 0.02,
+            "policy_kwargs": {"features_extractor_class": cls},
+        }
+
+    def __init__(
+        self,
+        observation_space: spaces.Dict,
+        features_dim: int = 96,
+        entity_dim: int = 64,
+    ):
+        super().__init__(observation_space, features_dim)
+        entity_features = observation_space.spaces["entities"].shape[-1]
+        global_dim = observation_space.spaces["global"].shape[0]
+
+        self.entity_net = nn.Sequential(
+            nn.Linear(entity_features, entity_dim),
+            nn.ReLU(),
+            nn.Linear(entity_dim, entity_dim),
+            nn.ReLU(),
+        )
+        self.global_net = nn.Sequential(nn.Linear(global_dim, 32), nn.ReLU())
+        self.linear = nn.Sequential(nn.Linear(entity_dim + 32, features_dim), nn.ReLU())
+
+    def forward(self, observations: dict[str, th.Tensor]) -> th.Tensor:
+        mask = observations["mask"].unsqueeze(-1)
+
+        # Masked mean over the entities, empty lists pool to zeros
+        entity_features = self.entity_net(observations["entities"]) * mask
+        pooled = entity_features.sum(dim=1) / mask.sum(dim=1).clamp(min=1.0)
+
+        global_features = self.global_net(observations["global"])
+        return self.linear(th.cat([pooled, global_features], dim=1))
+
+
+class DequantizeExtractor(BaseFeaturesExtractor):
+    """
+    Wraps another feature extractor and maps compact observations (`obs_dtype` uint8 or float16)
+    back to float32 values on the fly, as `code * scale + offset`, before handing them over.
+
+    The scale and offset come from `SYNGridEnv.get_dequantization_params()`. Dict observations
+    take the same parameters nested per key.
+    """
+
+    def __init__(
+        self,
+        observation_space: spaces.Space,
+        scale: np.ndarray | dict[str, np.ndarray],
+        offset: np.ndarray | dict[str, np.ndarray],
+        features_extractor_class: type[BaseFeaturesExtractor] | None = None,
+        features_extractor_kwargs: dict[str, Any] | None = None,
+    ):
+        float_space = self._dequantize_space(observation_space, scale, offset)
+        if features_extractor_class is None:
+            features_extractor_class = (
+                CombinedExtractor
+                if isinstance(float_space, spaces.Dict)
+                else FlattenExtractor
+            )
+        inner = features_extractor_class(
+            float_space, **(features_extractor_kwargs or {})
+        )
+
+        super().__init__(observation_space, inner.features_dim)
+        self.inner = inner
+
+        # Buffers follow the module between devices and are saved together with the policy
+        if isinstance(observation_space, spaces.Dict):
+            self._KEYS = list(observation_space.spaces.keys())
+            for key in self._KEYS:
+                self.register_buffer(f"_scale_{key}", th.as_tensor(scale[key]))
+                self.register_buffer(f"_offset_{key}", th.as_tensor(offset[key]))
+        else:
+            self._KEYS = None
+            self.register_buffer("_scale", th.as_tensor(scale))
+            self.register_buffer("_offset", th.as_tensor(offset))
+
+    def forward(self, observations: th.Tensor | dict[str, th.Tensor]) -> th.Tensor:
+        if self._KEYS is None:
+            return self.inner(observations * self._scale + self._offset)
+
+        return self.inner(
+            {
+                key: observations[key] * getattr(self, f"_scale_{key}")
+                + getattr(self, f"_offset_{key}")
+                for key in self._KEYS
+            }
+        )
+
+    # === Helpers === #
+
+    @staticmethod
+    def _dequantize_space(
+        space: spaces.Space,
+        scale: np.ndarray | dict[str, np.ndarray],
+        offset: np.ndarray | dict[str, np.ndarray],
+    ) -> spaces.Space:
+        if isinstance(space, spaces.Dict):
+            return spaces.Dict(
+                {
+                    key: DequantizeExtractor._dequantize_space(
+                        sub, scale[key], offset[key]
+                    )
+                    for key, sub in space.spaces.items()
+                }
+            )
+
+        return spaces.Box(
+            low=space.low * scale + offset,
+            high=space.high * scale + offset,
+            shape=space.shape,
+            dtype=np.float32,
+        )
@@ -0,0 +1,164 @@
+import numpy as np
+import torch as th
+from gymnasium import spaces
+from typing import Any
+from stable_baselines3.common.buffers import BaseBuffer, ReplayBuffer
+from stable_baselines3.common.type_aliases import ReplayBufferSamples
+from stable_baselines3.common.vec_env import VecNormalize
+
+
+class FrameStackReplayBuffer(ReplayBuffer):
+    """
+    Replay buffer for flat observations stacked by `FrameStack`, storing every frame only once.
+
+    Consecutive stacked observations share all but one frame, so only the newest frame of each
+    observation is kept, together with the newest frame of the next observation (needed for
+    terminal observations, which never become the `obs` of a later transition) and how far the
+    observation is into its episode. Stacks are rebuilt at sample time, padding frames before the
+    start of the episode with its first frame, exactly like `FrameStack` does at reset.
+
+    This cuts observation memory by a factor of `n_stack` compared to the default `ReplayBuffer`.
+    """
+
+    # ================= #
+    #       Init        #
+    # ================= #
+
+    def __init__(
+        self,
+        buffer_size: int,
+        observation_space: spaces.Space,
+        action_space: spaces.Space,
+        device: th.device | str = "auto",
+        n_envs: int = 1,
+        optimize_memory_usage: bool = False,
+        handle_timeout_termination: bool = True,
+        n_stack: int = 4,
+    ):
+        # Skip ReplayBuffer.__init__, it would allocate the full stacked observation arrays
+        BaseBuffer.__init__(
+            self, buffer_size, observation_space, action_space, device, n_envs=n_envs
+        )
+
+        if optimize_memory_usage:
+            raise ValueError(
+                "FrameStackReplayBuffer already shares frames, disable optimize_memory_usage"
+            )
+        if len(self.obs_shape) != 1 or self.obs_shape[0] % n_stack != 0:
+            raise ValueError(
+                "FrameStackReplayBuffer expects flat observations of n_stack equally sized frames"
+            )
+
+        self.buffer_size = max(buffer_size // n_envs, 1)
+        self.optimize_memory_usage = False
+        self.handle_timeout_termination = handle_timeout_termination
+        self.n_stack = n_stack
+        self.frame_size = self.obs_shape[0] // n_stack
+
+        obs_dtype = observation_space.dtype
+        self.frames = np.zeros((self.buffer_size, n_envs, self.frame_size), obs_dtype)
+        self.next_frames = np.zeros_like(self.frames)
+        # Steps since the episode start, capped at n_stack - 1 since older history is never needed
+        self.frame_offsets = np.zeros((self.buffer_size, n_envs), np.uint8)
+        self._episode_steps = np.zeros(n_envs, np.int64)
+
+        self.actions = np.zeros(
+            (self.buffer_size, n_envs, self.action_dim),
+            dtype=self._maybe_cast_dtype(action_space.dtype),
+        )
+        self.rewards = np.zeros((self.buffer_size, n_envs), dtype=np.float32)
+        self.dones = np.zeros((self.buffer_size, n_envs), dtype=np.float32)
+        self.timeouts = np.zeros((self.buffer_size, n_envs), dtype=np.float32)
+
+    # ================= #
+    #        API        #
+    # ================= #
+
+    def add(
+        self,
+        obs: np.ndarray,
+        next_obs: np.ndarray,
+        action: np.ndarray,
+        reward: np.ndarray,
+        done: np.ndarray,
+        infos: list[dict[str, Any]],
+    ) -> None:
+        obs = obs.reshape((self.n_envs, self.obs_shape[0]))
+        next_obs = next_obs.reshape((self.n_envs, self.obs_shape[0]))
+
+        self.frames[self.pos] = obs[:, -self.frame_size :]
+        self.next_frames[self.pos] = next_obs[:, -self.frame_size :]
+        self.frame_offsets[self.pos] = np.minimum(self._episode_steps, self.n_stack - 1)
+        self._episode_steps = np.where(done, 0, self._episode_steps + 1)
+
+        action = action.reshape((self.n_envs, self.action_dim))
+        self.actions[self.pos] = np.array(action)
+        self.rewards[self.pos] = np.array(reward)
+        self.dones[self.pos] = np.array(done)
+
+        if self.handle_timeout_termination:
+            self.timeouts[self.pos] = np.array(
+                [info.get("TimeLimit.truncated", False) for info in infos]
+            )
+
+        self.pos += 1
+        if self.pos == self.buffer_size:
+            self.full = True
+            self.pos = 0
+
+    def sample(
+        self, batch_size: int, env: VecNormalize | None = None
+    ) -> ReplayBufferSamples:
+        if not self.full:
+            batch_inds = np.random.randint(0, self.pos, size=batch_size)
+        else:
+            # The oldest n_stack - 1 positions may miss their history, it has been overwritten
+            batch_inds = (
+                np.random.randint(self.n_stack - 1, self.buffer_size, size=batch_size)
+                + self.pos
+            ) % self.buffer_size
+
+        return self._get_samples(batch_inds, env=env)
+
+    # ================= #
+    #      Helpers      #
+    # ================= #
+
+    def _get_samples(
+        self, batch_inds: np.ndarray, env: VecNormalize | None = None
+    ) -> ReplayBufferSamples:
+        env_indices = np.random.randint(0, high=self.n_envs, size=(len(batch_inds),))
+
+        obs = self._stack_frames(batch_inds, env_indices, lag_shift=0)
+        next_obs = self._stack_frames(batch_inds, env_indices, lag_shift=1)
+        next_obs[:, -self.frame_size :] = self.next_frames[batch_inds, env_indices]
+
+        data = (
+            self._normalize_obs(obs, env),
+            self.actions[batch_inds, env_indices, :],
+            self._normalize_obs(next_obs, env),
+            # Only use dones that are not due to timeouts
+            (
+                self.dones[batch_inds, env_indices]
+                * (1 - self.timeouts[batch_inds, env_indices])
+            ).reshape(-1, 1),
+            self._normalize_reward(
+                self.rewards[batch_inds, env_indices].reshape(-1, 1), env
+            ),
+        )
+        return ReplayBufferSamples(*tuple(map(self.to_torch, data)))
+
+    def _stack_frames(
+        self, batch_inds: np.ndarray, env_indices: np.ndarray, lag_shift: int
+    ) -> np.ndarray:
+        # Slot j (oldest first) of the stack at position i holds the frame stored `lag` positions
+        # back, clamped to the start of the episode. `lag_shift` moves the window one step ahead
+        # for next observations, whose newest frame is filled in by the caller.
+        lags = np.arange(self.n_stack - 1, -1, -1) - lag_shift
+        offsets = self.frame_offsets[batch_inds, env_indices].astype(np.int64)
+        lags = np.clip(lags[None, :], 0, offsets[:, None])
+
+        positions = (batch_inds[:, None] - lags) % self.buffer_size
+        stacked = self.frames[positions, env_indices[:, None]]
+
+        return stacked.reshape(len(batch_inds), -1)
@@ -0,0 +1,158 @@
+from syn_grid.gymnasium.vector_env import SYNGridVectorEnv
+
+import numpy as np
+from typing import Any, Sequence
+from gymnasium.vector import AutoresetMode, VectorEnv
+from stable_baselines3.common.vec_env import VecEnv
+from stable_baselines3.common.vec_env.base_vec_env import (
+    VecEnvIndices,
+    VecEnvObs,
+    VecEnvStepReturn,
+)
+
+
+class SB3VecEnvAdapter(VecEnv):
+    """
+    Exposes a Gymnasium `VectorEnv` as an SB3 `VecEnv`, e.g. the batched `SYNGridVectorEnv` or an
+    `AsyncVectorEnv` with shared memory.
+
+    The vector env must reset finished episodes within the same step (`SAME_STEP` autoreset), its
+    `final_obs` becomes SB3's `terminal_observation` and the batched info arrays are split into
+    one dict per environment. Calls to sub-env methods and attributes go to the single envs of a
+    `SYNGridVectorEnv` directly, other vector envs forward them to their workers.
+    """
+
+    # ================= #
+    #       Init        #
+    # ================= #
+
+    def __init__(self, venv: VectorEnv):
+        if venv.metadata.get("autoreset_mode") != AutoresetMode.SAME_STEP:
+            raise ValueError("The vector env must use the SAME_STEP autoreset mode")
+
+        # Set first, the base class already queries the sub-envs' render mode
+        self.venv = venv
+        super().__init__(
+            venv.num_envs, venv.single_observation_space, venv.single_action_space
+        )
+        self._actions: np.ndarray | None = None
+
+    # ================= #
+    #        API        #
+    # ================= #
+
+    def reset(self) -> VecEnvObs:
+        seeds = None if all(seed is None for seed in self._seeds) else self._seeds
+        obs, _ = self.venv.reset(seed=seeds)
+
+        # Vector envs take one options dict for all environments, per-env options are dropped
+        self._reset_seeds()
+        self._reset_options()
+
+        return obs
+
+    def step_async(self, actions: np.ndarray) -> None:
+        self._actions = actions
+
+    def step_wait(self) -> VecEnvStepReturn:
+        obs, rewards, terminations, truncations, infos = self.venv.step(self._actions)
+        dones = terminations | truncations
+
+        env_infos = self._split_infos(infos)
+        for index in np.flatnonzero(dones):
+            env_infos[index]["terminal_observation"] = env_infos[index].pop("final_obs")
+            env_infos[index]["TimeLimit.truncated"] = bool(
+                truncations[index] and not terminations[index]
+            )
+
+        return obs, rewards.astype(np.float32), dones, env_infos
+
+    def close(self) -> None:
+        self.venv.close()
+
+    def get_attr(self, attr_name: str, indices: VecEnvIndices = None) -> list[Any]:
+        if isinstance(self.venv, SYNGridVectorEnv):
+            return [
+                self.venv.envs[index].get_wrapper_attr(attr_name)
+                for index in self._get_indices(indices)
+            ]
+
+        values = self.venv.get_attr(attr_name)  # type: ignore[attr-defined]
+        return [values[index] for index in self._get_indices(indices)]
+
+    def set_attr(
+        self, attr_name: str, value: Any, indices: VecEnvIndices = None
+    ) -> None:
+        if isinstance(self.venv, SYNGridVectorEnv):
+            for index in self._get_indices(indices):
+                self.venv.envs[index].set_wrapper_attr(attr_name, value)
+            return
+
+        if indices is not None:
+            raise ValueError(
+                "Only SYNGridVectorEnv supports setting attributes per env"
+            )
+        self.venv.set_attr(attr_name, value)  # type: ignore[attr-defined]
+
+    def env_method(
+        self,
+        method_name: str,
+        *method_args,
+        indices: VecEnvIndices = None,
+        **method_kwargs,
+    ) -> list[Any]:
+        if isinstance(self.venv, SYNGridVectorEnv):
+            return [
+                self.venv.envs[index].get_wrapper_attr(method_name)(
+                    *method_args, **method_kwargs
+                )
+                for index in self._get_indices(indices)
+            ]
+
+        results = self.venv.call(  # type: ignore[attr-defined]
+            method_name, *method_args, **method_kwargs
+        )
+        return [results[index] for index in self._get_indices(indices)]
+
+    def env_is_wrapped(
+        self, wrapper_class: type, indices: VecEnvIndices = None
+    ) -> list[bool]:
+        # The sub-envs are created bare, wrappers only go around the whole vector env
+        return [False] * len(self._get_indices(indices))
+
+    # ================= #
+    #      Helpers      #
+    # ================= #
+
+    def _split_infos(self, infos: dict[str, Any]) -> list[dict[str, Any]]:
+        # Gymnasium batches infos into arrays with a "_key" mask of the envs that set them
+        env_infos: list[dict[str, Any]] = [{} for _ in range(self.num_envs)]
+
+        for key, value in infos.items():
+            if key.startswith("_") or key == "final_info":
+                continue
+
+            mask = infos.get(f"_{key}")
+            for index in range(self.num_envs):
+                if mask is None or mask[index]:
+                    env_infos[index][key] = self._pick(value, index)
+
+        return env_infos
+
+    def _pick(self, value: Any, index: int) -> Any:
+        if isinstance(value, dict):
+            return {
+                key: self._pick(sub, index)
+                for key, sub in value.items()
+                if not key.startswith("_")
+            }
+
+        return value[index]
+
+    def _get_indices(self, indices: VecEnvIndices) -> Sequence[int]:
+        if indices is None:
+            return range(self.num_envs)
+        if isinstance(indices, int):
+            return [indices]
+
+        return list(indices)
@@ -1,6 +1,10 @@
 from syn_grid.config.models import WorldConfig
 from syn_grid.rendering.pygame_renderer import PygameRenderer
 from syn_grid.core.grid_world import GridWorld
+from syn_grid.core.spawn_sources import RandomSpawnSource
+from syn_grid.utils.seeding import get_spawn_rngs
+
+from numpy.random import default_rng
 
 
 class HumanRunner:
@@ -8,7 +12,7 @@ class HumanRunner:
     #       Init        #
     # ================= #
 
-    def __init__(self, run_conf: WorldConfig, steps_left: int):
+    def __init__(self, run_conf: WorldConfig, steps_left: int, seed: int | None = None):
         self._renderer = PygameRenderer(run_conf.renderer_conf, 60)
         self._world = GridWorld(
             run_conf.grid_world_conf,
@@ -18,13 +22,20 @@ class HumanRunner:
             run_conf.tier_orb_conf,
         )
         self._steps_left = steps_left
+        # Seeded like the environments, so a human plays the same spawns an agent would
+        self._rng = default_rng(seed)
 
     # ================= #
     #        API        #
     # ================= #
 
     def human_player_loop(self) -> None:
-        self._world.reset()
+        self._world.reset(
+            self._rng,
+            RandomSpawnSource(
+                *get_spawn_rngs(self._rng), self._world.LAYOUT.FREE_CELLS
+            ),
+        )
         self._render()
         action = None
 
@@ -81,6 +81,22 @@ def parse_args() -> Namespace:
         help="Number of training iterations",
     )
 
+    parser.add_argument(
+        "--n-envs",
+        type=int,
+        default=None,
+        metavar=": int",
+        help="Number of environments to train on in parallel",
+    )
+
+    parser.add_argument(
+        "--vec-backend",
+        type=str,
+        default=None,
+        choices=["dummy", "subprocess", "shared_memory", "native"],
+        help="How the training environments are run",
+    )
+
     # === Eval values === #
 
     parser.add_argument(
@@ -1,4 +1,5 @@
 import os
+import sys
 
 
 def get_package_path(*relative_path_parts: str) -> str:
@@ -19,6 +20,26 @@ def get_project_path(*relative_path_parts: str) -> str:
     return os.path.join(base_dir, *relative_path_parts)
 
 
+def get_cache_path(*relative_path_parts: str) -> str:
+    """
+    Returns an absolute path inside the user's cache directory for this package,
+    which stays writable when the package itself is installed read-only.
+    """
+
+    if sys.platform == "win32":
+        base_dir = os.environ.get("LOCALAPPDATA") or os.path.expanduser(
+            os.path.join("~", "AppData", "Local")
+        )
+    elif sys.platform == "darwin":
+        base_dir = os.path.expanduser(os.path.join("~", "Library", "Caches"))
+    else:
+        base_dir = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser(
+            os.path.join("~", ".cache")
+        )
+
+    return os.path.join(base_dir, "syn_grid", *relative_path_parts)
+
+
 ################
 #    Helpers   #
 ################
@@ -0,0 +1,61 @@
+from numpy.random import Generator, PCG64, SeedSequence
+
+# Spawn keys of the subsystems with their own stream below an environment's seed sequence
+_ORB_STREAM = 0
+_CELL_STREAM = 1
+
+
+def get_child_sequence(seed_seq: SeedSequence, index: int) -> SeedSequence:
+    """
+    Return the `index`-th child of a seed sequence, the same one `seed_seq.spawn()` would hand
+    out, but without depending on how many children were spawned before.
+
+    :param seed_seq: The parent sequence.
+    :param index: The child's index.
+    :return: The child sequence.
+    """
+
+    return SeedSequence(
+        seed_seq.entropy,
+        spawn_key=(*seed_seq.spawn_key, index),
+        pool_size=seed_seq.pool_size,
+    )
+
+
+def get_env_seed_sequences(
+    seed: int | None, num_envs: int, start: int = 0
+) -> list[SeedSequence]:
+    """
+    Independent seed sequences for the environments `start` to `start + num_envs - 1` of a run.
+    An environment's stream only depends on the run's seed and its global index, so splitting the
+    environments over any number of workers (each passing its own `start`) gives identical
+    results.
+
+    :param seed: The run's seed, fresh entropy if None.
+    :param num_envs: The number of sequences.
+    :param start: Global index of the first environment.
+    :return: One seed sequence per environment.
+    """
+
+    root = SeedSequence(seed)
+    return [get_child_sequence(root, index) for index in range(start, start + num_envs)]
+
+
+def get_spawn_rngs(rng: Generator) -> tuple[Generator, Generator]:
+    """
+    Derive the independent orb selection and spawn cell streams of an environment from the seed
+    sequence behind its main generator, so changing how one subsystem draws leaves the others
+    untouched.
+
+    :param rng: The environment's generator, e.g. `env.np_random`.
+    :return: The orb selection and the spawn cell generators.
+    """
+
+    seed_seq = rng.bit_generator.seed_seq
+    if not isinstance(seed_seq, SeedSequence):
+        raise ValueError("The generator wasn't created from a SeedSequence")
+
+    return (
+        Generator(PCG64(get_child_sequence(seed_seq, _ORB_STREAM))),
+        Generator(PCG64(get_child_sequence(seed_seq, _CELL_STREAM))),
+    )
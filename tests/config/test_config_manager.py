@@ -0,0 +1,109 @@
+from syn_grid.config import config_manager
+from syn_grid.config.config_manager import ConfigManager
+from syn_grid.config.models import FullConf
+from syn_grid.config.views import DroidView
+
+from pathlib import Path
+import sys
+import pytest
+
+
+class TestConfigManager:
+    """
+    Tests for the cached config loading of the ConfigManager.
+
+    Verifies:
+    - Repeated loads return equal but independent instances
+    - A validated config is reused from the on-disk cache without parsing the YAML again
+    - A broken cache file is replaced instead of failing the load
+    - The cache is kept in the user's cache directory, not in the installed package
+    - Hot path views mirror their pydantic configs
+    """
+
+    # ================= #
+    #       Init        #
+    # ================= #
+
+    @pytest.fixture
+    def manager(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> ConfigManager:
+        monkeypatch.setattr(config_manager, "_VALIDATED_CONFIGS", {})
+        manager = ConfigManager("test_configs.yaml")
+        manager.cache_dir = tmp_path
+
+        return manager
+
+    # ================= #
+    #       Tests       #
+    # ================= #
+
+    def test_loads_are_independent(self, manager: ConfigManager):
+        first = manager.load_config(FullConf)
+        second = manager.load_config(FullConf)
+
+        assert first == second
+        first.agent.global_agent_conf.training = (
+            not first.agent.global_agent_conf.training
+        )
+        assert first != second
+
+    def test_reuses_disk_cache(
+        self, manager: ConfigManager, monkeypatch: pytest.MonkeyPatch
+    ):
+        expected = manager.load_config(FullConf)
+        assert len(list(manager.cache_dir.glob("*.pickle"))) == 1
+
+        # A fresh process: empty memo, and the YAML must not be parsed again
+        monkeypatch.setattr(config_manager, "_VALIDATED_CONFIGS", {})
+        monkeypatch.setattr(config_manager.yaml, "safe_load", pytest.fail, raising=True)
+        fresh = ConfigManager("test_configs.yaml")
+        fresh.cache_dir = manager.cache_dir
+
+        assert fresh.load_config(FullConf) == expected
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            b"",
+            b"\x80\x05\x95garbage",
+            b"\x80\x09",
+            b"cno_such_module\nConfig\n.",
+            b"c__builtin__\nlen\n(tR.",
+        ],
+    )
+    def test_broken_cache_is_rebuilt(self, manager: ConfigManager, content: bytes):
+        """
+        A truncated pickle, e.g. left by an interrupted write, or a stale or corrupt one that fails
+        with any other error falls back to parsing the YAML.
+        """
+
+        expected = manager.load_config(FullConf)
+        (cache_file,) = manager.cache_dir.glob("*.pickle")
+        cache_file.write_bytes(content)
+        config_manager._VALIDATED_CONFIGS.clear()
+
+        assert manager.load_config(FullConf) == expected
+        assert cache_file.read_bytes() != content
+        assert not list(manager.cache_dir.glob("*.tmp"))
+
+    @pytest.mark.skipif(
+        sys.platform in ("win32", "darwin"), reason="XDG cache directory"
+    )
+    def test_cache_lives_in_the_user_cache_dir(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+        manager = ConfigManager("test_configs.yaml")
+
+        assert manager.cache_dir == tmp_path / "syn_grid" / "configs"
+        assert not manager.cache_dir.is_relative_to(manager.yaml_path.parent)
+
+    def test_droid_view(self, manager: ConfigManager):
+        conf = manager.load_config(FullConf).world.droid_conf
+        view = DroidView.from_conf(conf)
+
+        assert view.max_row == conf.grid_rows - 1
+        assert view.max_col == conf.grid_cols - 1
+        assert view.step_penalty == conf.step_penalty
+        with pytest.raises(AttributeError):
+            view.step_penalty = 0  # type: ignore[misc]
@@ -1,4 +1,3 @@
-from syn_grid.core.orbs.base_orb import BaseOrb
 from syn_grid.core.orbs.synergy.tier_orb import TierOrb
 from syn_grid.core.droid.digestion_engine import DigestionEngine
 
@@ -9,16 +8,17 @@ import pytest
 
 class TestDigestionEngine:
     _MAX_TIER = 10
-    TierOrb.MAX_TIER = _MAX_TIER
+    _LIFE_SPAN = 8
 
     # ================= #
     #      Helpers      #
     # ================= #
 
     @staticmethod
-    def _tier_params(max_tier=_MAX_TIER) -> list[TierOrb]:
+    def _tier_params(max_tier=_MAX_TIER, life_span=_LIFE_SPAN) -> list[TierOrb]:
+        # max tier is raised by one so the last orb doesn't tap out the chain
         tierOrbs = [
-            (TierOrb(t, get_test_config().world.tier_orb_conf))
+            (TierOrb(t, get_test_config().world.tier_orb_conf, max_tier + 1, life_span))
             for t in range(1, max_tier + 1)
         ]
 
@@ -33,7 +33,6 @@ class TestDigestionEngine:
 
     @pytest.fixture
     def digestion_engine(self) -> DigestionEngine:
-        BaseOrb.set_life_span(5, 5)
         d = DigestionEngine()
         d.reset()
         return d
@@ -41,14 +40,11 @@ class TestDigestionEngine:
     @pytest.fixture
     def reset_orb(self):
         # restore state
-        TierOrb.MAX_TIER = self._MAX_TIER
         TierOrb.STEP_WISE_SCORING = True
         TierOrb._LINEAR_REWARD_GROWTH = True
 
     @pytest.fixture
     def parameterize_reset(self):
-        # adjust max tier so we don't tap out
-        TierOrb.MAX_TIER = self._MAX_TIER + 1
         TierOrb.STEP_WISE_SCORING = True
         TierOrb._LINEAR_REWARD_GROWTH = True
 
@@ -74,18 +70,29 @@ class TestDigestionEngine:
     def test_max_tier_consumption_rewards_and_resets_chain(
         self, reset_orb, digestion_engine: DigestionEngine
     ):
-        max_orb = TierOrb(self._MAX_TIER, get_test_config().world.tier_orb_conf)
+        max_orb = TierOrb(
+            self._MAX_TIER,
+            get_test_config().world.tier_orb_conf,
+            self._MAX_TIER,
+            self._LIFE_SPAN,
+        )
 
         # prep the "chain" by giving it a tier value 1 lower than max_orb
         digestion_engine.chained_tiers = max_orb.META.TIER - 1
 
         assert digestion_engine.digest(max_orb, 0.2) == max_orb.REWARD
         assert digestion_engine.chained_tiers == digestion_engine._NO_CHAIN
+        assert digestion_engine.completed_chains == 1
 
     def test_out_of_order_consumption_returns_zero_and_resets_chain(
         self, reset_orb, digestion_engine: DigestionEngine
     ):
-        orb = TierOrb(self._MAX_TIER - 2, get_test_config().world.tier_orb_conf)
+        orb = TierOrb(
+            self._MAX_TIER - 2,
+            get_test_config().world.tier_orb_conf,
+            self._MAX_TIER,
+            self._LIFE_SPAN,
+        )
 
         # force out-of-order consumption for orb
         digestion_engine.chained_tiers = self._MAX_TIER - 1
@@ -96,7 +103,9 @@ class TestDigestionEngine:
     def test_base_tier_consumption_rewards_and_starts_chain(
         self, reset_orb, digestion_engine: DigestionEngine
     ):
-        base_orb = TierOrb(1, get_test_config().world.tier_orb_conf)
+        base_orb = TierOrb(
+            1, get_test_config().world.tier_orb_conf, self._MAX_TIER, self._LIFE_SPAN
+        )
 
         # force out-of-order consumption for base tier
         digestion_engine.chained_tiers = self._MAX_TIER - 1
@@ -125,7 +134,12 @@ class TestDigestionEngine:
     def test_delayed_scoring_max_tier_consumption_rewards_and_resets_chain(
         self, reset_orb, digestion_engine: DigestionEngine
     ):
-        max_orb = TierOrb(self._MAX_TIER, get_test_config().world.tier_orb_conf)
+        max_orb = TierOrb(
+            self._MAX_TIER,
+            get_test_config().world.tier_orb_conf,
+            self._MAX_TIER,
+            self._LIFE_SPAN,
+        )
         # set correct scoring type
         max_orb.STEP_WISE_SCORING = False
 
@@ -139,10 +153,16 @@ class TestDigestionEngine:
         self, reset_orb, digestion_engine: DigestionEngine
     ):
         out_of_order_orb = TierOrb(
-            self._MAX_TIER - 3, get_test_config().world.tier_orb_conf
+            self._MAX_TIER - 3,
+            get_test_config().world.tier_orb_conf,
+            self._MAX_TIER,
+            self._LIFE_SPAN,
         )
         in_order_orb = TierOrb(
-            self._MAX_TIER - 2, get_test_config().world.tier_orb_conf
+            self._MAX_TIER - 2,
+            get_test_config().world.tier_orb_conf,
+            self._MAX_TIER,
+            self._LIFE_SPAN,
         )
         # set correct scoring type
         out_of_order_orb.STEP_WISE_SCORING = False
@@ -158,9 +178,14 @@ class TestDigestionEngine:
     def test_base_tier_consumption_returns_pending_reward_and_starts_chain(
         self, reset_orb, digestion_engine: DigestionEngine
     ):
-        base_orb = TierOrb(1, get_test_config().world.tier_orb_conf)
+        base_orb = TierOrb(
+            1, get_test_config().world.tier_orb_conf, self._MAX_TIER, self._LIFE_SPAN
+        )
         in_order_orb = TierOrb(
-            self._MAX_TIER - 1, get_test_config().world.tier_orb_conf
+            self._MAX_TIER - 1,
+            get_test_config().world.tier_orb_conf,
+            self._MAX_TIER,
+            self._LIFE_SPAN,
         )
         # set correct scoring type
         base_orb.STEP_WISE_SCORING = False
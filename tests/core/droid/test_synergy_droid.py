@@ -210,7 +210,9 @@ class TestSynergyDroid:
         and returns the correct reward value.
         """
 
-        orb = DummyPositiveOrb(3, 10, OrbMeta(OrbCategory.SYNERGY, SynergyType.TIER, 1))
+        orb = DummyPositiveOrb(
+            3, 10, OrbMeta(OrbCategory.SYNERGY, SynergyType.TIER, 1), 8
+        )
         reward = droid.consume_orb(orb)
 
         assert reward == 3
@@ -222,7 +224,9 @@ class TestSynergyDroid:
         and returns the correct negative reward value.
         """
 
-        orb = DummyNegativeOrb(-3, 5, OrbMeta(OrbCategory.DIRECT, DirectType.NEGATIVE))
+        orb = DummyNegativeOrb(
+            -3, 5, OrbMeta(OrbCategory.DIRECT, DirectType.NEGATIVE), 8
+        )
         reward = droid.consume_orb(orb)
 
         assert reward == -3
@@ -35,9 +35,12 @@ class TestTierOrb:
         Creates a Tier 2 orb with the world boundaries set to rows x cols used to calculate its life span.
         """
 
-        BaseOrb.set_life_span(self._GRID_ROWS, self._GRID_COLS)
-        TierOrb.MAX_TIER = self._MAX_TIER
-        t = TierOrb(self._TIER, get_test_config().world.tier_orb_conf)
+        t = TierOrb(
+            self._TIER,
+            get_test_config().world.tier_orb_conf,
+            self._MAX_TIER,
+            BaseOrb.get_life_span(self._GRID_ROWS, self._GRID_COLS),
+        )
         t.reset()
 
         return t
@@ -76,16 +79,13 @@ class TestTierOrb:
 
     def test_creating_orb_with_negative_tier(self):
         with pytest.raises(ValueError):
-            TierOrb(-1, get_test_config().world.tier_orb_conf)
+            TierOrb(-1, get_test_config().world.tier_orb_conf, self._MAX_TIER, 8)
 
     def test_creating_orb_with_high_tier_gets_correct_reward(self):
-        TierOrb.MAX_TIER = 999
-        orb = TierOrb(666, get_test_config().world.tier_orb_conf)
+        orb = TierOrb(666, get_test_config().world.tier_orb_conf, 999, 8)
 
         assert orb.META.TIER * orb._TIER_BASE_REWARD == orb.REWARD
 
     def test_creating_orb_with_to_high_tier(self):
-        TierOrb.MAX_TIER = self._MAX_TIER
-
         with pytest.raises(ValueError):
-            TierOrb(666, get_test_config().world.tier_orb_conf)
+            TierOrb(666, get_test_config().world.tier_orb_conf, self._MAX_TIER, 8)
@@ -41,8 +41,7 @@ class TestBaseOrb:
 
     @pytest.fixture
     def orb(self, meta):
-        BaseOrb.set_life_span(5, 5)
-        return DummyOrb(3, 10, meta)
+        return DummyOrb(3, 10, meta, BaseOrb.get_life_span(5, 5))
 
     @pytest.mark.parametrize(
         "rows, cols",
@@ -62,8 +61,7 @@ class TestBaseOrb:
         - No exception is raised for valid grid dimensions.
         """
 
-        BaseOrb.set_life_span(rows, cols)
-        orb = DummyOrb(3.0, 10, meta)
+        orb = DummyOrb(3.0, 10, meta, BaseOrb.get_life_span(rows, cols))
         orb.TIMER.reset()
 
         assert orb.is_active is False
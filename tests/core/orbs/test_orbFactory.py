@@ -58,6 +58,16 @@ class TestOrbFactory:
 
         assert len(orbs) == factory._MAX_ACTIVE_ORBS * 3
 
+    def test_factories_with_different_configs_do_not_interfere(self):
+        small_orbs = self._make_adjusted_factory(max_tier=2).create_orbs()
+        large_orbs = self._make_adjusted_factory(max_tier=5).create_orbs()
+
+        small_tier_orbs = [o for o in small_orbs if o.META.TIER > 0]
+        large_tier_orbs = [o for o in large_orbs if o.META.TIER > 0]
+
+        assert all(o.MAX_TIER == 2 for o in small_tier_orbs)  # type: ignore[attr-defined]
+        assert all(o.MAX_TIER == 5 for o in large_tier_orbs)  # type: ignore[attr-defined]
+
     @pytest.mark.parametrize(
         "neg_weight, tier_weight",
         [(1, 10), (1, 2), (1, 3), (1, 5), (4, 20), (30, 23123)],
@@ -0,0 +1,142 @@
+from syn_grid.core import grid_layout
+from syn_grid.core.grid_layout import (
+    GridLayout,
+    _MAX_CACHED_LAYOUTS,
+    _get_cached_layout,
+)
+from syn_grid.core.grid_world import GridWorld
+from syn_grid.core.spawn_sources import RandomSpawnSource
+from syn_grid.gymnasium.action_space import DroidAction
+
+from tests.utils.config_helpers import get_test_config, update_conf
+
+import numpy as np
+import pytest
+
+
+class TestGridLayout:
+    """
+    Tests for the precomputed movement table and the blocked cells of a grid.
+    """
+
+    def test_open_grid_clamps_at_the_border(self):
+        layout = GridLayout(2, 3)
+
+        assert layout.get_next_position([0, 0], DroidAction.LEFT) == (0, 0)
+        assert layout.get_next_position([0, 0], DroidAction.RIGHT) == (0, 1)
+        assert layout.get_next_position([1, 2], DroidAction.DOWN) == (1, 2)
+        assert layout.get_next_position([1, 2], DroidAction.UP) == (0, 2)
+        assert layout.NEXT_CELL.shape == (6, len(DroidAction))
+
+    def test_obstacles_and_walls_block_moves(self):
+        layout = GridLayout(3, 3, obstacles=[(1, 1)], walls=[((0, 0), (0, 1))])
+
+        assert layout.get_next_position([1, 0], DroidAction.RIGHT) == (1, 0)
+        assert layout.get_next_position([0, 0], DroidAction.RIGHT) == (0, 0)
+        assert layout.get_next_position([0, 1], DroidAction.LEFT) == (0, 1)
+        assert layout.get_next_position([0, 0], DroidAction.DOWN) == (1, 0)
+        assert layout.get_nearest_free_position([1, 1]) == (1, 2)
+        assert 4 not in layout.FREE_CELLS
+
+    def test_blocked_cells_have_no_exits(self):
+        """
+        Every move from a blocked cell stays in place, so searches never leave one.
+        """
+
+        layout = GridLayout(3, 3, obstacles=[(1, 1)])
+
+        assert (layout.NEXT_CELL[4] == 4).all()
+        assert layout.get_distance([1, 1], [1, 2]) == layout.UNREACHABLE
+        assert layout.get_distance([1, 2], [1, 1]) == layout.UNREACHABLE
+
+    def test_obstacles_outside_the_grid_are_rejected(self):
+        with pytest.raises(ValueError):
+            GridLayout(2, 2, obstacles=[(2, 0)])
+
+    def test_world_avoids_blocked_cells(self):
+        """
+        Nothing spawns on obstacles and the droid never enters one.
+        """
+
+        run_conf = get_test_config().world
+        obstacles = [(row, col) for row in range(5) for col in range(5) if row != col]
+        gw = GridWorld(
+            update_conf(
+                run_conf.grid_world_conf,
+                {"max_active_orbs": 2, "layout": {"obstacles": obstacles}},
+            ),
+            run_conf.orb_factory_conf,
+            run_conf.droid_conf,
+            run_conf.negative_orb_conf,
+            run_conf.tier_orb_conf,
+        )
+        rng = np.random.default_rng(0)
+
+        for _ in range(20):
+            gw.reset(rng)
+            assert gw.DROID.position == [2, 2]
+            for _ in range(10):
+                gw.perform_agent_action(DroidAction(int(rng.integers(4))))
+                assert gw.DROID.position[0] == gw.DROID.position[1]
+                for position in gw.get_orb_positions(True):
+                    assert position[0] == position[1]
+
+    def test_spawn_cells_are_drawn_from_free_cells(self):
+        """
+        Random spawns draw once per cell from the free cells, whatever the layout blocks.
+        """
+
+        layout = GridLayout(
+            5, 5, obstacles=[(r, c) for r in range(5) for c in range(4)]
+        )
+        source = RandomSpawnSource(
+            np.random.default_rng(0), np.random.default_rng(1), layout.FREE_CELLS
+        )
+        reference = np.random.default_rng(1)
+
+        for _ in range(20):
+            expected = layout.FREE_CELLS[reference.integers(0, len(layout.FREE_CELLS))]
+            assert source.next_cell() == expected
+
+    def test_distances_follow_the_layout(self):
+        """
+        Open grids use the Manhattan distance, walls and obstacles lengthen or cut off paths.
+        """
+
+        open_layout = GridLayout.get(3, 3)
+        assert open_layout.get_distance([0, 0], [2, 2]) == 4
+        assert GridLayout.get(3, 3) is open_layout
+
+        layout = GridLayout(3, 3, obstacles=[(1, 1)], walls=[((0, 0), (0, 1))])
+        assert layout.get_distance([0, 0], [0, 1]) == 7
+        assert layout.get_distance([0, 1], [2, 1]) == 4
+        assert layout.get_distance([1, 1], [0, 0]) == layout.UNREACHABLE
+
+    def test_layout_cache_is_bounded(self):
+        """
+        Only the most recently used structures stay cached.
+        """
+
+        first = GridLayout.get(4, 4, obstacles=[(0, 0)])
+        for size in range(5, 5 + _MAX_CACHED_LAYOUTS):
+            GridLayout.get(size, size)
+
+        assert GridLayout.get(4, 4, obstacles=[(0, 0)]) is not first
+        assert _get_cached_layout.cache_info().currsize <= _MAX_CACHED_LAYOUTS
+
+    def test_large_obstructed_grid_caches_rows(self, monkeypatch: pytest.MonkeyPatch):
+        """
+        Distances on a large grid with obstacles only keep a bounded number of BFS rows instead of
+        a full cells x cells table.
+        """
+
+        monkeypatch.setattr(grid_layout, "_MAX_CACHED_DISTANCES", 3 * 400 * 400)
+        layout = GridLayout(400, 400, obstacles=[(0, 0)])
+
+        assert layout.get_distance([0, 1], [399, 399]) == 797
+        assert layout.get_distance([1, 0], [0, 1]) == 2
+        for col in range(1, 4):
+            layout.get_distance([5, col], [399, 399])
+
+        assert list(layout._distances) == [5 * 400 + col for col in range(1, 4)]
+        assert all(row.dtype == np.int32 for row in layout._distances.values())
@@ -1,8 +1,10 @@
 from syn_grid.core.grid_world import GridWorld
 from syn_grid.core.orbs.orb_meta import DirectType, SynergyType
+from syn_grid.gymnasium.action_space import DroidAction
 
-from tests.utils.config_helpers import get_test_config
+from tests.utils.config_helpers import get_test_config, update_conf
 
+import numpy as np
 import pytest
 
 
@@ -102,3 +104,51 @@ class TestGridWorld:
         for timer in timers:
             # Each timer should be an integer signaling remaining life.
             assert isinstance(timer, int)
+
+    def test_multiple_droids_share_the_orbs(self):
+        """
+        Several droids start on distinct cells, move together and tick the shared orbs once.
+        """
+
+        run_conf = get_test_config().world
+        gw = GridWorld(
+            update_conf(run_conf.grid_world_conf, {"num_droids": 3}),
+            run_conf.orb_factory_conf,
+            run_conf.droid_conf,
+            run_conf.negative_orb_conf,
+            run_conf.tier_orb_conf,
+        )
+        gw.reset(np.random.default_rng(0))
+
+        positions = [tuple(droid.position) for droid in gw.DROIDS]
+        assert len(set(positions)) == 3
+        assert gw.DROID is gw.DROIDS[0]
+
+        timers = gw.get_orb_life()
+        rewards = gw.perform_agent_actions([DroidAction.LEFT, None, DroidAction.UP])
+
+        assert len(rewards) == 3
+        assert rewards[1] == 0.0
+        assert tuple(gw.DROIDS[1].position) == positions[1]
+        assert sum(abs(a - b) for a, b in zip(timers, gw.get_orb_life())) <= len(timers)
+
+        gw.observe_from(2)
+        assert gw.DROID is gw.DROIDS[2]
+
+    def test_orb_grid_mirrors_active_orbs(self, grid_world: GridWorld):
+        """
+        The orb grid holds the identity and remaining life of exactly the active orbs.
+        """
+
+        rng = np.random.default_rng(0)
+        for _ in range(60):
+            grid_world.perform_agent_action(DroidAction(int(rng.integers(4))))
+
+            assert np.count_nonzero(grid_world.ORB_GRID[..., 0]) == len(
+                grid_world.get_orb_positions(True)
+            )
+            for orb in grid_world.ALL_ORBS:
+                if orb.is_active:
+                    y, x = orb.position
+                    assert grid_world.ORB_GRID[y, x, 2] == orb.META.TIER
+                    assert grid_world.ORB_GRID[y, x, 3] == orb.TIMER.remaining
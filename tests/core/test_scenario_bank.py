@@ -0,0 +1,161 @@
+from syn_grid.core.scenario_bank import ScenarioBank
+from syn_grid.core.spawn_sources import ScheduledSpawnSource
+from syn_grid.gymnasium.environment import SYNGridEnv
+
+from tests.utils.config_helpers import get_test_config, update_conf
+
+import numpy as np
+import pytest
+from pathlib import Path
+
+
+class TestScenarioBank:
+    """
+    Tests for pregenerated spawn schedules and their replay through the environment.
+
+    Verifies:
+    - Banks keep their schedules, grid, layout and episode length through save and load
+    - Scenarios replay identically and an exhausted cell tape falls back to free cells
+    - Banks are rejected by environments with another grid, layout or episode length
+    """
+
+    # ================= #
+    #       Init        #
+    # ================= #
+
+    def _run_episode(self, env: SYNGridEnv, scenario: int, seed: int) -> np.ndarray:
+        obs, _ = env.reset(options={"scenario": scenario})
+        rng = np.random.default_rng(seed)
+        observations = [obs.copy()]
+
+        done = False
+        while not done:
+            obs, _, terminated, truncated, _ = env.step(int(rng.integers(4)))
+            observations.append(obs.copy())
+            done = terminated or truncated
+
+        return np.stack(observations)
+
+    # ================= #
+    #       Tests       #
+    # ================= #
+
+    def test_save_and_load(self, tmp_path: Path):
+        conf = get_test_config()
+        grid_conf = update_conf(
+            conf.world.grid_world_conf,
+            {"layout": {"obstacles": [(0, 1)], "walls": [((2, 2), (2, 3))]}},
+        )
+        bank = ScenarioBank.generate([3, 7], grid_conf, 10)
+        bank.save(tmp_path / "bank.npz")
+
+        loaded = ScenarioBank.load(tmp_path / "bank.npz")
+
+        assert len(loaded) == 2
+        np.testing.assert_array_equal(loaded.SEEDS, [3, 7])
+        assert loaded.get_spawn_source(1)._CELLS == bank.get_spawn_source(1)._CELLS
+        assert loaded.MAX_STEPS == 10
+        loaded.check_fits(grid_conf, 10)
+
+    def test_schedule_replays_orbs_and_runs_out_of_cells(self):
+        source = ScheduledSpawnSource(np.array([0, 1 << 15]), np.array([4, 2]))
+
+        assert [source.choose_orb(4) for _ in range(3)] == [0, 2, 0]
+        assert [source.next_cell() for _ in range(3)] == [4, 2, None]
+
+    def test_exhausted_tape_spawns_on_free_cells(self):
+        """
+        A tape whose only cell is taken doesn't hang the spawn loop, later orbs go to free cells.
+        """
+
+        conf = get_test_config()
+        env = SYNGridEnv(conf.world, conf.obs)
+        env.reset(seed=0)
+        world = env.world
+        world.reset(
+            env.np_random, ScheduledSpawnSource(np.zeros(1, np.uint16), np.array([0]))
+        )
+
+        for _ in range(50):
+            _, _, terminated, _, _ = env.step(0)
+            if terminated:
+                break
+
+        positions = [tuple(orb.position) for orb in world.get_active_orbs()]
+        assert len(positions) > 1
+        assert len(set(positions)) == len(positions)
+        assert tuple(world.DROID.position) not in positions
+
+    def test_scenarios_are_identical_across_envs(self):
+        """
+        A scenario replays the same episode whatever the env's generator went through before.
+        """
+
+        conf = get_test_config()
+        bank = ScenarioBank.generate(
+            [1, 2], conf.world.grid_world_conf, conf.obs.observation_handler.max_steps
+        )
+        envs = [SYNGridEnv(conf.world, conf.obs) for _ in range(2)]
+        for env in envs:
+            env.use_scenario_bank(bank)
+
+        # Advance one of the generators first
+        envs[1].reset(seed=99)
+        envs[1].step(0)
+
+        first = self._run_episode(envs[0], 1, seed=0)
+        second = self._run_episode(envs[1], 1, seed=0)
+
+        np.testing.assert_array_equal(first, second)
+
+    @pytest.mark.parametrize(
+        "grid_updates, max_steps",
+        [
+            ({"layout": {"obstacles": [(0, 1)]}}, 10),
+            ({"layout": {"walls": [((0, 0), (0, 1))]}}, 10),
+            ({}, 11),
+        ],
+    )
+    def test_check_fits_rejects_mismatches(self, grid_updates, max_steps):
+        grid_conf = get_test_config().world.grid_world_conf
+        bank = ScenarioBank.generate([0], grid_conf, 10)
+
+        with pytest.raises(ValueError):
+            bank.check_fits(update_conf(grid_conf, grid_updates), max_steps)
+
+    def test_rejects_other_grids(self):
+        conf = get_test_config()
+        world_conf = update_conf(
+            conf.world,
+            {
+                "grid_world_conf": {"grid_rows": 4},
+                "droid_conf": {"grid_rows": 4},
+                "orb_factory_conf": {"grid_rows": 4},
+                "renderer_conf": {"grid_rows": 4},
+            },
+        )
+        env = SYNGridEnv(world_conf, conf.obs)
+        env.use_scenario_bank(
+            ScenarioBank.generate(
+                [0],
+                conf.world.grid_world_conf,
+                conf.obs.observation_handler.max_steps,
+            )
+        )
+
+        with pytest.raises(ValueError):
+            env.reset(options={"scenario": 0})
+
+    def test_rejects_other_episode_lengths(self):
+        """
+        A bank generated for shorter episodes would run out of its schedule, the env rejects it.
+        """
+
+        conf = get_test_config()
+        env = SYNGridEnv(conf.world, conf.obs)
+        env.use_scenario_bank(
+            ScenarioBank.generate([0], conf.world.grid_world_conf, 1, cells_per_spawn=1)
+        )
+
+        with pytest.raises(ValueError):
+            env.reset(options={"scenario": 0})
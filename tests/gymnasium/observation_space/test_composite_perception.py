@@ -0,0 +1,88 @@
+from syn_grid.gymnasium.environment import SYNGridEnv
+
+from tests.utils.config_helpers import get_test_config, update_conf
+
+import numpy as np
+import pytest
+
+
+class TestCompositePerception:
+    """
+    Tests for the composite perceptions.
+
+    Verifies:
+    - Observations conform to the Dict space for every difficulty
+    - The grid and global views share one contiguous buffer that is reused between steps
+    - The droid plane marks the droid position
+    - The flattened layout exposes the same buffer as a single Box
+    """
+
+    # ================= #
+    #       Init        #
+    # ================= #
+
+    def _make_env(self, perception: str, flatten: bool = False) -> SYNGridEnv:
+        conf = get_test_config()
+        obs_conf = update_conf(
+            conf.obs,
+            {
+                "observation_handler": {"perception": perception},
+                "perception": {"flatten": flatten},
+            },
+        )
+
+        return SYNGridEnv(conf.world, obs_conf)
+
+    # ================= #
+    #       Tests       #
+    # ================= #
+
+    @pytest.mark.parametrize(
+        "perception, channels, globals_",
+        [
+            ("composite_easy", 5, 3),
+            ("composite_medium", 4, 3),
+            ("composite_hard", 4, 2),
+        ],
+    )
+    def test_observations_are_in_space(self, perception, channels, globals_):
+        env = self._make_env(perception)
+        obs, _ = env.reset(seed=1)
+
+        assert obs["grid"].shape == (5, 5, channels)
+        assert obs["global"].shape == (globals_,)
+        assert env.observation_space.contains(obs)
+
+        for _ in range(20):
+            obs, _, terminated, _, _ = env.step(env.action_space.sample())
+            assert env.observation_space.contains(obs)
+            if terminated:
+                break
+
+    def test_views_share_one_buffer_across_steps(self):
+        env = self._make_env("composite_easy")
+        first, _ = env.reset(seed=1)
+        second, *_ = env.step(0)
+
+        buffer = env._observation_handler.perception.get_flat_observation()
+
+        assert first is second
+        assert np.shares_memory(second["grid"], buffer)
+        assert np.shares_memory(second["global"], buffer)
+
+    def test_droid_plane_marks_droid(self):
+        env = self._make_env("composite_medium")
+        obs, _ = env.reset(seed=3)
+
+        y, x = env.world.DROID.position
+        assert obs["grid"][y, x, 0] == 1.0
+        assert obs["grid"][..., 0].sum() == 1.0
+
+    def test_flatten_returns_contiguous_buffer(self):
+        env = self._make_env("composite_easy", flatten=True)
+        obs, _ = env.reset(seed=1)
+
+        assert obs.shape == env.observation_space.shape
+        assert obs.shape == (5 * 5 * 5 + 3,)
+        assert env.observation_space.contains(obs)
+        assert obs is env._observation_handler.perception.get_flat_observation()
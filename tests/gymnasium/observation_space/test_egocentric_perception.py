@@ -0,0 +1,73 @@
+from syn_grid.gymnasium.environment import SYNGridEnv
+
+from tests.utils.config_helpers import get_test_config, update_conf
+
+import numpy as np
+
+
+class TestEgocentricPerception:
+    """
+    Tests for the egocentric window perception.
+
+    Verifies:
+    - The observation size only depends on the window size, not on the grid
+    - Cells outside the grid are padded as blocked and orbs show up relative to the droid
+    """
+
+    # ================= #
+    #       Init        #
+    # ================= #
+
+    def _make_env(self, grid_size: int, window_size: int = 5) -> SYNGridEnv:
+        conf = get_test_config()
+        grid = {"grid_rows": grid_size, "grid_cols": grid_size}
+        run_conf = update_conf(
+            conf.world,
+            {"grid_world_conf": grid, "droid_conf": grid, "orb_factory_conf": grid},
+        )
+        obs_conf = update_conf(
+            conf.obs,
+            {
+                "observation_handler": {"perception": "egocentric"},
+                "perception": {"window_size": window_size},
+            },
+        )
+
+        return SYNGridEnv(run_conf, obs_conf)
+
+    # ================= #
+    #       Tests       #
+    # ================= #
+
+    def test_shape_is_independent_of_grid_size(self):
+        small, large = self._make_env(5), self._make_env(21)
+
+        assert small.observation_space == large.observation_space
+        assert small.observation_space["grid"].shape == (5, 5, 5)
+
+        for env in (small, large):
+            obs, _ = env.reset(seed=2)
+            for _ in range(30):
+                assert env.observation_space.contains(obs)
+                obs, _, terminated, _, _ = env.step(env.action_space.sample())
+                if terminated:
+                    obs, _ = env.reset()
+
+    def test_window_is_centered_on_the_droid(self):
+        env = self._make_env(5, window_size=7)
+        obs, _ = env.reset(seed=0)
+        droid_y, droid_x = env.world.DROID.position
+        grid = obs["grid"]
+
+        # The 5x5 grid sits inside the 7x7 window around the center droid
+        assert (droid_y, droid_x) == (2, 2)
+        assert grid[0, :, 0].all() and grid[:, 0, 0].all()
+        assert not grid[1:6, 1:6, 0].any()
+
+        for orb in env.world.ALL_ORBS:
+            if orb.is_active:
+                y, x = orb.position
+                assert grid[y - droid_y + 3, x - droid_x + 3, 1] > 0
+        assert np.count_nonzero(grid[..., 1]) == sum(
+            env.world.get_orb_is_active_status(False)
+        )
@@ -0,0 +1,99 @@
+from syn_grid.gymnasium.environment import SYNGridEnv
+from syn_grid.runners.agent_runners.utils.extractors import DeepSetsExtractor
+
+from tests.utils.config_helpers import get_test_config, update_conf
+
+import numpy as np
+import torch as th
+
+
+class TestEntityPerception:
+    """
+    Tests for the entity list perception and its set encoder.
+
+    Verifies:
+    - One valid row per active orb, padded up to max_active_orbs
+    - The optional reachability columns match the droid-to-orb distances
+    - The extractor output doesn't depend on the order or the padding of the rows
+    """
+
+    # ================= #
+    #       Init        #
+    # ================= #
+
+    def _make_env(self, observe_reachability: bool = False) -> SYNGridEnv:
+        conf = get_test_config()
+        obs_conf = update_conf(
+            conf.obs,
+            {
+                "observation_handler": {"perception": "entity"},
+                "perception": {"observe_reachability": observe_reachability},
+            },
+        )
+
+        return SYNGridEnv(conf.world, obs_conf)
+
+    # ================= #
+    #       Tests       #
+    # ================= #
+
+    def test_rows_follow_active_orbs(self):
+        env = self._make_env()
+        obs, _ = env.reset(seed=3)
+        max_orbs = get_test_config().obs.perception.max_active_orbs
+
+        assert obs["entities"].shape == (max_orbs, 6)
+
+        for _ in range(40):
+            assert env.observation_space.contains(obs)
+            active = env.world.get_active_orbs()
+            assert obs["mask"].sum() == len(active)
+            assert not obs["entities"][len(active) :].any()
+
+            obs, _, terminated, _, _ = env.step(env.action_space.sample())
+            if terminated:
+                obs, _ = env.reset()
+
+    def test_reachability_columns(self):
+        env = self._make_env(observe_reachability=True)
+        obs, _ = env.reset(seed=1)
+
+        for _ in range(40):
+            droid = env.world.DROID.position
+            for row, orb in zip(obs["entities"], env.world.get_active_orbs()):
+                distance = abs(droid[0] - orb.position[0]) + abs(
+                    droid[1] - orb.position[1]
+                )
+                lifespan = env.world.LAYOUT.ROWS + env.world.LAYOUT.COLS - 2
+                assert row[6] == np.float32(distance / lifespan)
+                if orb.META.TIER == 0:
+                    assert row[7] == (distance < orb.TIMER.remaining)
+
+            obs, _, terminated, _, _ = env.step(env.action_space.sample())
+            if terminated:
+                obs, _ = env.reset()
+
+    def test_extractor_is_permutation_invariant(self):
+        env = self._make_env()
+        extractor = DeepSetsExtractor(env.observation_space)  # type: ignore[arg-type]
+        rng = np.random.default_rng(0)
+
+        entities = th.as_tensor(rng.random((1, 3, 6)), dtype=th.float32)
+        observations = {
+            "entities": entities,
+            "mask": th.tensor([[1.0, 1.0, 0.0]]),
+            "global": th.as_tensor(rng.random((1, 5)), dtype=th.float32),
+        }
+        shuffled = {
+            **observations,
+            "entities": entities[:, [1, 0, 2]],
+        }
+        repadded = {
+            **observations,
+            "entities": th.cat([entities[:, :2], th.zeros(1, 1, 6)], dim=1),
+        }
+
+        with th.no_grad():
+            features = extractor(observations)
+            th.testing.assert_close(features, extractor(shuffled))
+            th.testing.assert_close(features, extractor(repadded))
@@ -0,0 +1,74 @@
+from syn_grid.gymnasium.environment import SYNGridEnv
+
+from tests.utils.config_helpers import get_test_config, update_conf
+
+import numpy as np
+import pytest
+
+
+class TestObservationHandler:
+    """
+    Tests for the compact observation dtypes of the ObservationHandler.
+
+    Verifies:
+    - uint8 and float16 observations match their Box spaces
+    - Dequantized uint8 observations stay within half a quantization step of float32 ones
+    - Dict observations are compacted per key
+    """
+
+    # ================= #
+    #       Init        #
+    # ================= #
+
+    def _make_env(self, obs_dtype: str, perception: str = "vector_hard") -> SYNGridEnv:
+        conf = get_test_config()
+        obs_conf = update_conf(
+            conf.obs,
+            {
+                "observation_handler": {
+                    "perception": perception,
+                    "obs_dtype": obs_dtype,
+                }
+            },
+        )
+
+        return SYNGridEnv(conf.world, obs_conf)
+
+    # ================= #
+    #       Tests       #
+    # ================= #
+
+    @pytest.mark.parametrize("obs_dtype", ["float16", "uint8"])
+    def test_compact_observations_are_in_space(self, obs_dtype: str):
+        env = self._make_env(obs_dtype)
+        obs, _ = env.reset(seed=7)
+
+        assert obs.dtype == np.dtype(obs_dtype)
+        assert env.observation_space.dtype == np.dtype(obs_dtype)
+        assert env.observation_space.contains(obs)
+
+    @pytest.mark.parametrize("perception", ["vector_hard", "vector_medium"])
+    def test_uint8_dequantizes_close_to_float32(self, perception: str):
+        compact_env = self._make_env("uint8", perception)
+        float_env = self._make_env("float32", perception)
+        params = compact_env.get_dequantization_params()
+
+        compact_obs, _ = compact_env.reset(seed=3)
+        float_obs, _ = float_env.reset(seed=3)
+
+        for _ in range(15):
+            restored = compact_obs * params["scale"] + params["offset"]
+            assert np.all(np.abs(restored - float_obs) <= params["scale"] / 2 + 1e-6)
+
+            action = compact_env.action_space.sample()
+            compact_obs, *_ = compact_env.step(action)
+            float_obs, *_ = float_env.step(action)
+
+    def test_dict_observations_are_compacted_per_key(self):
+        env = self._make_env("uint8", "composite_easy")
+        obs, _ = env.reset(seed=1)
+        params = env.get_dequantization_params()
+
+        assert env.observation_space.contains(obs)
+        assert set(params) == {"grid", "global"}
+        assert obs["grid"].dtype == np.uint8
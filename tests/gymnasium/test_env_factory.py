@@ -0,0 +1,42 @@
+from syn_grid.gymnasium.env_factory import make_fast
+from syn_grid.gymnasium.environment import SYNGridEnv
+from syn_grid.gymnasium.vector_env import SYNGridVectorEnv
+
+from tests.utils.config_helpers import get_test_config
+
+from gymnasium.wrappers import OrderEnforcing
+import pytest
+
+
+class TestMakeFast:
+    """
+    Tests for the `make_fast` factory.
+
+    Verifies:
+    - Without wrappers the bare environment is returned
+    - Only the requested wrappers are applied
+    - A vector env is created when `num_envs` is given
+    """
+
+    def test_returns_bare_env(self):
+        conf = get_test_config()
+        env = make_fast(conf.world, conf.obs)
+
+        assert type(env) is SYNGridEnv
+
+    def test_applies_only_given_wrappers(self):
+        conf = get_test_config()
+        env = make_fast(conf.world, conf.obs, wrappers=[OrderEnforcing])
+
+        assert isinstance(env, OrderEnforcing)
+        assert type(env.env) is SYNGridEnv
+
+    def test_vector_env(self):
+        conf = get_test_config()
+        env = make_fast(conf.world, conf.obs, num_envs=2)
+
+        assert isinstance(env, SYNGridVectorEnv)
+        assert env.reset(seed=0)[0].shape[0] == 2
+
+        with pytest.raises(ValueError):
+            make_fast(conf.world, conf.obs, render_mode="human", num_envs=2)
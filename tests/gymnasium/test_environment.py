@@ -1,4 +1,7 @@
-from syn_grid.gymnasium.environment import SYNGridEnv
+from syn_grid.gymnasium.environment import EPISODE_INFO_KEYWORDS, SYNGridEnv
+from syn_grid.gymnasium.action_space import DroidAction
+from syn_grid.config.models import WorldConfig
+from syn_grid.config.overrides import fit_obs_to_worlds
 
 from tests.utils.config_helpers import get_test_config, update_conf
 
@@ -122,6 +125,64 @@ class TestEnvironment:
 
         assert terminated
 
+    def test_time_limit_truncation(self):
+        """
+        With `truncate_at_max_steps` the time limit is reported as truncated instead of
+        terminated, and `time_limit_reward="none"` leaves out the final score bonus.
+        """
+
+        conf = get_test_config()
+        world_conf = update_conf(conf.world, {"droid_conf": {"starting_score": 99999}})
+        obs_confs = [
+            update_conf(
+                conf.obs,
+                {
+                    "observation_handler": {
+                        "max_steps": 5,
+                        "truncate_at_max_steps": truncate,
+                        "time_limit_reward": bonus,
+                    }
+                },
+            )
+            for truncate, bonus in [(False, "score"), (True, "none")]
+        ]
+
+        results = []
+        for obs_conf in obs_confs:
+            env = SYNGridEnv(world_conf, obs_conf)
+            env.reset(seed=3)
+            for _ in range(5):
+                _, reward, terminated, truncated, _ = env.step(DroidAction.LEFT.value)
+            results.append((reward, terminated, truncated, env.world.DROID.score))
+
+        (bonus_reward, *ends), (plain_reward, *truncated_ends) = results
+        assert ends[:2] == [True, False]
+        assert truncated_ends[:2] == [False, True]
+        assert bonus_reward == pytest.approx(plain_reward + ends[2])
+
+    def test_episode_stats_at_episode_end(self):
+        """
+        The episode statistics are only added to the info of the last step and match the
+        episode's rewards and steps.
+        """
+
+        conf = get_test_config()
+        env = SYNGridEnv(conf.world, conf.obs)
+        env.reset(seed=2)
+        rng = np.random.default_rng(2)
+
+        rewards, done = [], False
+        while not done:
+            _, reward, terminated, truncated, info = env.step(int(rng.integers(4)))
+            rewards.append(reward)
+            done = terminated or truncated
+            assert ("episode" in info) == done
+
+        assert info["episode"] == {"r": pytest.approx(sum(rewards)), "l": len(rewards)}
+        assert set(EPISODE_INFO_KEYWORDS) <= info.keys()
+        assert "episode_consumed_tier" in EPISODE_INFO_KEYWORDS
+        assert info["episode_chains"] >= 0 and info["episode_despawns"] >= 0
+
     def test_environment_terminates(self):
         """
         Verify that the environment terminates correctly
@@ -191,10 +252,87 @@ class TestEnvironment:
 
         assert self._capture_state(env1) == self._capture_state(env2)
 
+    def test_reconfigure_applies_at_reset_and_reuses_orbs(self):
+        """
+        Verify that reconfigure() waits for the next reset, then changes the world in place while
+        keeping the orb pool when its composition is unchanged.
+        """
+
+        conf = get_test_config()
+        world_conf = self._make_grid_conf(conf.world, 7)
+        world_conf = update_conf(
+            world_conf,
+            {"tier_orb_conf": {"base_reward": 11.0, "linear_reward_growth": True}},
+        )
+        env = SYNGridEnv(conf.world, fit_obs_to_worlds(conf.obs, [world_conf]))
+        orbs = list(env.world.ALL_ORBS)
+
+        env.reconfigure(world_conf)
+        assert env.world.DROID._conf.max_row == 4
+
+        obs, _ = env.reset()
+
+        assert env.world.DROID.position == [3, 3]
+        assert env.world.ALL_ORBS == orbs
+        assert all(o.REWARD == 11.0 * o.META.TIER for o in orbs)
+        assert {o._LIFE_SPAN for o in orbs} == {12}
+        assert obs.shape == env.observation_space.shape
+
+    def test_reconfigure_rejects_layout_change(self, env: SYNGridEnv):
+        """
+        Verify that reconfigure() refuses configs that would change the observation shape.
+        """
+
+        conf = get_test_config()
+        obs_conf = update_conf(conf.obs, {"perception": {"max_active_orbs": 5}})
+
+        with pytest.raises(ValueError):
+            env.reconfigure(conf.world, obs_conf)
+
+    def test_reconfigure_rejects_worlds_larger_than_the_observation(
+        self, env: SYNGridEnv
+    ):
+        """
+        Verify that a grid larger than the perception is sized for is refused right away, both by
+        reconfigure() and when building the env.
+        """
+
+        conf = get_test_config()
+        world_conf = self._make_grid_conf(conf.world, 9)
+
+        with pytest.raises(ValueError):
+            env.reconfigure(world_conf)
+        with pytest.raises(ValueError):
+            SYNGridEnv(world_conf, conf.obs)
+
+        env.reset()
+        assert env.world.DROID._conf.max_row == 4
+
+    def test_rejects_several_droids(self, env: SYNGridEnv):
+        """
+        Verify that worlds with more than one droid are refused when building the env and by
+        reconfigure(), they belong to the multi-droid env.
+        """
+
+        conf = get_test_config()
+        world_conf = update_conf(conf.world, {"grid_world_conf": {"num_droids": 2}})
+
+        with pytest.raises(ValueError, match="SYNGridParallelEnv"):
+            SYNGridEnv(world_conf, conf.obs)
+        with pytest.raises(ValueError, match="SYNGridParallelEnv"):
+            env.reconfigure(world_conf)
+
     # ================= #
     #      Helpers      #
     # ================= #
 
+    def _make_grid_conf(self, world_conf: WorldConfig, size: int) -> WorldConfig:
+        grid = {"grid_rows": size, "grid_cols": size}
+        return update_conf(
+            world_conf,
+            {"grid_world_conf": grid, "droid_conf": grid, "orb_factory_conf": grid},
+        )
+
     def _capture_state(self, env: SYNGridEnv) -> dict[str, Any]:
         return {
             "steps_left": env._observation_handler.steps_left,
@@ -206,3 +344,40 @@ class TestEnvironment:
             "chained_tiers": env.world.DROID.DIGESTION_ENGINE.chained_tiers,
             "pending_reward": env.world.DROID.DIGESTION_ENGINE._pending_reward,
         }
+
+    def test_running_steps_have_an_empty_info(self, env: SYNGridEnv):
+        """
+        Verify that running steps return an empty info unless the action mask is asked for.
+        """
+
+        _, info = env.reset(seed=0)
+        assert info == {}
+
+        _, _, terminated, truncated, info = env.step(0)
+        assert not (terminated or truncated)
+        assert info == {}
+
+    def test_action_mask_blocks_moves_into_the_border(self):
+        """
+        Verify that actions that wouldn't move the droid are masked, both in info and through action_masks().
+        """
+
+        conf = get_test_config()
+        env = SYNGridEnv(conf.world, conf.obs, info_action_mask=True)
+
+        _, info = env.reset(seed=0)
+        assert info["action_mask"].all()  # the droid starts in the center
+
+        # Walk into the top left corner
+        for action in (
+            DroidAction.UP,
+            DroidAction.UP,
+            DroidAction.LEFT,
+            DroidAction.LEFT,
+        ):
+            _, _, _, _, info = env.step(action.value)
+
+        mask = env.action_masks()
+        np.testing.assert_array_equal(info["action_mask"], mask)
+        assert not mask[DroidAction.UP.value] and not mask[DroidAction.LEFT.value]
+        assert mask[DroidAction.DOWN.value] and mask[DroidAction.RIGHT.value]
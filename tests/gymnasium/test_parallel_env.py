@@ -0,0 +1,56 @@
+from syn_grid.gymnasium.environment import SYNGridEnv
+from syn_grid.gymnasium.parallel_env import SYNGridParallelEnv
+
+from tests.utils.config_helpers import get_test_config, update_conf
+
+import numpy as np
+
+
+class TestSYNGridParallelEnv:
+    """
+    Tests for the multi-droid parallel environment.
+
+    Verifies:
+    - A single droid behaves exactly like the single-agent environment
+    - Several droids are observed and rewarded separately and leave the episode when it ends
+    """
+
+    def test_single_droid_matches_single_env(self):
+        conf = get_test_config()
+        parallel_env = SYNGridParallelEnv(conf.world, conf.obs)
+        env = SYNGridEnv(conf.world, conf.obs)
+        rng = np.random.default_rng(0)
+
+        obs, _ = parallel_env.reset(seed=4)
+        expected, _ = env.reset(seed=4)
+        np.testing.assert_array_equal(obs["droid_0"], expected)
+
+        while parallel_env.agents:
+            action = int(rng.integers(4))
+            obs, rewards, terminations, _, _ = parallel_env.step({"droid_0": action})
+            expected, reward, terminated, _, _ = env.step(action)
+
+            np.testing.assert_array_equal(obs["droid_0"], expected)
+            assert rewards["droid_0"] == reward
+            assert terminations["droid_0"] == terminated
+
+    def test_multiple_droids(self):
+        conf = get_test_config()
+        run_conf = update_conf(conf.world, {"grid_world_conf": {"num_droids": 2}})
+        env = SYNGridParallelEnv(run_conf, conf.obs)
+        rng = np.random.default_rng(1)
+
+        obs, _ = env.reset(seed=0)
+        assert env.agents == ["droid_0", "droid_1"]
+        assert not np.array_equal(obs["droid_0"], obs["droid_1"])
+
+        steps = 0
+        while env.agents:
+            actions = {agent: int(rng.integers(4)) for agent in env.agents}
+            obs, rewards, terminations, _, _ = env.step(actions)
+            assert rewards.keys() == terminations.keys() == actions.keys()
+            for agent in obs:
+                assert env.observation_space(agent).contains(obs[agent])
+            steps += 1
+
+        assert steps <= conf.obs.observation_handler.max_steps
@@ -0,0 +1,194 @@
+from syn_grid.gymnasium.environment import SYNGridEnv
+from syn_grid.gymnasium.vector_env import SYNGridVectorEnv
+from syn_grid.config.models import CurriculumStageConf
+from syn_grid.config.overrides import apply_stage_to_world, fit_obs_to_worlds
+from syn_grid.utils.seeding import get_env_seed_sequences
+
+from tests.utils.config_helpers import get_test_config, update_conf
+
+import numpy as np
+import pytest
+
+NUM_ENVS = 3
+
+
+class TestSYNGridVectorEnv:
+    """
+    Tests for the batched vector environment.
+
+    Verifies:
+    - Batched observations match the ones of independently stepped environments, across resets
+    - Finished episodes are reset in the same step and report their final observation
+    - Environments with different world configs share one padded observation layout
+    """
+
+    # ================= #
+    #       Init        #
+    # ================= #
+
+    def _make_confs(self, perception: str, obs_dtype: str = "float32"):
+        conf = get_test_config()
+        obs_conf = update_conf(
+            conf.obs,
+            {
+                "observation_handler": {
+                    "perception": perception,
+                    "obs_dtype": obs_dtype,
+                }
+            },
+        )
+
+        return conf.world, obs_conf
+
+    # ================= #
+    #       Tests       #
+    # ================= #
+
+    @pytest.mark.parametrize(
+        "perception, obs_dtype",
+        [
+            ("vector_medium", "float32"),
+            ("vector_hard", "float32"),
+            ("vector_hard", "uint8"),
+        ],
+    )
+    def test_matches_single_envs(self, perception: str, obs_dtype: str):
+        run_conf, obs_conf = self._make_confs(perception, obs_dtype)
+        vector_env = SYNGridVectorEnv(NUM_ENVS, run_conf, obs_conf)
+        envs = [SYNGridEnv(run_conf, obs_conf) for _ in range(NUM_ENVS)]
+        rng = np.random.default_rng(0)
+
+        obs, _ = vector_env.reset(seed=5)
+        seeds = get_env_seed_sequences(5, NUM_ENVS)
+        expected = [env.reset(seed=seeds[i])[0] for i, env in enumerate(envs)]
+        np.testing.assert_array_equal(obs, np.stack(expected))
+
+        for _ in range(250):
+            actions = rng.integers(4, size=NUM_ENVS)
+            obs, rewards, terminations, _, infos = vector_env.step(actions)
+
+            for i, env in enumerate(envs):
+                expected[i], reward, terminated, _, _ = env.step(int(actions[i]))
+                assert rewards[i] == reward
+                assert terminations[i] == terminated
+
+                if terminated:
+                    np.testing.assert_array_equal(infos["final_obs"][i], expected[i])
+                    expected[i], _ = env.reset()
+
+            np.testing.assert_array_equal(obs, np.stack(expected))
+
+    def test_truncated_episodes_are_reset(self):
+        run_conf, obs_conf = self._make_confs("vector_medium")
+        run_conf = update_conf(run_conf, {"droid_conf": {"starting_score": 99999}})
+        obs_conf = update_conf(
+            obs_conf,
+            {"observation_handler": {"max_steps": 3, "truncate_at_max_steps": True}},
+        )
+        vector_env = SYNGridVectorEnv(NUM_ENVS, run_conf, obs_conf)
+        vector_env.reset(seed=0)
+
+        for _ in range(3):
+            _, _, terminations, truncations, infos = vector_env.step(
+                np.zeros(NUM_ENVS, np.int64)
+            )
+
+        assert not terminations.any() and truncations.all()
+        assert infos["_final_obs"].all()
+        np.testing.assert_array_equal(infos["episode"]["l"], np.full(NUM_ENVS, 3))
+        assert infos["episode_consumed_tier"].shape == (NUM_ENVS,)
+        assert infos["_episode_consumed_tier"].all()
+        assert all(env.steps_left == 3 for env in vector_env.envs)
+
+    @pytest.mark.parametrize("perception", ["composite_easy", "egocentric", "entity"])
+    def test_dict_observations_are_rejected(self, perception: str):
+        run_conf, obs_conf = self._make_confs(perception)
+
+        with pytest.raises(ValueError, match=perception):
+            SYNGridVectorEnv(NUM_ENVS, run_conf, obs_conf)
+
+    def test_observations_are_in_space(self):
+        run_conf, obs_conf = self._make_confs("vector_medium")
+        vector_env = SYNGridVectorEnv(NUM_ENVS, run_conf, obs_conf)
+
+        obs, _ = vector_env.reset(seed=1)
+
+        assert vector_env.observation_space.contains(obs)
+
+    def test_reconfigure_selected_envs(self):
+        run_conf, obs_conf = self._make_confs("vector_hard")
+        vector_env = SYNGridVectorEnv(NUM_ENVS, run_conf, obs_conf)
+        new_run_conf = update_conf(run_conf, {"droid_conf": {"starting_score": 77}})
+
+        vector_env.reconfigure(new_run_conf, indices=[1])
+        vector_env.reset(seed=0)
+
+        scores = [env.world.DROID.score for env in vector_env.envs]
+        assert scores[1] == 77
+        assert scores[0] == scores[2] == run_conf.droid_conf.starting_score
+
+    def test_reconfigure_rejects_obs_conf_for_selected_envs(self):
+        run_conf, obs_conf = self._make_confs("vector_hard")
+        vector_env = SYNGridVectorEnv(NUM_ENVS, run_conf, obs_conf)
+        new_obs_conf = update_conf(obs_conf, {"observation_handler": {"max_steps": 20}})
+
+        with pytest.raises(ValueError):
+            vector_env.reconfigure(run_conf, new_obs_conf, indices=[0])
+
+        # The same observation config is fine, it doesn't change anything
+        vector_env.reconfigure(run_conf, obs_conf, indices=[0])
+        vector_env.reset(seed=0)
+
+        max_steps = obs_conf.observation_handler.max_steps
+        assert [env.steps_left for env in vector_env.envs] == [max_steps] * NUM_ENVS
+
+    def test_heterogeneous_scenarios(self):
+        run_conf, obs_conf = self._make_confs("vector_hard")
+        small = apply_stage_to_world(
+            run_conf,
+            CurriculumStageConf(
+                grid_rows=3, grid_cols=4, max_tier=2, step_wise_scoring=True
+            ),
+        )
+        rewarding = update_conf(run_conf, {"tier_orb_conf": {"base_reward": 11}})
+        run_confs = [small, run_conf, rewarding]
+        obs_conf = fit_obs_to_worlds(obs_conf, run_confs)
+
+        vector_env = SYNGridVectorEnv(NUM_ENVS, run_confs, obs_conf)
+        envs = [SYNGridEnv(conf, obs_conf) for conf in run_confs]
+
+        obs, _ = vector_env.reset(seed=3)
+        seeds = get_env_seed_sequences(3, NUM_ENVS)
+        expected = [env.reset(seed=seeds[i])[0] for i, env in enumerate(envs)]
+        np.testing.assert_array_equal(obs, np.stack(expected))
+
+        for _ in range(50):
+            obs, _, terminations, _, _ = vector_env.step(np.ones(NUM_ENVS, np.int64))
+            for i, env in enumerate(envs):
+                expected[i], _, terminated, _, _ = env.step(1)
+                if terminated:
+                    expected[i], _ = env.reset()
+
+            np.testing.assert_array_equal(obs, np.stack(expected))
+
+    def test_rejects_worlds_that_dont_fit(self):
+        run_conf, obs_conf = self._make_confs("vector_hard")
+        large = update_conf(run_conf, {"grid_world_conf": {"grid_rows": 9}})
+
+        with pytest.raises(ValueError):
+            SYNGridVectorEnv(2, [run_conf, large], obs_conf)
+        with pytest.raises(ValueError):
+            SYNGridVectorEnv(NUM_ENVS, [run_conf], obs_conf)
+
+    def test_action_masks_match_single_envs(self):
+        run_conf, obs_conf = self._make_confs("vector_hard")
+        vector_env = SYNGridVectorEnv(NUM_ENVS, run_conf, obs_conf)
+        rng = np.random.default_rng(2)
+
+        _, infos = vector_env.reset(seed=0)
+        for _ in range(30):
+            expected = np.stack([env.action_masks() for env in vector_env.envs])
+            np.testing.assert_array_equal(vector_env.action_masks(), expected)
+            np.testing.assert_array_equal(infos["action_mask"], expected)
+
+            _, _, _, _, infos = vector_env.step(rng.integers(4, size=NUM_ENVS))
@@ -0,0 +1,103 @@
+from syn_grid.gymnasium.environment import SYNGridEnv
+from syn_grid.gymnasium.wrappers import FrameStack
+from syn_grid.runners.agent_runners.utils.replay_buffers import FrameStackReplayBuffer
+
+from tests.utils.config_helpers import get_test_config
+
+from collections import deque
+import numpy as np
+import pytest
+
+N_STACK = 3
+
+
+class TestFrameStack:
+    """
+    Tests for the ring buffer frame stack and its matching replay buffer.
+
+    Verifies:
+    - Stacked observations match a naive deque based stack, including reset padding
+    - The stacked observation is a view into the ring buffer
+    - The replay buffer rebuilds the exact stacked observations it was given
+    """
+
+    # ================= #
+    #       Init        #
+    # ================= #
+
+    @pytest.fixture
+    def env(self) -> FrameStack:
+        conf = get_test_config()
+        return FrameStack(SYNGridEnv(conf.world, conf.obs), N_STACK)
+
+    # ================= #
+    #       Tests       #
+    # ================= #
+
+    def test_matches_naive_stack(self, env: FrameStack):
+        conf = get_test_config()
+        raw_env = SYNGridEnv(conf.world, conf.obs)
+        rng = np.random.default_rng(0)
+
+        obs, _ = env.reset(seed=1)
+        frame, _ = raw_env.reset(seed=1)
+        frames = deque([frame.copy()] * N_STACK, maxlen=N_STACK)
+
+        for _ in range(60):
+            np.testing.assert_array_equal(obs, np.concatenate(frames))
+
+            action = int(rng.integers(4))
+            obs, _, terminated, truncated, _ = env.step(action)
+            frame, *_ = raw_env.step(action)
+            frames.append(frame.copy())
+
+            if terminated or truncated:
+                obs, _ = env.reset()
+                frame, _ = raw_env.reset()
+                frames = deque([frame.copy()] * N_STACK, maxlen=N_STACK)
+
+    def test_observation_is_view(self, env: FrameStack):
+        obs, _ = env.reset(seed=1)
+
+        assert env.observation_space.contains(obs)
+        assert np.shares_memory(obs, env._ring)
+
+    def test_replay_buffer_rebuilds_stacks(self, env: FrameStack):
+        buffer = FrameStackReplayBuffer(
+            8, env.observation_space, env.action_space, device="cpu", n_stack=N_STACK
+        )
+        rng = np.random.default_rng(2)
+        seen_obs, seen_next_obs = [], []
+
+        obs, _ = env.reset(seed=4)
+        for _ in range(20):
+            obs = obs.copy()
+            next_obs, reward, terminated, truncated, _ = env.step(int(rng.integers(4)))
+            done = terminated or truncated
+            next_obs = next_obs.copy()
+
+            buffer.add(
+                obs[None],
+                next_obs[None],
+                np.array([0]),
+                np.array([reward]),
+                np.array([done]),
+                [{}],
+            )
+            seen_obs.append(obs)
+            seen_next_obs.append(next_obs)
+
+            obs = env.reset()[0] if done else next_obs
+
+        # The buffer wrapped around: its valid positions hold the newest transitions
+        valid = [(buffer.pos + i) % 8 for i in range(N_STACK - 1, 8)]
+        samples = buffer._get_samples(np.array(valid))
+        expected = [20 - 8 + i for i in range(N_STACK - 1, 8)]
+
+        np.testing.assert_array_equal(
+            samples.observations.numpy(), np.stack([seen_obs[i] for i in expected])
+        )
+        np.testing.assert_array_equal(
+            samples.next_observations.numpy(),
+            np.stack([seen_next_obs[i] for i in expected]),
+        )
@@ -0,0 +1,105 @@
+from syn_grid.gymnasium.environment import SYNGridEnv
+from syn_grid.gymnasium.wrappers import OrbOptions
+
+from tests.utils.config_helpers import get_test_config, update_conf
+
+import numpy as np
+import pytest
+
+
+class TestOrbOptions:
+    """
+    Tests for the target-orb options layer.
+
+    Verifies:
+    - Picking an orb walks the shortest path to it and consumes it
+    - Actions refer to the orb slots of the observation
+    - Rewards are discounted per primitive step and waiting keeps the droid in place
+    """
+
+    # ================= #
+    #       Init        #
+    # ================= #
+
+    def _make_env(self, gamma: float = 0.99) -> OrbOptions:
+        conf = get_test_config()
+        # No tier de-spawning, so a targeted orb is always still there on arrival
+        run_conf = update_conf(
+            conf.world, {"orb_factory_conf": {"de_spawn_tiers": False}}
+        )
+        return OrbOptions(SYNGridEnv(run_conf, conf.obs), gamma=gamma)
+
+    # ================= #
+    #       Tests       #
+    # ================= #
+
+    def test_option_reaches_the_orb(self):
+        env = self._make_env()
+        env.reset(seed=0)
+        world = env.unwrapped.world  # type: ignore[attr-defined]
+        orb = world.get_active_orbs()[0]
+        distance = world.LAYOUT.get_distance(world.DROID.position, orb.position)
+
+        obs, _, terminated, _, info = env.step(0)
+
+        assert info["option_steps"] == distance
+        assert world.DROID.position == orb.position
+        assert env.observation_space.contains(obs)
+        assert not terminated
+
+    def test_actions_follow_the_observed_slots(self):
+        """
+        With the default "vector_hard" perception, action `i` targets the orb whose position the
+        observation shows in slot `i`, not the i-th active orb.
+        """
+
+        env = self._make_env()
+        env.reset(seed=3)
+        base_env = env.unwrapped
+        world = base_env.world  # type: ignore[attr-defined]
+        rng = np.random.default_rng(0)
+
+        # Step until orbs have come and gone, so the slots no longer follow the active orbs
+        while True:
+            obs, *_ = base_env.step(int(rng.integers(4)))
+            slots = base_env.get_orb_slots()  # type: ignore[attr-defined]
+            if [orb for orb in slots if orb] != world.get_active_orbs():
+                break
+        slot = 0
+        assert slots[slot] is not world.get_active_orbs()[slot]
+
+        # The droid's position comes first, then position, category, type and tier per slot
+        target = [int(value) for value in obs[2 + 5 * slot : 4 + 5 * slot]]
+        assert target == slots[slot].position
+
+        env.step(slot)
+
+        assert world.DROID.position == target
+
+    def test_rejects_perceptions_without_orb_slots(self):
+        conf = get_test_config()
+        obs_conf = update_conf(
+            conf.obs, {"observation_handler": {"perception": "composite_easy"}}
+        )
+
+        with pytest.raises(ValueError):
+            OrbOptions(SYNGridEnv(conf.world, obs_conf))
+
+    def test_wait_is_discounted_and_returns(self):
+        gamma = 0.5
+        env = self._make_env(gamma)
+        env.reset(seed=0)
+        world = env.unwrapped.world  # type: ignore[attr-defined]
+        start = list(world.DROID.position)
+        step_penalty = get_test_config().world.droid_conf.step_penalty
+
+        _, reward, _, _, info = env.step(env.action_space.n - 1)
+
+        assert info["option_steps"] == 2
+        assert world.DROID.position == start
+        assert reward == pytest.approx(step_penalty * (1 + gamma))
+
+    def test_rejects_wrapped_envs(self):
+        conf = get_test_config()
+        with pytest.raises(TypeError):
+            OrbOptions(OrbOptions(SYNGridEnv(conf.world, conf.obs)))
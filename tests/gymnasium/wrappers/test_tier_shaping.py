@@ -0,0 +1,121 @@
+from syn_grid.gymnasium.environment import SYNGridEnv
+from syn_grid.gymnasium.vector_env import SYNGridVectorEnv
+from syn_grid.gymnasium.wrappers import (
+    TierShaping,
+    TierShapingVector,
+    get_tier_potentials,
+)
+from syn_grid.core.orbs.synergy.tier_orb import TierOrb
+from syn_grid.utils.seeding import get_env_seed_sequences
+
+from tests.utils.config_helpers import get_test_config, update_conf
+
+import numpy as np
+import pytest
+
+GAMMA = 0.9
+
+
+class TestTierShaping:
+    """
+    Tests for the potential-based tier shaping wrappers.
+
+    Verifies:
+    - The potential follows the distance to the nearest orb that continues the chain
+    - The single env and the batched wrapper add the same shaping terms
+    - Truncated episodes keep the potential of their final state
+    """
+
+    def test_potential_targets_next_tier(self):
+        conf = get_test_config()
+        env = SYNGridEnv(conf.world, conf.obs)
+        env.reset(seed=0)
+        world = env.world
+
+        for _ in range(50):
+            next_tier = world.DROID.DIGESTION_ENGINE.chained_tiers + 1
+            distances = [
+                abs(world.DROID.position[0] - orb.position[0])
+                + abs(world.DROID.position[1] - orb.position[1])
+                for orb in world.get_active_orbs()
+                if isinstance(orb, TierOrb) and orb.META.TIER == next_tier
+            ]
+            expected = -min(distances) / 8 if distances else -1.0
+
+            assert get_tier_potentials([world])[0] == expected
+
+            _, _, terminated, _, _ = env.step(env.action_space.sample())
+            if terminated:
+                env.reset()
+
+    def test_vector_wrapper_matches_single_envs(self):
+        conf = get_test_config()
+        num_envs = 3
+        vector_env = TierShapingVector(
+            SYNGridVectorEnv(num_envs, conf.world, conf.obs), gamma=GAMMA
+        )
+        envs = [
+            TierShaping(SYNGridEnv(conf.world, conf.obs), gamma=GAMMA)
+            for _ in range(num_envs)
+        ]
+        rng = np.random.default_rng(0)
+
+        vector_env.reset(seed=[7 + i for i in range(num_envs)])
+        for i, env in enumerate(envs):
+            env.reset(seed=7 + i)
+
+        for _ in range(150):
+            actions = rng.integers(4, size=num_envs)
+            _, rewards, terminations, _, _ = vector_env.step(actions)
+
+            for i, env in enumerate(envs):
+                _, reward, terminated, _, _ = env.step(int(actions[i]))
+                assert np.isclose(rewards[i], reward)
+                assert terminations[i] == terminated
+                if terminated:
+                    env.reset()
+
+    def test_truncation_keeps_final_potential(self):
+        """
+        A truncated episode isn't over for the agent, its last step is shaped toward the potential
+        of the final state instead of 0, in the single env and the batched wrapper alike.
+        """
+
+        conf = get_test_config()
+        run_conf = update_conf(conf.world, {"droid_conf": {"starting_score": 99999}})
+        obs_conf = update_conf(
+            conf.obs,
+            {"observation_handler": {"max_steps": 3, "truncate_at_max_steps": True}},
+        )
+        num_envs = 2
+        vector_env = TierShapingVector(
+            SYNGridVectorEnv(num_envs, run_conf, obs_conf), gamma=GAMMA
+        )
+        envs = [
+            TierShaping(SYNGridEnv(run_conf, obs_conf), gamma=GAMMA)
+            for _ in range(num_envs)
+        ]
+        plain_envs = [SYNGridEnv(run_conf, obs_conf) for _ in range(num_envs)]
+
+        vector_env.reset(seed=get_env_seed_sequences(3, num_envs))
+        for env, seed in zip(
+            envs + plain_envs, get_env_seed_sequences(3, num_envs) * 2
+        ):
+            env.reset(seed=seed)
+
+        for _ in range(3):
+            _, rewards, terminations, truncations, _ = vector_env.step(
+                np.zeros(num_envs, np.int64)
+            )
+
+            for i, (env, plain_env) in enumerate(zip(envs, plain_envs)):
+                previous = get_tier_potentials([plain_env.world])[0]
+                _, reward, _, truncated, _ = env.step(0)
+                _, plain_reward, *_ = plain_env.step(0)
+                final = get_tier_potentials([plain_env.world])[0]
+
+                assert reward == pytest.approx(plain_reward + GAMMA * final - previous)
+                assert rewards[i] == pytest.approx(reward)
+                assert truncated == truncations[i]
+
+        assert truncations.all() and not terminations.any()
@@ -1,10 +1,11 @@
 from syn_grid.runners.agent_runners.base_agent_runner import BaseAgentRunner
 from syn_grid.runners.agent_runners.agent_registry import ALGORITHMS
+from syn_grid.gymnasium.env_factory import make
 
 from tests.utils.config_helpers import get_test_config, update_conf
 
 from stable_baselines3 import A2C
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 import pytest
 
 
@@ -95,3 +96,44 @@ class TestAgentRunner:
             agent_runner._get_model_path()
 
 
+
+    @pytest.mark.parametrize("alg, n_stack", [("PPO", 1), ("DQN", 4)])
+    def test_eval_runs_on_the_runners_env(self, alg: str, n_stack: int):
+        """
+        Tests the shared evaluation loop of the SB3 runners.
+
+        Verifies that the loop feeds the model observations of the runner's own env, e.g. the stacked
+        frames of the frame stacking DQN, and closes the env afterwards.
+        """
+
+        full_conf = get_test_config()
+        full_conf = update_conf(
+            full_conf, {
+                'agent': {
+                    'global_agent_conf': {
+                        "alg": alg
+                    },
+                    'eval_agent_conf': {
+                        "num_eval_episodes": 2
+                    }
+                }
+            }
+        )
+        runner = ALGORITHMS[alg](full_conf.agent, full_conf.obs, full_conf.world)
+
+        model = MagicMock()
+        model.predict.return_value = (0, None)
+        with (
+            patch(
+                "syn_grid.runners.agent_runners.base_agent_runner.make",
+                side_effect=lambda render_mode, run_conf, obs_conf: make(None, run_conf, obs_conf),
+            ),
+            patch.object(runner, "_load_model", return_value=model),
+            patch("gymnasium.Wrapper.close") as close,
+        ):
+            runner.eval()
+
+        obs_sizes = {len(call.args[0]) for call in model.predict.call_args_list}
+        single_env = make(None, full_conf.world, full_conf.obs)
+        assert obs_sizes == {n_stack * single_env.observation_space.shape[0]}
+        assert close.called
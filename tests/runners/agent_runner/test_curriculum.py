@@ -0,0 +1,88 @@
+from syn_grid.config.models import CurriculumConf, CurriculumStageConf
+from syn_grid.config.overrides import apply_stage_to_obs, apply_stage_to_world
+from syn_grid.gymnasium.environment import SYNGridEnv
+from syn_grid.runners.agent_runners.utils.callbacks import CurriculumCallback
+
+from tests.utils.config_helpers import get_test_config
+
+from unittest.mock import MagicMock
+import pytest
+import numpy as np
+from pydantic import ValidationError
+from stable_baselines3.common.vec_env import DummyVecEnv
+
+
+class TestCurriculum:
+    """
+    Tests the curriculum stage overrides and the plateau-driven `CurriculumCallback`.
+    """
+
+    @pytest.fixture
+    def stages(self):
+        return [
+            CurriculumStageConf(
+                grid_rows=3, grid_cols=3, max_tier=2, step_wise_scoring=True
+            ),
+            CurriculumStageConf(
+                grid_rows=5, grid_cols=5, max_tier=3, step_wise_scoring=False
+            ),
+        ]
+
+    def test_stage_is_applied_to_every_block(self, stages):
+        """
+        A stage changes the grid size and max tier everywhere they are repeated.
+        """
+
+        full_conf = get_test_config()
+        run_conf = apply_stage_to_world(full_conf.world, stages[0])
+        obs_conf = apply_stage_to_obs(full_conf.obs, stages[1])
+
+        for block in (
+            run_conf.grid_world_conf,
+            run_conf.renderer_conf,
+            run_conf.droid_conf,
+            run_conf.orb_factory_conf,
+        ):
+            assert (block.grid_rows, block.grid_cols) == (3, 3)
+        assert run_conf.orb_factory_conf.max_tier == 2
+        assert run_conf.tier_orb_conf.step_wise_scoring is True
+        assert obs_conf.perception.max_tier == 3
+        assert full_conf.world.grid_world_conf.grid_rows == 5
+
+    def test_enabled_curriculum_needs_stages(self):
+        """
+        Enabling the curriculum without stages is rejected.
+        """
+
+        with pytest.raises(ValidationError):
+            CurriculumConf(enabled=True)
+
+    def test_plateau_advances_stage(self, stages):
+        """
+        A return that never improves advances the training envs to the next stage, which they
+        apply at their next reset.
+        """
+
+        full_conf = get_test_config()
+        obs_conf = apply_stage_to_obs(full_conf.obs, stages[-1])
+        run_conf = apply_stage_to_world(full_conf.world, stages[0])
+        conf = CurriculumConf(
+            enabled=True, window=1, patience=1, min_delta=1e6, stages=stages
+        )
+
+        env = DummyVecEnv([lambda: SYNGridEnv(run_conf, obs_conf)])
+        callback = CurriculumCallback(conf, full_conf.world)
+        # Training a model isn't needed to drive the callback, only its env and logger are used
+        callback.init_callback(MagicMock(get_env=lambda: env))
+        env.reset()
+
+        # Two finished episodes with the same return: the second one shows no progress
+        for _ in range(2):
+            callback.update_locals({"rewards": np.ones(1), "dones": np.ones(1, bool)})
+            callback.on_step()
+        env.step(np.zeros(1, np.int64))
+        env.reset()
+
+        assert callback.stage == 1
+        world = env.envs[0].unwrapped.world  # type: ignore[attr-defined]
+        assert world._CONF.grid_rows == 5
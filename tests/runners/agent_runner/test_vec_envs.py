@@ -0,0 +1,211 @@
+from syn_grid.config.models import TrainAgentConf
+from syn_grid.gymnasium.environment import EPISODE_INFO_KEYWORDS
+from syn_grid.gymnasium.vector_env import SYNGridVectorEnv
+from syn_grid.runners.agent_runners.sb3.stateless_ppo import StatelessPPO
+from syn_grid.runners.agent_runners.utils.vec_envs import SB3VecEnvAdapter
+
+from tests.utils.config_helpers import get_test_config, update_conf
+
+import numpy as np
+import pytest
+from pathlib import Path
+from pydantic import ValidationError
+from gymnasium.vector import AutoresetMode
+from stable_baselines3.common.vec_env import VecMonitor
+
+NUM_ENVS = 3
+
+
+class TestSB3VecEnvAdapter:
+    """
+    Tests the SB3 view on Gymnasium vector envs and the vec backend training settings.
+
+    Verifies:
+    - Resets and steps follow SB3's batched VecEnv contract
+    - Finished episodes report SB3's terminal observation and time limit flags per env
+    - Sub-env methods and attributes are reachable through `env_method()` and `get_attr()`
+    - Every vec backend builds working environments, including worker processes
+    - The native backend is rejected for perceptions with dict observations
+    """
+
+    # ================= #
+    #       Init        #
+    # ================= #
+
+    def _make_adapter(self, max_steps: int = 50) -> SB3VecEnvAdapter:
+        conf = get_test_config()
+        run_conf = update_conf(conf.world, {"droid_conf": {"starting_score": 99999}})
+        obs_conf = update_conf(
+            conf.obs,
+            {
+                "observation_handler": {
+                    "perception": "vector_medium",
+                    "max_steps": max_steps,
+                    "truncate_at_max_steps": True,
+                }
+            },
+        )
+
+        return SB3VecEnvAdapter(SYNGridVectorEnv(NUM_ENVS, run_conf, obs_conf))
+
+    def _make_train_conf(self, **updates) -> TrainAgentConf:
+        return TrainAgentConf(
+            **{
+                "continue_training": False,
+                "enable_output": False,
+                "render_mode": None,
+                "timesteps": 1,
+                "iterations": 1,
+                **updates,
+            }
+        )
+
+    # ================= #
+    #       Tests       #
+    # ================= #
+
+    def test_reset_returns_batched_obs(self):
+        venv = self._make_adapter()
+        venv.seed(4)
+
+        obs = venv.reset()
+
+        assert obs.shape == (NUM_ENVS, *venv.observation_space.shape)
+        assert all(seed is None for seed in venv._seeds)
+
+    def test_truncated_episode_reports_terminal_observation(self):
+        """
+        The step that hits the time limit is done, carries the finished episode's last
+        observation and is flagged as truncated rather than terminated.
+        """
+
+        venv = self._make_adapter(max_steps=3)
+        venv.reset()
+
+        for _ in range(3):
+            _, rewards, dones, infos = venv.step(np.zeros(NUM_ENVS, np.int64))
+
+        assert dones.all() and rewards.dtype == np.float32
+        for info in infos:
+            assert info["TimeLimit.truncated"] is True
+            assert venv.observation_space.contains(info["terminal_observation"])
+            assert info["episode"]["l"] == 3
+            assert "final_obs" not in info and "_episode" not in info
+
+    def test_monitor_keeps_episode_statistics(self, tmp_path: Path):
+        """
+        SB3's VecMonitor replaces `info["episode"]`, the env's own statistics still reach its
+        episode info and csv through their info keys.
+        """
+
+        venv = VecMonitor(
+            self._make_adapter(max_steps=3),
+            filename=str(tmp_path / "run"),
+            info_keywords=EPISODE_INFO_KEYWORDS,
+        )
+        venv.reset()
+
+        for _ in range(3):
+            _, _, _, infos = venv.step(np.zeros(NUM_ENVS, np.int64))
+        venv.close()
+
+        assert set(EPISODE_INFO_KEYWORDS) <= infos[0]["episode"].keys()
+        header = (tmp_path / "run.monitor.csv").read_text().splitlines()[1]
+        assert header.split(",") == ["r", "l", "t", *EPISODE_INFO_KEYWORDS]
+
+    def test_running_episodes_have_no_final_info(self):
+        venv = self._make_adapter()
+        venv.reset()
+
+        _, _, dones, infos = venv.step(np.zeros(NUM_ENVS, np.int64))
+
+        assert not dones.any()
+        assert all("terminal_observation" not in info for info in infos)
+        assert all(info["action_mask"].shape == (4,) for info in infos)
+
+    def test_env_method_reaches_sub_envs(self):
+        venv = self._make_adapter()
+        venv.reset()
+
+        masks = venv.env_method("action_masks")
+        steps_left = venv.get_attr("steps_left", indices=[0, 2])
+
+        assert len(masks) == NUM_ENVS
+        np.testing.assert_array_equal(np.stack(masks), venv.venv.action_masks())
+        assert steps_left == [50, 50]
+        assert venv.env_is_wrapped(object) == [False] * NUM_ENVS
+
+    def test_needs_same_step_autoreset(self):
+        venv = self._make_adapter().venv
+        venv.metadata = {"autoreset_mode": AutoresetMode.NEXT_STEP}
+
+        with pytest.raises(ValueError):
+            SB3VecEnvAdapter(venv)
+
+    @pytest.mark.parametrize(
+        "updates",
+        [
+            {"vec_backend": "threads"},
+            {"n_envs": 0},
+            {"render_mode": "human", "n_envs": 4},
+            {"render_mode": "human", "vec_backend": "subprocess"},
+        ],
+    )
+    def test_invalid_vec_settings_are_rejected(self, updates):
+        with pytest.raises(ValidationError):
+            self._make_train_conf(**updates)
+
+    @pytest.mark.parametrize(
+        "backend", ["dummy", "subprocess", "shared_memory", "native"]
+    )
+    def test_runner_builds_every_backend(self, backend: str):
+        """
+        The runner builds its training environments on each backend, the subprocess and shared
+        memory workers create their envs without the entry point's registration.
+        """
+
+        conf = get_test_config()
+        agent_conf = update_conf(
+            conf.agent,
+            {
+                "global_agent_conf": {"training": True, "check_env": False},
+                "train_agent_conf": {
+                    "enable_output": False,
+                    "render_mode": None,
+                    "n_envs": 2,
+                    "vec_backend": backend,
+                },
+            },
+        )
+        venv = StatelessPPO(agent_conf, conf.obs, conf.world)._make_vec_env(None)
+
+        try:
+            obs = venv.reset()
+            _, rewards, dones, _ = venv.step(np.zeros(2, np.int64))
+        finally:
+            venv.close()
+
+        assert obs.shape == (2, *venv.observation_space.shape)
+        assert rewards.shape == dones.shape == (2,)
+
+    @pytest.mark.parametrize(
+        "obs_updates",
+        [
+            {"observation_handler": {"perception": "entity"}},
+            {"observation_handler": {"perception": "egocentric"}},
+            {"observation_handler": {"perception": "composite_easy"}},
+        ],
+    )
+    def test_native_backend_rejects_dict_observations(self, obs_updates):
+        updates = {
+            "obs": obs_updates,
+            "agent": {"train_agent_conf": {"vec_backend": "native"}},
+        }
+
+        with pytest.raises(ValidationError):
+            update_conf(get_test_config(), updates)
+
+        # Flattened composite and egocentric observations are a single Box
+        if obs_updates["observation_handler"]["perception"] != "entity":
+            updates["obs"] = {**obs_updates, "perception": {"flatten": True}}
+            update_conf(get_test_config(), updates)
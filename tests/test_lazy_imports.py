@@ -0,0 +1,42 @@
+import subprocess
+import sys
+
+HEAVY_MODULES = ("pygame", "torch", "stable_baselines3", "sb3_contrib", "matplotlib")
+
+
+class TestLazyImports:
+    """
+    Import-time regression test: the CLI entry point, argument parsing and headless environments
+    must not load pygame, torch, SB3 or matplotlib before rendering, learning or plotting is used.
+
+    Runs in a fresh interpreter since the test session itself has already imported everything.
+    """
+
+    def _loaded_heavy_modules(self, code: str) -> list[str]:
+        check = f"import sys; print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+        result = subprocess.run(
+            [sys.executable, "-W", "ignore", "-c", f"{code}; {check}"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        return [m for m in result.stdout.strip().split(",") if m]
+
+    def test_cli_imports_stay_light(self):
+        loaded = self._loaded_heavy_modules(
+            "import syn_grid.__main__, syn_grid.utils.args_utils; "
+            "from syn_grid.runners.agent_runners.agent_registry import ALGORITHMS; "
+            "len(ALGORITHMS)"
+        )
+
+        assert loaded == []
+
+    def test_headless_env_does_not_load_pygame(self):
+        loaded = self._loaded_heavy_modules(
+            "from tests.utils.config_helpers import get_test_config; "
+            "from syn_grid.gymnasium.environment import SYNGridEnv; "
+            "conf = get_test_config(); SYNGridEnv(conf.world, conf.obs).reset(seed=0)"
+        )
+
+        assert loaded == []
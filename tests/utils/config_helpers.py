@@ -18,15 +18,14 @@ def update_conf(conf: T, updates: dict[str, Any]) -> T:
     """
     Return a new immutable BaseModel of type T with updates applied.
     Nested updates should be dicts matching the nested structure.
+    The updated models are validated again, so invalid test configs are rejected.
     """
 
-    new_conf = conf
+    fields = dict(conf)
     for key, value in updates.items():
-        sub_conf = getattr(new_conf, key)
+        sub_conf = getattr(conf, key)
         if isinstance(sub_conf, BaseModel) and isinstance(value, dict):
             # recursively update nested BaseModel
-            sub_conf = update_conf(sub_conf, value)
-        else:
-            sub_conf = value
-        new_conf = new_conf.model_copy(update={key: sub_conf})
-    return new_conf
+            value = update_conf(sub_conf, value)
+        fields[key] = value
+    return type(conf).model_validate(fields)
@@ -0,0 +1,63 @@
+from syn_grid.gymnasium.vector_env import SYNGridVectorEnv
+from syn_grid.utils.seeding import (
+    get_child_sequence,
+    get_env_seed_sequences,
+    get_spawn_rngs,
+)
+
+from tests.utils.config_helpers import get_test_config
+
+import numpy as np
+from numpy.random import SeedSequence, default_rng
+
+
+class TestSeeding:
+    """
+    Tests for the seed sequence streams of environments and their subsystems.
+    """
+
+    def test_child_matches_spawn(self):
+        root = SeedSequence(11)
+        spawned = SeedSequence(11).spawn(3)[2]
+
+        assert get_child_sequence(root, 2).generate_state(4).tolist() == (
+            spawned.generate_state(4).tolist()
+        )
+
+    def test_spawn_streams_are_independent(self):
+        orb_rng, cell_rng = get_spawn_rngs(default_rng(5))
+
+        assert orb_rng.integers(1 << 30) != cell_rng.integers(1 << 30)
+
+    def test_results_do_not_depend_on_worker_layout(self):
+        """
+        One vector env of 4 and two "workers" of 2 envs each see the same episodes.
+        """
+
+        conf = get_test_config()
+        rng = np.random.default_rng(0)
+
+        single = SYNGridVectorEnv(4, conf.world, conf.obs)
+        workers = [SYNGridVectorEnv(2, conf.world, conf.obs) for _ in range(2)]
+
+        obs, _ = single.reset(seed=21)
+        split = [
+            worker.reset(seed=get_env_seed_sequences(21, 2, start=2 * index))[0]
+            for index, worker in enumerate(workers)
+        ]
+        np.testing.assert_array_equal(obs, np.concatenate(split))
+
+        for _ in range(150):
+            actions = rng.integers(4, size=4)
+            obs, rewards, _, _, _ = single.step(actions)
+            split_steps = [
+                worker.step(actions[2 * index : 2 * index + 2])
+                for index, worker in enumerate(workers)
+            ]
+
+            np.testing.assert_array_equal(
+                obs, np.concatenate([step[0] for step in split_steps])
+            )
+            np.testing.assert_array_equal(
+                rewards, np.concatenate([step[1] for step in split_steps])
+            )